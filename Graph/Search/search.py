@@ -19,7 +19,7 @@ def bfs(
         return
 
     # Initialize the queue and visited set
-    queue = Deque([start])
+    queue = Deque([start], engine="blocks")
     visited = set()
 
     # Mark the starting node as visited
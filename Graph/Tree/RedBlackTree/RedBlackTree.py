@@ -186,6 +186,18 @@ class RedBlackTree(Generic[T]):
 
         self.root.color = False
 
+    def find(self, key: T) -> Optional[T]:
+        """
+        Find the stored key equal to the given key.
+
+        :param key: The key to search for.
+        :return: The stored key, or None if it is not in the tree.
+        """
+        node = self._find_node(self.root, key)
+        if node == self.NIL_LEAF:
+            return None
+        return node.key
+
     def delete(self, key: T):
         """
         Delete a node with the given key from the Red-Black tree.
@@ -58,6 +58,15 @@ class TestRedBlackTree(unittest.TestCase):
         self.assertIsNotNone(self.rb_tree.root.left)
         self.assertIsNotNone(self.rb_tree.root.right)
 
+    def test_find(self):
+        """Test finding stored keys in the Red-Black tree."""
+        elements = [10, 20, 30, 15, 25, 5]
+        for element in elements:
+            self.rb_tree.insert(element)
+
+        self.assertEqual(self.rb_tree.find(25), 25)
+        self.assertIsNone(self.rb_tree.find(12))
+
     def test_delete(self):
         """Test deletion of elements from the Red-Black tree."""
         elements = [10, 20, 30, 15, 25, 5]
@@ -0,0 +1,343 @@
+import struct
+from hashlib import blake2b
+from typing import TypeVar, Optional, Iterator, Tuple, MutableMapping
+
+from HashMap.Codec import Codec
+
+K = TypeVar('K')
+V = TypeVar('V')
+
+"""
+Why a common base for buffer-backed HashMaps?
+
+HashMaps that live outside the Python heap, in a memory-mapped file (MappedHashMap) or a shared memory segment
+(SharedHashMap), lay out their entries the same way in a flat buffer:
+
+- A header region of _TABLE_OFFSET bytes, whose format belongs to the subclass.
+- A table of fixed-size slots, each starting with a 64-bit hash of the encoded key and the offset of its record in the
+  heap. Subclasses may widen the slots to keep fields of their own after these two. Collisions are resolved by linear
+  probing, and removed keys leave a tombstone.
+- A heap of variable-length records, each holding the encoded key and value. Records are only ever appended, so an
+  update writes a new record and points the slot at it. The space of replaced and removed records is reclaimed when the
+  table is rebuilt, by growing or by compact().
+
+Keys are hashed with BLAKE2b rather than hash(), whose results for str and bytes differ between processes.
+"""
+
+_TABLE_OFFSET = 128
+_SLOT = struct.Struct("<QQ")  # key hash, record offset
+_RECORD = struct.Struct("<II")  # key length, value length
+
+_EMPTY = 0  # Record offsets always point past the table, so 0 and 1 can mark empty and removed slots
+_TOMBSTONE = 1
+
+
+class BufferHashMap(MutableMapping[K, V]):
+    """
+    A HashMap whose slot table and record heap live in a flat buffer.
+
+    Subclasses own the buffer and its header, and implement _begin_write, _grow_heap and _rebuild.
+    """
+    _slot_size = _SLOT.size  # Bytes per slot, of which the first _SLOT.size hold the key hash and record offset
+    _buffer: memoryview
+    key_codec: Codec[K]
+    value_codec: Codec[V]
+    readonly: bool
+    max_load_factor: float
+    capacity: int
+    size: int
+    _tombstones: int
+    _heap_end: int
+
+    @staticmethod
+    def _round_capacity(capacity: int) -> int:
+        """
+        Round a capacity up to the next power of two so that slot indices can be computed with a mask.
+
+        :param capacity: The requested capacity.
+        :return: The smallest power of two greater than or equal to the capacity (at least 8).
+        """
+        rounded = 8
+        while rounded < capacity:
+            rounded *= 2
+        return rounded
+
+    @staticmethod
+    def _hash(data: bytes) -> int:
+        """
+        Hash an encoded key with a hash that is stable across processes.
+
+        :param data: The encoded key.
+        :return: The 64-bit hash code.
+        """
+        return int.from_bytes(blake2b(data, digest_size=8).digest(), "little")
+
+    @classmethod
+    def _table_end(cls, capacity: int) -> int:
+        """
+        Get the offset where the heap of a table with the given capacity starts.
+
+        :param capacity: The number of slots.
+        :return: The offset of the first record.
+        """
+        return _TABLE_OFFSET + capacity * cls._slot_size
+
+    def _begin_write(self, index: int) -> None:
+        """
+        Prepare the buffer for a change to a slot, before the slot or the heap is written.
+
+        :param index: The index of the slot about to be written.
+        """
+        raise NotImplementedError
+
+    def _grow_heap(self, needed: int) -> None:
+        """
+        Make room for at least needed more bytes of records. The table may be rebuilt, which moves every entry.
+
+        :param needed: The number of bytes to make room for.
+        """
+        raise NotImplementedError
+
+    def _rebuild(self, new_capacity: int) -> None:
+        """
+        Rebuild the map into a fresh buffer with the given capacity, dropping tombstones and unreachable records.
+
+        :param new_capacity: The number of slots, which must be a power of two.
+        """
+        raise NotImplementedError
+
+    def _check_writable(self) -> None:
+        """
+        :raises TypeError: If the map is read-only.
+        """
+        if self.readonly:
+            raise TypeError(f"{type(self).__name__} is read-only")
+
+    def _find_slot(self, key_bytes: bytes, key_hash: int) -> Tuple[int, int]:
+        """
+        Find the slot holding an encoded key.
+
+        :param key_bytes: The encoded key.
+        :param key_hash: The hash of the encoded key.
+        :return: The slot index of the key (or -1 if it is not in the map), and the first free slot of its probe
+            sequence.
+        """
+        buffer = self._buffer
+        heap_end = self._heap_end
+        mask = self.capacity - 1
+        index = key_hash & mask
+        free = -1
+
+        while True:
+            slot_hash, offset = _SLOT.unpack_from(buffer, _TABLE_OFFSET + index * self._slot_size)
+            if offset == _EMPTY:
+                return -1, index if free == -1 else free
+
+            if offset == _TOMBSTONE or offset >= heap_end:
+                if free == -1:
+                    free = index
+            elif slot_hash == key_hash:
+                key_length = _RECORD.unpack_from(buffer, offset)[0]
+                start = offset + _RECORD.size
+                if buffer[start:start + key_length] == key_bytes:
+                    return index, free
+
+            index = (index + 1) & mask
+
+    def _slot_offset(self, index: int) -> int:
+        """
+        Get the record offset stored in a slot.
+
+        :param index: The slot index.
+        :return: The record offset, or _EMPTY or _TOMBSTONE.
+        """
+        return _SLOT.unpack_from(self._buffer, _TABLE_OFFSET + index * self._slot_size)[1]
+
+    def _read_value(self, offset: int) -> V:
+        """
+        Decode the value of the record at an offset.
+
+        :param offset: The offset of the record.
+        :return: The decoded value.
+        """
+        key_length, value_length = _RECORD.unpack_from(self._buffer, offset)
+        start = offset + _RECORD.size + key_length
+        return self.value_codec.decode(self._buffer[start:start + value_length])
+
+    def _iter_records(self) -> Iterator[Tuple[int, int]]:
+        """
+        Iterate over the live slots.
+
+        :return: An iterator over (key hash, record offset) pairs.
+        """
+        buffer = self._buffer
+        heap_end = self._heap_end
+        for position in range(_TABLE_OFFSET, self._table_end(self.capacity), self._slot_size):
+            key_hash, offset = _SLOT.unpack_from(buffer, position)
+            if _TOMBSTONE < offset < heap_end:
+                yield key_hash, offset
+
+    def _copy_records(self, buffer: memoryview, capacity: int) -> int:
+        """
+        Copy every live record into the empty slot table of another buffer, packing the records together.
+
+        The target buffer must hold at least _table_end(capacity) plus the heap bytes in use by this map.
+
+        :param buffer: The target buffer.
+        :param capacity: The number of slots of the target table, which must be a power of two.
+        :return: The end of the copied records in the target buffer.
+        """
+        source = self._buffer
+        mask = capacity - 1
+        heap_end = self._table_end(capacity)
+
+        for key_hash, offset in self._iter_records():
+            key_length, value_length = _RECORD.unpack_from(source, offset)
+            length = _RECORD.size + key_length + value_length
+
+            index = key_hash & mask
+            while _SLOT.unpack_from(buffer, _TABLE_OFFSET + index * self._slot_size)[1] != _EMPTY:
+                index = (index + 1) & mask
+
+            buffer[heap_end:heap_end + length] = source[offset:offset + length]
+            _SLOT.pack_into(buffer, _TABLE_OFFSET + index * self._slot_size, key_hash, heap_end)
+            heap_end += length
+
+        return heap_end
+
+    def put(self, key: K, value: V) -> None:
+        """
+        Insert or update a key-value pair.
+
+        :param key: The key to insert.
+        :param value: The value associated with the key.
+        :raises TypeError: If the map is read-only.
+        """
+        self._check_writable()
+        self._put_encoded(self.key_codec.encode(key), self.value_codec.encode(value))
+
+    def _put_encoded(self, key_bytes: bytes, value_bytes: bytes) -> None:
+        """
+        Insert or update an encoded key-value pair.
+
+        :param key_bytes: The encoded key.
+        :param value_bytes: The encoded value.
+        """
+        record = _RECORD.pack(len(key_bytes), len(value_bytes)) + key_bytes + value_bytes
+        key_hash = self._hash(key_bytes)
+        index, free = self._find_slot(key_bytes, key_hash)
+
+        if index == -1:
+            reuses_tombstone = self._slot_offset(free) != _EMPTY
+            if not reuses_tombstone and (self.size + self._tombstones + 1) / self.capacity > self.max_load_factor:
+                self._resize()
+                free = self._find_slot(key_bytes, key_hash)[1]
+                reuses_tombstone = False
+
+            index = free
+            self.size += 1
+            if reuses_tombstone:
+                self._tombstones -= 1
+
+        if self._heap_end + len(record) > len(self._buffer):
+            self._grow_heap(len(record))
+            found, free = self._find_slot(key_bytes, key_hash)
+            index = free if found == -1 else found
+
+        self._begin_write(index)
+        offset = self._heap_end
+        self._buffer[offset:offset + len(record)] = record
+        self._heap_end += len(record)
+        _SLOT.pack_into(self._buffer, _TABLE_OFFSET + index * self._slot_size, key_hash, offset)
+
+    def get(self, key: K, default: Optional[V] = None) -> Optional[V]:
+        """
+        Retrieve the value associated with a key.
+
+        :param key: The key to look up.
+        :param default: The value to return if the key does not exist. Defaults to None.
+        :return: The value associated with the key, or default if the key does not exist.
+        """
+        key_bytes = self.key_codec.encode(key)
+        index = self._find_slot(key_bytes, self._hash(key_bytes))[0]
+        if index == -1:
+            return default
+        return self._read_value(self._slot_offset(index))
+
+    def remove(self, key: K) -> None:
+        """
+        Remove a key-value pair, leaving a tombstone in its slot.
+
+        :param key: The key to remove.
+        :raises TypeError: If the map is read-only.
+        """
+        self._check_writable()
+        key_bytes = self.key_codec.encode(key)
+        key_hash = self._hash(key_bytes)
+        index = self._find_slot(key_bytes, key_hash)[0]
+        if index == -1:
+            return
+
+        self._begin_write(index)
+        _SLOT.pack_into(self._buffer, _TABLE_OFFSET + index * self._slot_size, key_hash, _TOMBSTONE)
+        self.size -= 1
+        self._tombstones += 1
+
+    def _resize(self, new_capacity: Optional[int] = None) -> None:
+        """
+        Rebuild the table, dropping tombstones and the records that removed and replaced values left behind.
+
+        :param new_capacity: The capacity to rebuild with. By default the capacity is doubled, unless most of the
+            load is tombstones, in which case the table is rebuilt at its current capacity.
+        """
+        if new_capacity is None:
+            new_capacity = self.capacity
+            if (self.size + 1) / self.capacity > self.max_load_factor / 2:
+                new_capacity *= 2
+
+        self._rebuild(new_capacity)
+
+    def compact(self) -> None:
+        """
+        Rebuild the map at the smallest capacity that fits the current entries, reclaiming the space of removed and
+        replaced records.
+
+        :raises TypeError: If the map is read-only.
+        """
+        self._check_writable()
+
+        capacity = 8
+        while (self.size + 1) / capacity > self.max_load_factor / 2:
+            capacity *= 2
+        self._resize(capacity)
+
+    def __contains__(self, key: object) -> bool:
+        key_bytes = self.key_codec.encode(key)
+        return self._find_slot(key_bytes, self._hash(key_bytes))[0] != -1
+
+    def __getitem__(self, key: K) -> V:
+        key_bytes = self.key_codec.encode(key)
+        index = self._find_slot(key_bytes, self._hash(key_bytes))[0]
+        if index == -1:
+            raise KeyError(key)
+        return self._read_value(self._slot_offset(index))
+
+    def __setitem__(self, key: K, value: V) -> None:
+        self.put(key, value)
+
+    def __delitem__(self, key: K) -> None:
+        size = self.size
+        self.remove(key)
+        if self.size == size:
+            raise KeyError(key)
+
+    def __iter__(self) -> Iterator[K]:
+        buffer = self._buffer
+        decode = self.key_codec.decode
+        for _, offset in self._iter_records():
+            key_length = _RECORD.unpack_from(buffer, offset)[0]
+            start = offset + _RECORD.size
+            yield decode(buffer[start:start + key_length])
+
+    def __len__(self) -> int:
+        return self.size
@@ -0,0 +1,285 @@
+import time
+from typing import TypeVar, Generic, Optional, Callable, Iterator
+
+from HashMap.HashMap import HashMap
+from LinkedList.DoublyLinkedList.DoublyLinkedList import DoublyLinkedList, ListNode
+
+K = TypeVar('K')
+V = TypeVar('V')
+
+"""
+Why combine a HashMap with a DoublyLinkedList for a cache?
+
+A bounded cache has to find an entry by key and decide which entry to evict, both in O(1). The HashMap maps each key to
+the ListNode holding its entry, and the DoublyLinkedList keeps the entries in eviction order. Because the node can be
+reached directly from the HashMap, it can be unlinked and relinked without walking the list.
+
+- LRU keeps a single list ordered from least to most recently used. A hit moves the node to the back and the front node
+  is evicted.
+- LFU keeps one list per access frequency, each ordered from least to most recently used, plus the lowest frequency
+  in use. A hit moves the node to the list of the next frequency and the front node of the lowest frequency is evicted.
+
+Expired entries are removed lazily, when they are looked up or when purge_expired() is called.
+"""
+
+POLICIES = ("lru", "lfu")
+
+
+class _CacheEntry(Generic[K, V]):
+    """
+    The data stored in each ListNode of a CacheMap.
+    """
+    __slots__ = ("key", "value", "expires_at", "frequency")
+
+    def __init__(self, key: K, value: V, expires_at: Optional[float]):
+        self.key = key
+        self.value = value
+        self.expires_at = expires_at
+        self.frequency = 1
+
+
+class CacheMap(Generic[K, V]):
+    """
+    A capacity-bounded cache with LRU or LFU eviction and optional per-entry time-to-live.
+    """
+
+    def __init__(
+        self,
+        capacity: int,
+        policy: str = "lru",
+        ttl: Optional[float] = None,
+        on_evict: Optional[Callable[[K, V], None]] = None,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """
+        Initialize the CacheMap.
+
+        :param capacity: The maximum number of entries.
+        :param policy: The eviction policy, either "lru" (default) or "lfu".
+        :param ttl: The default time-to-live of an entry in seconds. Defaults to None, meaning entries never expire.
+        :param on_evict: A callback invoked with the key and value of every entry evicted or expired by the cache.
+        :param clock: The function returning the current time in seconds. Defaults to time.monotonic.
+        """
+        if capacity <= 0:
+            raise ValueError("capacity must be positive")
+        if policy not in POLICIES:
+            raise ValueError(f"Unknown policy: {policy!r}")
+
+        self.capacity = capacity
+        self.policy = policy
+        self.ttl = ttl
+        self.on_evict = on_evict
+        self.clock = clock
+
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+
+        self._nodes: HashMap[K, ListNode[_CacheEntry[K, V]]] = HashMap(capacity=max(int(capacity / 0.7) + 1, 10))
+        self._order: DoublyLinkedList[_CacheEntry[K, V]] = DoublyLinkedList()  # LRU order
+        self._frequencies: HashMap[int, DoublyLinkedList[_CacheEntry[K, V]]] = HashMap()  # LFU lists
+        self._min_frequency = 0
+
+    def _frequency_list(self, frequency: int) -> DoublyLinkedList[_CacheEntry[K, V]]:
+        """
+        Get the LFU list of a frequency, creating it if needed.
+
+        :param frequency: The access frequency.
+        :return: The list of entries with that frequency.
+        """
+        return self._frequencies.get_or_insert(frequency, DoublyLinkedList)
+
+    def _list_of(self, node: ListNode[_CacheEntry[K, V]]) -> DoublyLinkedList[_CacheEntry[K, V]]:
+        """
+        Get the list currently holding a node.
+
+        :param node: The node.
+        :return: The list holding the node.
+        """
+        if self.policy == "lru":
+            return self._order
+        return self._frequencies[node.data.frequency]
+
+    def _touch(self, node: ListNode[_CacheEntry[K, V]]) -> None:
+        """
+        Record an access to an entry, moving it to the back of its eviction order.
+
+        :param node: The node of the accessed entry.
+        """
+        if self.policy == "lru":
+            self._order.move_to_back(node)
+            return
+
+        entry = node.data
+        lst = self._frequencies[entry.frequency]
+        lst.remove_node(node)
+        if len(lst) == 0:
+            self._frequencies.remove(entry.frequency)
+            if self._min_frequency == entry.frequency:
+                self._min_frequency += 1
+
+        entry.frequency += 1
+        self._frequency_list(entry.frequency).append_node(node)
+
+    def _detach(self, node: ListNode[_CacheEntry[K, V]]) -> None:
+        """
+        Remove an entry from the HashMap and from its eviction order.
+
+        :param node: The node of the entry to remove.
+        """
+        entry = node.data
+        lst = self._list_of(node)
+        lst.remove_node(node)
+        if self.policy == "lfu" and len(lst) == 0:
+            self._frequencies.remove(entry.frequency)
+        self._nodes.remove(entry.key)
+
+    def _evict(self) -> None:
+        """
+        Evict the entry chosen by the policy: the least recently used, or the least frequently used.
+        """
+        if self.policy == "lru":
+            node = self._order.head
+        else:
+            node = self._frequencies[self._min_frequency].head
+
+        self._detach(node)
+        self.evictions += 1
+        if self.on_evict:
+            self.on_evict(node.data.key, node.data.value)
+
+    def _expire(self, node: ListNode[_CacheEntry[K, V]]) -> None:
+        """
+        Remove an expired entry.
+
+        :param node: The node of the expired entry.
+        """
+        self._detach(node)
+        self.expirations += 1
+        if self.on_evict:
+            self.on_evict(node.data.key, node.data.value)
+
+    def _live_node(self, key: K) -> Optional[ListNode[_CacheEntry[K, V]]]:
+        """
+        Look up the node of a key, expiring it first if its time-to-live has passed.
+
+        :param key: The key to look up.
+        :return: The node, or None if the key is missing or expired.
+        """
+        node = self._nodes.get(key)
+        if node is not None and node.data.expires_at is not None and self.clock() >= node.data.expires_at:
+            self._expire(node)
+            return None
+        return node
+
+    def get(self, key: K, default: Optional[V] = None) -> Optional[V]:
+        """
+        Retrieve the value associated with a key, counting a hit or a miss.
+
+        :param key: The key to look up.
+        :param default: The value to return on a miss. Defaults to None.
+        :return: The cached value, or default if the key is missing or expired.
+        """
+        node = self._live_node(key)
+        if node is None:
+            self.misses += 1
+            return default
+
+        self.hits += 1
+        self._touch(node)
+        return node.data.value
+
+    def put(self, key: K, value: V, ttl: Optional[float] = None) -> None:
+        """
+        Insert or update a key-value pair, evicting an entry if the cache is full.
+
+        :param key: The key to insert.
+        :param value: The value associated with the key.
+        :param ttl: The time-to-live of this entry in seconds. Defaults to the cache's ttl.
+        """
+        if ttl is None:
+            ttl = self.ttl
+        expires_at = None if ttl is None else self.clock() + ttl
+
+        node = self._live_node(key)
+        if node is not None:
+            node.data.value = value
+            node.data.expires_at = expires_at
+            self._touch(node)
+            return
+
+        if len(self._nodes) >= self.capacity:
+            self._evict()
+
+        entry = _CacheEntry(key, value, expires_at)
+        if self.policy == "lru":
+            lst = self._order
+        else:
+            lst = self._frequency_list(1)
+            self._min_frequency = 1
+
+        self._nodes.put(key, lst.append(entry))
+
+    def remove(self, key: K) -> None:
+        """
+        Remove a key from the cache. The eviction callback is not invoked.
+
+        :param key: The key to remove.
+        """
+        node = self._nodes.get(key)
+        if node is not None:
+            self._detach(node)
+
+    def purge_expired(self) -> int:
+        """
+        Remove every expired entry now instead of waiting for it to be looked up.
+
+        :return: The number of entries removed.
+        """
+        now = self.clock()
+        expired = [node for node in self._nodes.values()
+                   if node.data.expires_at is not None and now >= node.data.expires_at]
+        for node in expired:
+            self._expire(node)
+        return len(expired)
+
+    def clear(self) -> None:
+        """
+        Remove every entry, keeping the counters.
+        """
+        self._nodes.clear()
+        self._order.clear()
+        self._frequencies.clear()
+        self._min_frequency = 0
+
+    def __contains__(self, key: object) -> bool:
+        """
+        Check whether a live entry exists for a key, without counting a hit or miss or changing the eviction order.
+
+        :param key: The key to look up.
+        :return: True if the key is cached and not expired, False otherwise.
+        """
+        return self._live_node(key) is not None
+
+    def __len__(self) -> int:
+        """
+        Get the number of cached entries, including expired entries that have not been removed yet.
+
+        :return: The number of entries.
+        """
+        return len(self._nodes)
+
+    def __iter__(self) -> Iterator[K]:
+        """
+        Iterate over the cached keys in no particular order.
+
+        :return: An iterator over the keys.
+        """
+        return iter(self._nodes)
+
+    def __str__(self) -> str:
+        return f"CacheMap(policy={self.policy!r}, size={len(self)}, capacity={self.capacity})"
+
+    def __repr__(self) -> str:
+        return self.__str__()
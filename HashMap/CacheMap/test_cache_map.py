@@ -0,0 +1,132 @@
+import unittest
+
+from HashMap.CacheMap.CacheMap import CacheMap
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+class TestCacheMap(unittest.TestCase):
+    def setUp(self) -> None:
+        """
+        Set up an LRU CacheMap with a controllable clock for testing.
+        """
+        self.clock = FakeClock()
+        self.evicted = []
+        self.cache = CacheMap[str, int](3, clock=self.clock, on_evict=lambda k, v: self.evicted.append((k, v)))
+
+    def test_put_and_get(self):
+        """
+        Test inserting, updating and retrieving entries.
+        """
+        self.cache.put("a", 1)
+        self.cache.put("a", 2)
+
+        self.assertEqual(self.cache.get("a"), 2)
+        self.assertIsNone(self.cache.get("b"))
+        self.assertEqual(self.cache.get("b", -1), -1)
+        self.assertEqual(len(self.cache), 1)
+
+    def test_lru_eviction(self):
+        """
+        Test that the least recently used entry is evicted and reported to the callback.
+        """
+        for i, key in enumerate("abc"):
+            self.cache.put(key, i)
+        self.cache.get("a")
+        self.cache.put("d", 3)
+
+        self.assertNotIn("b", self.cache)
+        self.assertEqual(set(self.cache), {"a", "c", "d"})
+        self.assertEqual(self.evicted, [("b", 1)])
+        self.assertEqual(self.cache.evictions, 1)
+
+    def test_lfu_eviction(self):
+        """
+        Test that the least frequently used entry is evicted, breaking ties by recency.
+        """
+        cache = CacheMap[str, int](3, policy="lfu")
+        for i, key in enumerate("abc"):
+            cache.put(key, i)
+        cache.get("a")
+        cache.get("a")
+        cache.get("b")
+
+        cache.put("d", 3)
+        self.assertEqual(set(cache), {"a", "b", "d"})
+
+        cache.put("e", 4)  # "d" is the only entry with frequency 1
+        self.assertEqual(set(cache), {"a", "b", "e"})
+
+        cache.get("e")
+        cache.put("f", 5)  # "b" and "e" have frequency 2, "b" was used least recently
+        self.assertEqual(set(cache), {"a", "e", "f"})
+        self.assertEqual(cache.evictions, 3)
+
+    def test_ttl_expiration(self):
+        """
+        Test that expired entries are removed lazily and per-entry ttl overrides the default.
+        """
+        cache = CacheMap[str, int](10, ttl=5, clock=self.clock, on_evict=lambda k, v: self.evicted.append((k, v)))
+        cache.put("a", 1)
+        cache.put("b", 2, ttl=20)
+
+        self.clock.now = 10
+        self.assertEqual(len(cache), 2)
+        self.assertIsNone(cache.get("a"))
+        self.assertEqual(cache.get("b"), 2)
+        self.assertEqual(len(cache), 1)
+        self.assertEqual(cache.expirations, 1)
+        self.assertEqual(self.evicted, [("a", 1)])
+
+        cache.put("c", 3)
+        self.clock.now = 30
+        self.assertEqual(cache.purge_expired(), 2)
+        self.assertEqual(len(cache), 0)
+
+    def test_counters(self):
+        """
+        Test that hits and misses are counted by get but not by membership tests.
+        """
+        self.cache.put("a", 1)
+        self.cache.get("a")
+        self.cache.get("a")
+        self.cache.get("b")
+        self.assertIn("a", self.cache)
+
+        self.assertEqual((self.cache.hits, self.cache.misses), (2, 1))
+
+    def test_remove_and_clear(self):
+        """
+        Test that removing entries does not invoke the eviction callback.
+        """
+        cache = CacheMap[str, int](3, policy="lfu", on_evict=lambda k, v: self.evicted.append((k, v)))
+        for i, key in enumerate("abc"):
+            cache.put(key, i)
+        cache.get("c")
+        cache.remove("c")
+        cache.remove("missing")
+
+        self.assertEqual(set(cache), {"a", "b"})
+        cache.clear()
+        self.assertEqual(len(cache), 0)
+        cache.put("d", 4)
+        self.assertEqual(cache.get("d"), 4)
+        self.assertEqual(self.evicted, [])
+
+    def test_invalid_arguments(self):
+        """
+        Test that invalid capacities and policies are rejected.
+        """
+        with self.assertRaises(ValueError):
+            CacheMap(0)
+        with self.assertRaises(ValueError):
+            CacheMap(10, policy="fifo")
+
+if __name__ == "__main__":
+    unittest.main()
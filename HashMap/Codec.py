@@ -0,0 +1,59 @@
+import pickle
+from typing import TypeVar, Generic, Callable
+
+T = TypeVar('T')
+
+"""
+Why codecs?
+
+HashMaps that keep their entries outside the Python heap (in a memory-mapped file or a shared memory segment) can only
+store bytes. A codec converts keys or values to bytes and back. Keys are compared by their encoded bytes, so a key
+codec must encode equal keys to equal bytes: BYTES, STR and INT do, while PICKLE only does for simple values such as
+strings, integers and tuples of them.
+"""
+
+
+class Codec(Generic[T]):
+    """
+    A named pair of functions converting values to bytes and back.
+    """
+    __slots__ = ("name", "encode", "decode")
+
+    def __init__(self, name: str, encode: Callable[[T], bytes], decode: Callable[[bytes], T]):
+        """
+        Initialize the Codec.
+
+        :param name: The name of the codec.
+        :param encode: A function converting a value to bytes.
+        :param decode: A function converting bytes back to a value.
+        """
+        self.name = name
+        self.encode = encode
+        self.decode = decode
+
+    def __repr__(self) -> str:
+        return f"Codec({self.name!r})"
+
+
+def _encode_str(value: str) -> bytes:
+    return value.encode("utf-8")
+
+
+def _decode_str(data: bytes) -> str:
+    return str(data, "utf-8")  # Accepts memoryview slices of shared buffers as well as bytes
+
+
+def _encode_int(value: int) -> bytes:
+    return value.to_bytes(8, "little", signed=True)
+
+
+def _decode_int(data: bytes) -> int:
+    return int.from_bytes(data, "little", signed=True)
+
+
+BYTES: Codec[bytes] = Codec("bytes", bytes, bytes)
+STR: Codec[str] = Codec("str", _encode_str, _decode_str)
+INT: Codec[int] = Codec("int", _encode_int, _decode_int)  # 64-bit signed integers
+PICKLE: Codec[object] = Codec("pickle", pickle.dumps, pickle.loads)
+
+CODECS = {codec.name: codec for codec in (BYTES, STR, INT, PICKLE)}
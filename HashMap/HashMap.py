@@ -1,48 +1,209 @@
-from typing import TypeVar, Generic, List, Optional, Union, Tuple
+import secrets
+import time
+from collections.abc import ItemsView, ValuesView
+from itertools import islice
+from typing import TypeVar, List, Optional, Union, Tuple, Iterable, Iterator, Type, Callable, MutableMapping, Dict
 
+from HashMap.TreeBucket import TreeBucket
 from LinkedList.DoublyLinkedList.DoublyLinkedList import DoublyLinkedList
 
 K = TypeVar('K')
 V = TypeVar('V')
 
+Entry = Tuple[int, K, V]  # (hash code, key, value)
+Bucket = Union[List[Entry], DoublyLinkedList[Entry], TreeBucket, Tuple[Entry, ...]]
+
 """
 HashMap implementation using both lists and linked lists for buckets.
 
 This implementation uses a hybrid approach to handle hash collisions. When a collision occurs, the bucket is
 converted from a list to a DoublyLinkedList. This allows for O(1) insertion and deletion in the average case.
 
+With a treeify_threshold, a DoublyLinkedList bucket that grows past the threshold is converted into a TreeBucket, a
+balanced tree ordered by hash code, so a flood of colliding keys costs O(log n) per operation instead of O(n).
+Setting randomize_hash mixes a random per-instance seed into every hash code, so the bucket a key lands in cannot be
+predicted from outside the process.
+
+Every entry is stored as a (hash, key, value) triple. Caching the hash code means resizing never calls __hash__ again,
+and lookups only call __eq__ on entries whose hash codes match, which matters for keys with expensive hashing or equality.
+
 This hybrid approach combines the advantages of both list and DoublyLinkedList, optimizing performance for different scenarios.
+
+The storage engine is selectable at construction. Passing ``engine="robin_hood"`` returns a RobinHoodHashMap, which
+stores entries in flat parallel arrays using open addressing instead of per-bucket lists. Passing ``engine="ordered"``
+returns an OrderedHashMap, which iterates in insertion order using dense entry arrays and a sparse index table.
 """
 
+ENGINES = ("chained", "robin_hood", "ordered")
+
+_CHAINED_OPTIONS = ("incremental_resize", "rehash_batch", "treeify_threshold")  # Only the chained engine has buckets
+
+_MASK64 = (1 << 64) - 1
+
+_MISSING = object()  # Distinguishes a missing key from a key mapped to None
+
+
+def _mix_hash(key_hash: int) -> int:
+    """
+    Scramble a hash code with the splitmix64 finalizer, so that every input bit affects the low bits used as an index.
+
+    :param key_hash: The hash code to scramble.
+    :return: A non-negative 63-bit hash code, which is never -1.
+    """
+    key_hash &= _MASK64
+    key_hash = ((key_hash ^ (key_hash >> 30)) * 0xBF58476D1CE4E5B9) & _MASK64
+    key_hash = ((key_hash ^ (key_hash >> 27)) * 0x94D049BB133111EB) & _MASK64
+    return (key_hash ^ (key_hash >> 31)) >> 1
+
+_EMPTY_BUCKET: Tuple[Entry, ...] = ()  # Shared placeholder for a bucket that has never held an entry
+
+
+class _HashMapValuesView(ValuesView):
+    """
+    A values view that streams values straight from the storage instead of looking each key up again.
+    """
+
+    def __iter__(self) -> Iterator[V]:
+        return self._mapping._iter_values()
+
+
+class _HashMapItemsView(ItemsView):
+    """
+    An items view that streams key-value pairs straight from the storage instead of looking each key up again.
+    """
+
+    def __iter__(self) -> Iterator[Tuple[K, V]]:
+        return self._mapping._iter_items()
+
 
-class HashMap(Generic[K, V]):
+class HashMap(MutableMapping[K, V]):
     """
     A hybrid HashMap implementation using both lists and linked lists for buckets.
+
+    HashMap implements the full MutableMapping protocol, so it supports ``in``, ``[]``, ``del``, iteration and
+    lazy keys/values/items views in addition to put/get/remove.
     """
 
-    def __init__(self, capacity: int = 10) -> None:
+    def __new__(cls, *args, **kwargs):
+        """
+        Select the class implementing the requested storage engine.
+
+        :param args: The positional arguments passed to the constructor.
+        :param kwargs: The keyword arguments passed to the constructor.
+        :return: A new, uninitialized instance of the engine class.
+        :raises ValueError: If an option of the chained engine is passed with another engine.
+        """
+        engine = kwargs.get("engine", args[1] if len(args) > 1 else "chained")
+
+        if cls is HashMap and engine != "chained":
+            for option in _CHAINED_OPTIONS:
+                if option in kwargs:
+                    raise ValueError(f"{option} is not supported by the {engine!r} engine")
+
+        if cls is HashMap and engine == "robin_hood":
+            from HashMap.RobinHoodHashMap.RobinHoodHashMap import RobinHoodHashMap
+            cls = RobinHoodHashMap
+        elif cls is HashMap and engine == "ordered":
+            from HashMap.OrderedHashMap.OrderedHashMap import OrderedHashMap
+            cls = OrderedHashMap
+
+        return super().__new__(cls)
+
+    def __init__(
+        self,
+        capacity: int = 10,
+        engine: str = "chained",
+        incremental_resize: bool = False,
+        rehash_batch: int = 4,
+        treeify_threshold: Optional[int] = None,
+        randomize_hash: bool = False,
+        max_load_factor: float = 0.7,
+        min_load_factor: float = 0.0,
+        on_resize: Optional[Callable[[int, int, float], None]] = None,
+    ) -> None:
         """
         Initialize the HashMap with a given capacity.
 
         :param capacity: The initial capacity of the hash map. Defaults to 10.
+        :param engine: The storage engine: "chained" (default), "robin_hood" or "ordered". The other engines accept
+            capacity, randomize_hash, max_load_factor, min_load_factor and on_resize; incremental_resize,
+            rehash_batch and treeify_threshold only apply to the chained engine.
+        :param incremental_resize: Migrate buckets to the resized table a few at a time instead of all at once.
+        :param rehash_batch: The number of old buckets migrated by each operation during an incremental resize.
+        :param treeify_threshold: Convert buckets holding more than this many entries into balanced trees.
+            Defaults to None, which keeps collided buckets as DoublyLinkedLists.
+        :param randomize_hash: Mix a random per-instance seed into every hash code to resist hash flooding.
+        :param max_load_factor: Grow the table when size / capacity exceeds this value. Defaults to 0.7.
+        :param min_load_factor: Shrink the table when a removal drops size / capacity below this value.
+            Defaults to 0.0, which never shrinks automatically.
+        :param on_resize: A callback invoked after every resize with the old capacity, the new capacity and the
+            duration of the resize in seconds.
         """
+        if engine not in ENGINES:
+            raise ValueError(f"Unknown engine: {engine!r}")
+        self._validate_load_factors(max_load_factor, min_load_factor)
+
+        self.engine = engine
         self.capacity = capacity
         self.size = 0
-        self.buckets: List[Union[List[Tuple[K, V]], DoublyLinkedList[Tuple[K, V]]]] = [
+        self.max_load_factor = max_load_factor
+        self.min_load_factor = min_load_factor
+        self._min_capacity = capacity  # Shrinking never goes below the initial capacity
+        self.buckets: List[Bucket] = [
             [] for _ in range(capacity)
         ]
         self.collision_threshold = 3  # Switch to DoublyLinkedList after this many collisions
+        self.treeify_threshold = treeify_threshold
+        self._hash_seed = secrets.randbits(64) | 1 if randomize_hash else 0
+
+        # Incremental resize state: while _old_buckets is set, buckets below _rehash_index have been migrated
+        self.incremental_resize = incremental_resize
+        self.rehash_batch = rehash_batch
+        self._old_buckets: Optional[List[Bucket]] = None
+        self._rehash_index = 0
+
+        self.on_resize = on_resize
+        self._resize_count = 0
+        self._resize_time = 0.0
+
+    @staticmethod
+    def _validate_load_factors(max_load_factor: float, min_load_factor: float) -> None:
+        """
+        Check that the load-factor thresholds are usable.
+
+        :param max_load_factor: The load factor above which the table grows.
+        :param min_load_factor: The load factor below which the table shrinks.
+        :raises ValueError: If max_load_factor is not positive, or if min_load_factor is negative or not below half of
+            max_load_factor (a shrunk table must not be full enough to grow again right away).
+        """
+        if max_load_factor <= 0:
+            raise ValueError("max_load_factor must be positive")
+        if min_load_factor < 0 or min_load_factor >= max_load_factor / 2:
+            raise ValueError("min_load_factor must be non-negative and less than half of max_load_factor")
 
     def _hash(self, key: K) -> int:
         """
-        Compute the hash index for a given key.
+        Compute the full hash code of a key. The result is stored next to the entry so it is computed only once.
 
         :param key: The key to hash.
+        :return: The hash code of the key.
+        """
+        key_hash = hash(key)
+        if self._hash_seed:
+            # Scramble the seeded hash so keys colliding modulo the capacity spread out
+            key_hash = _mix_hash(key_hash ^ self._hash_seed)
+        return key_hash
+
+    def _index(self, key_hash: int) -> int:
+        """
+        Compute the bucket index for a hash code.
+
+        :param key_hash: The hash code of a key.
         :return: The hash index within the bucket list.
         """
-        return hash(key) % self.capacity
+        return key_hash % self.capacity
 
-    def _convert_to_linked_list(self, bucket: List[Tuple[K, V]]) -> DoublyLinkedList[Tuple[K, V]]:
+    def _convert_to_linked_list(self, bucket: List[Entry]) -> DoublyLinkedList[Entry]:
         """
         Convert a list bucket to a DoublyLinkedList.
 
@@ -51,120 +212,655 @@ class HashMap(Generic[K, V]):
         """
         return DoublyLinkedList(bucket)
 
-    def put(self, key: K, value: V) -> None:
+    @staticmethod
+    def _find_in_bucket(
+        bucket: Bucket, key_hash: int, key: K
+    ) -> Optional[Entry]:
         """
-        Insert or update a key-value pair in the HashMap.
+        Find the entry for a key in a bucket.
 
-        :param key: The key to insert.
-        :param value: The value associated with the key.
+        :param bucket: The bucket to search.
+        :param key_hash: The hash code of the key.
+        :param key: The key to look up.
+        :return: The (hash, key, value) entry, or None if the key is not in the bucket.
         """
-        index = self._hash(key)
-        bucket = self.buckets[index]
+        if isinstance(bucket, TreeBucket):
+            return bucket.find(key_hash, key)
+
+        for entry in bucket:
+            # Compare the cached hashes first so __eq__ only runs on likely matches
+            if entry[0] == key_hash and (entry[1] is key or entry[1] == key):
+                return entry
+
+        return None
 
+    @staticmethod
+    def _replace_in_bucket(
+        bucket: Bucket, key_hash: int, key: K, value: V
+    ) -> bool:
+        """
+        Update the value of a key if it is present in a bucket.
+
+        :param bucket: The bucket to search.
+        :param key_hash: The hash code of the key.
+        :param key: The key to update.
+        :param value: The new value.
+        :return: True if the key was found and updated, False otherwise.
+        """
         # Handle the case where the bucket is a list
         if isinstance(bucket, list):
-            for i, (k, _) in enumerate(bucket):
-                if k == key:
-                    bucket[i] = (key, value)  # Update the value
-                    return
+            for i, (h, k, _) in enumerate(bucket):
+                if h == key_hash and (k is key or k == key):
+                    bucket[i] = (key_hash, key, value)
+                    return True
 
-            bucket.append((key, value))
-            self.size += 1
+        # Handle the case where the bucket is a DoublyLinkedList
+        elif isinstance(bucket, DoublyLinkedList):
+            current = bucket.head
+            while current:
+                h, k, _ = current.data
+                if h == key_hash and (k is key or k == key):
+                    current.data = (key_hash, key, value)
+                    return True
+                current = current.next
 
-            # Convert to DoublyLinkedList if collision threshold is exceeded
-            if len(bucket) > self.collision_threshold:
-                self.buckets[index] = self._convert_to_linked_list(bucket)
+        # Handle the case where the bucket is a TreeBucket
+        elif isinstance(bucket, TreeBucket):
+            return bucket.replace(key_hash, key, value)
+
+        return False
+
+    @staticmethod
+    def _remove_from_bucket(bucket: Bucket, key_hash: int, key: K) -> bool:
+        """
+        Remove a key from a bucket if it is present.
+
+        :param bucket: The bucket to search.
+        :param key_hash: The hash code of the key.
+        :param key: The key to remove.
+        :return: True if the key was found and removed, False otherwise.
+        """
+        if isinstance(bucket, list):
+            for i, (h, k, _) in enumerate(bucket):
+                if h == key_hash and (k is key or k == key):
+                    del bucket[i]
+                    return True
 
-        # Handle the case where the bucket is a DoublyLinkedList
         elif isinstance(bucket, DoublyLinkedList):
-            for node_data in bucket:
-                if node_data[0] == key:
-                    node_data = (key, value)  # Update the value
-                    return
+            current = bucket.head
+            while current:
+                h, k, _ = current.data
+                if h == key_hash and (k is key or k == key):
+                    bucket.remove_node(current)
+                    return True
+                current = current.next
+
+        elif isinstance(bucket, TreeBucket):
+            return bucket.remove(key_hash, key)
+
+        return False
+
+    def _add_to_bucket(self, index: int, entry: Entry) -> None:
+        """
+        Append an entry to a bucket of the current table, converting the bucket if it grew past a threshold.
+
+        :param index: The bucket index.
+        :param entry: The (hash, key, value) entry to append.
+        """
+        bucket = self.buckets[index]
+        if bucket is _EMPTY_BUCKET:
+            bucket = self.buckets[index] = []
+        bucket.append(entry)
+        self._convert_bucket(index)
+
+    def _convert_bucket(self, index: int) -> None:
+        """
+        Convert a bucket of the current table to a DoublyLinkedList or TreeBucket if it exceeds the thresholds.
+
+        :param index: The bucket index.
+        """
+        bucket = self.buckets[index]
+
+        # Convert to DoublyLinkedList if collision threshold is exceeded
+        if isinstance(bucket, list) and len(bucket) > self.collision_threshold:
+            bucket = self.buckets[index] = self._convert_to_linked_list(bucket)
 
-            bucket.append((key, value))
-            self.size += 1
+        # Convert to TreeBucket if treeify threshold is exceeded
+        if self.treeify_threshold is not None and isinstance(bucket, DoublyLinkedList) and \
+                len(bucket) > self.treeify_threshold:
+            self.buckets[index] = TreeBucket(bucket)
+
+    def _old_bucket(self, key_hash: int) -> Optional[Bucket]:
+        """
+        Get the bucket of the previous table that may still hold a key during an incremental resize.
+
+        :param key_hash: The hash code of the key.
+        :return: The old bucket, or None if no resize is in progress or the bucket was already migrated.
+        """
+        if self._old_buckets is None:
+            return None
+
+        index = key_hash % len(self._old_buckets)
+        if index < self._rehash_index:
+            return None
+        return self._old_buckets[index]
+
+    def _insert(self, key: K, value: V) -> bool:
+        """
+        Insert or update a key-value pair without checking the load factor.
+
+        :param key: The key to insert.
+        :param value: The value associated with the key.
+        :return: True if a new key was added, False if an existing key was updated.
+        """
+        key_hash = self._hash(key)
+        old_bucket = self._old_bucket(key_hash)
+        if old_bucket is not None and self._replace_in_bucket(old_bucket, key_hash, key, value):
+            return False
+
+        index = self._index(key_hash)
+        if self._replace_in_bucket(self.buckets[index], key_hash, key, value):
+            return False
+
+        # New keys always go to the current table
+        self._add_to_bucket(index, (key_hash, key, value))
+        self.size += 1
+        return True
+
+    def put(self, key: K, value: V) -> None:
+        """
+        Insert or update a key-value pair in the HashMap.
+
+        :param key: The key to insert.
+        :param value: The value associated with the key.
+        """
+        if self._old_buckets is not None:
+            self.rehash_step(self.rehash_batch)
 
         # Resize if load factor exceeds threshold
-        if self.size / self.capacity > 0.7:
+        if self._insert(key, value) and self.size / self.capacity > self.max_load_factor:
             self._resize()
 
-    def get(self, key: K) -> Optional[V]:
+    def _find_value(self, key: K) -> Union[V, object]:
+        """
+        Look up the value of a key with a single probe.
+
+        :param key: The key to look up.
+        :return: The value associated with the key, or _MISSING if the key does not exist.
+        """
+        if self._old_buckets is not None:
+            self.rehash_step(self.rehash_batch)
+
+        key_hash = self._hash(key)
+        entry = None
+
+        old_bucket = self._old_bucket(key_hash)
+        if old_bucket is not None:
+            entry = self._find_in_bucket(old_bucket, key_hash, key)
+        if entry is None:
+            entry = self._find_in_bucket(self.buckets[self._index(key_hash)], key_hash, key)
+
+        return _MISSING if entry is None else entry[2]
+
+    def get(self, key: K, default: Optional[V] = None) -> Optional[V]:
         """
         Retrieve the value associated with a key.
 
         :param key: The key to look up.
-        :return: The value associated with the key, or None if the key does not exist.
+        :param default: The value to return if the key does not exist. Defaults to None.
+        :return: The value associated with the key, or default if the key does not exist.
         """
-        index = self._hash(key)
-        bucket = self.buckets[index]
+        value = self._find_value(key)
+        return default if value is _MISSING else value
 
-        if isinstance(bucket, list):
-            for k, v in bucket:
-                if k == key:
-                    return v
+    def get_or_insert(self, key: K, factory: Callable[[], V]) -> V:
+        """
+        Retrieve the value associated with a key, inserting factory() first if the key does not exist.
 
-        elif isinstance(bucket, DoublyLinkedList):
-            for k, v in bucket:
-                if k == key:
-                    return v
+        The key is hashed and its bucket scanned only once, and factory is only called when an insertion is needed.
 
-        return None
+        :param key: The key to look up.
+        :param factory: A callable producing the value to insert for a missing key.
+        :return: The existing or newly inserted value.
+        """
+        if self._old_buckets is not None:
+            self.rehash_step(self.rehash_batch)
+
+        key_hash = self._hash(key)
+        old_bucket = self._old_bucket(key_hash)
+        entry = None if old_bucket is None else self._find_in_bucket(old_bucket, key_hash, key)
+
+        index = self._index(key_hash)
+        if entry is None:
+            entry = self._find_in_bucket(self.buckets[index], key_hash, key)
+        if entry is not None:
+            return entry[2]
+
+        value = factory()
+        self._add_to_bucket(index, (key_hash, key, value))
+        self.size += 1
+
+        if self.size / self.capacity > self.max_load_factor:
+            self._resize()
+
+        return value
+
+    def setdefault(self, key: K, default: Optional[V] = None) -> Optional[V]:
+        """
+        Retrieve the value associated with a key, inserting default first if the key does not exist.
+
+        :param key: The key to look up.
+        :param default: The value to insert for a missing key. Defaults to None.
+        :return: The existing or newly inserted value.
+        """
+        return self.get_or_insert(key, lambda: default)
+
+    def _discard(self, key: K) -> bool:
+        """
+        Remove a key without checking the low-water mark.
+
+        :param key: The key to remove.
+        :return: True if the key was present and removed, False otherwise.
+        """
+        if self._old_buckets is not None:
+            self.rehash_step(self.rehash_batch)
+
+        key_hash = self._hash(key)
+        old_bucket = self._old_bucket(key_hash)
+
+        if (old_bucket is not None and self._remove_from_bucket(old_bucket, key_hash, key)) or \
+                self._remove_from_bucket(self.buckets[self._index(key_hash)], key_hash, key):
+            self.size -= 1
+            return True
+
+        return False
 
     def remove(self, key: K) -> None:
         """
-        Remove a key-value pair from the HashMap.
+        Remove a key-value pair from the HashMap, shrinking the table if the load drops below min_load_factor.
 
         :param key: The key to remove.
         """
-        index = self._hash(key)
-        bucket = self.buckets[index]
+        if self._discard(key):
+            self._maybe_shrink()
 
-        if isinstance(bucket, list):
-            for i, (k, _) in enumerate(bucket):
-                if k == key:
-                    del bucket[i]
-                    self.size -= 1
-                    return
+    def rehash_step(self, n: int = 1) -> bool:
+        """
+        Migrate up to n buckets of an in-progress incremental resize to the new table.
 
-        elif isinstance(bucket, DoublyLinkedList):
-            current = bucket.head
-            while current:
-                if current.data[0] == key:
-                    if current.prev:
-                        current.prev.next = current.next
-                    if current.next:
-                        current.next.prev = current.prev
-                    if current == bucket.head:
-                        bucket.head = current.next
-                    if current == bucket.tail:
-                        bucket.tail = current.prev
-                    bucket.size -= 1
-                    self.size -= 1
-                    return
-
-    def _resize(self) -> None:
-        """
-        Resize the HashMap when the load factor exceeds the threshold.
-        """
-        new_capacity = self.capacity * 2
-        new_buckets: List[Union[List[Tuple[K, V]], DoublyLinkedList[Tuple[K, V]]]] = [
+        This is called automatically by put, get and remove, and can also be called from idle loops to finish
+        the migration sooner.
+
+        :param n: The maximum number of old buckets to migrate.
+        :return: True if the migration is still in progress afterwards, False otherwise.
+        """
+        old_buckets = self._old_buckets
+        if old_buckets is None:
+            return False
+
+        end = min(self._rehash_index + n, len(old_buckets))
+        for index in range(self._rehash_index, end):
+            for entry in old_buckets[index]:
+                self._add_to_bucket(self._index(entry[0]), entry)
+            old_buckets[index] = _EMPTY_BUCKET  # Drop references so migrated entries are not kept alive twice
+
+        self._rehash_index = end
+        if end == len(old_buckets):
+            self._old_buckets = None
+            self._rehash_index = 0
+            return False
+
+        return True
+
+    def _resize(self, new_capacity: Optional[int] = None) -> None:
+        """
+        Rebuild the table, recording the resize for stats() and invoking the on_resize callback.
+
+        :param new_capacity: The capacity to resize to. Defaults to the engine's growth policy.
+        """
+        old_capacity = self.capacity
+        start = time.perf_counter()
+        self._rebuild(new_capacity)
+        duration = time.perf_counter() - start
+
+        self._resize_count += 1
+        self._resize_time += duration
+        if self.on_resize is not None:
+            self.on_resize(old_capacity, self.capacity, duration)
+
+    def _rebuild(self, new_capacity: Optional[int] = None) -> None:
+        """
+        Move every entry into a table of a new capacity.
+
+        Entries are redistributed using their cached hash codes, so no key is hashed again. In incremental mode the
+        new table starts out filled with a shared empty placeholder, so no bucket list is created here; each bucket's
+        list is allocated when the first entry lands in it, and entries are migrated by subsequent operations and
+        rehash_step.
+
+        :param new_capacity: The capacity to resize to. Defaults to double the current capacity, in which case
+            the resize is incremental if enabled; an explicit capacity is always applied immediately.
+        """
+        incremental = self.incremental_resize and new_capacity is None
+        if new_capacity is None:
+            new_capacity = self.capacity * 2
+
+        # A resize can only track one old table, so finish any migration that is still running
+        while self.rehash_step(len(self.buckets)):
+            pass
+
+        if incremental:
+            self._old_buckets = self.buckets
+            self._rehash_index = 0
+            self.buckets = [_EMPTY_BUCKET] * new_capacity
+            self.capacity = new_capacity
+            return
+
+        new_buckets: List[Bucket] = [
             [] for _ in range(new_capacity)
         ]
 
         for bucket in self.buckets:
-            if isinstance(bucket, list):
-                for key, value in bucket:
-                    index = hash(key) % new_capacity
-                    new_buckets[index].append((key, value))
-            elif isinstance(bucket, DoublyLinkedList):
-                for key, value in bucket:
-                    index = hash(key) % new_capacity
-                    new_buckets[index].append((key, value))
+            for entry in bucket:
+                new_buckets[entry[0] % new_capacity].append(entry)
 
         self.buckets = new_buckets
         self.capacity = new_capacity
 
+        # Entries were appended to plain lists, so restore the trees of buckets that are still heavily collided
+        if self.treeify_threshold is not None:
+            for index, bucket in enumerate(new_buckets):
+                if len(bucket) > self.treeify_threshold:
+                    self._convert_bucket(index)
+
+    def _compact_capacity(self, target_load_factor: float) -> int:
+        """
+        Compute the smallest capacity, reachable by halving the current one, that keeps the load at or below a target.
+
+        :param target_load_factor: The highest acceptable load factor after shrinking.
+        :return: The new capacity, which is never below the initial capacity.
+        """
+        capacity = self.capacity
+        while capacity // 2 >= self._min_capacity and self.size / (capacity // 2) <= target_load_factor:
+            capacity //= 2
+        return capacity
+
+    def _maybe_shrink(self) -> None:
+        """
+        Shrink the table if the load has dropped below min_load_factor.
+
+        The table is shrunk to half of max_load_factor, so that a few insertions do not immediately grow it again.
+        """
+        if self.min_load_factor and self.size / self.capacity < self.min_load_factor:
+            capacity = self._compact_capacity(self.max_load_factor / 2)
+            if capacity < self.capacity:
+                self._resize(capacity)
+
+    def compact(self) -> None:
+        """
+        Rebuild the table at the smallest capacity that holds the current entries within max_load_factor.
+
+        Any incremental resize in progress is finished first. Use this after a large batch of removals to release
+        memory and to make iteration proportional to the number of entries again.
+        """
+        self._resize(self._compact_capacity(self.max_load_factor))
+
+    def _reserve(self, expected_size: int) -> None:
+        """
+        Grow the table once so that expected_size entries fit without exceeding the load factor.
+
+        :param expected_size: The number of entries the table should hold.
+        """
+        capacity = self.capacity
+        while expected_size / capacity > self.max_load_factor:
+            capacity *= 2
+
+        if capacity != self.capacity:
+            self._resize(capacity)
+
+    @classmethod
+    def from_items(
+        cls: Type['HashMap[K, V]'],
+        items: Iterable[Tuple[K, V]],
+        expected_size: Optional[int] = None,
+        **kwargs,
+    ) -> 'HashMap[K, V]':
+        """
+        Build a HashMap from key-value pairs, sizing the table once up front.
+
+        :param items: The key-value pairs to insert.
+        :param expected_size: The expected number of distinct keys. Defaults to the length of items, if it has one.
+        :param kwargs: Additional constructor arguments, such as engine. A capacity is treated as a minimum: the table
+            is made larger if expected_size needs it.
+        :return: A new HashMap containing the items.
+        """
+        if expected_size is None:
+            if not hasattr(items, "__len__"):
+                items = list(items)
+            expected_size = len(items)
+
+        max_load_factor = kwargs.get("max_load_factor", 0.7)
+        capacity = max(int(expected_size / max_load_factor) + 1, kwargs.pop("capacity", 10))
+        hash_map = cls(capacity=capacity, **kwargs)
+        hash_map.put_many(items)
+        return hash_map
+
+    def put_many(self, items: Iterable[Tuple[K, V]]) -> int:
+        """
+        Insert or update many key-value pairs. The table is resized at most once, before any insertion.
+
+        :param items: The key-value pairs to insert.
+        :return: The number of new keys added.
+        """
+        if not hasattr(items, "__len__"):
+            items = list(items)
+
+        size = self.size
+        self._reserve(size + len(items))
+
+        insert = self._insert
+        for key, value in items:
+            insert(key, value)
+
+        return self.size - size
+
+    def get_many(self, keys: Iterable[K]) -> List[Optional[V]]:
+        """
+        Retrieve the values associated with many keys.
+
+        :param keys: The keys to look up.
+        :return: The values in the same order as the keys, with None for keys that do not exist.
+        """
+        if self._old_buckets is not None:
+            get = self.get
+            return [get(key) for key in keys]
+
+        buckets = self.buckets
+        capacity = self.capacity
+        hash_key = self._hash
+        find = self._find_in_bucket
+        results: List[Optional[V]] = []
+        append = results.append
+
+        for key in keys:
+            key_hash = hash_key(key)
+            entry = find(buckets[key_hash % capacity], key_hash, key)
+            append(None if entry is None else entry[2])
+
+        return results
+
+    def remove_many(self, keys: Iterable[K]) -> int:
+        """
+        Remove many keys from the HashMap. The low-water mark is checked once, after all removals.
+
+        :param keys: The keys to remove.
+        :return: The number of keys that were present and removed.
+        """
+        size = self.size
+        discard = self._discard
+        for key in keys:
+            discard(key)
+
+        self._maybe_shrink()
+        return size - self.size
+
+    def _base_stats(self) -> Dict[str, object]:
+        """
+        Collect the statistics shared by every storage engine.
+
+        :return: The size, capacity, load factor, resize count and cumulative resize time.
+        """
+        return {
+            "size": self.size,
+            "capacity": self.capacity,
+            "load_factor": self.size / self.capacity,
+            "resize_count": self._resize_count,
+            "resize_time": self._resize_time,
+        }
+
+    def stats(self) -> Dict[str, object]:
+        """
+        Report how the keys are spread over the buckets and how much time has been spent resizing.
+
+        This walks every bucket, so it is O(capacity) and meant for diagnostics rather than hot paths. A skewed
+        histogram or a growing number of converted buckets points at a poorly distributed __hash__.
+
+        :return: A dictionary with the size, capacity, load_factor, resize_count and resize_time (in seconds), plus:
+            - bucket_histogram: the number of buckets of each length, keyed by length
+            - max_chain_length: the length of the longest bucket
+            - avg_chain_length: the average length of the non-empty buckets
+            - linked_list_buckets: the number of buckets converted to a DoublyLinkedList
+            - tree_buckets: the number of buckets converted to a TreeBucket
+        """
+        histogram: Dict[int, int] = {}
+        linked_list_buckets = tree_buckets = 0
+
+        for bucket in self._iter_buckets():
+            length = len(bucket)
+            histogram[length] = histogram.get(length, 0) + 1
+            if isinstance(bucket, DoublyLinkedList):
+                linked_list_buckets += 1
+            elif isinstance(bucket, TreeBucket):
+                tree_buckets += 1
+
+        non_empty = sum(count for length, count in histogram.items() if length)
+        stats = self._base_stats()
+        stats.update({
+            "bucket_histogram": dict(sorted(histogram.items())),
+            "max_chain_length": max(histogram),
+            "avg_chain_length": self.size / non_empty if non_empty else 0.0,
+            "linked_list_buckets": linked_list_buckets,
+            "tree_buckets": tree_buckets,
+        })
+        return stats
+
+    def _iter_buckets(self) -> Iterator[Bucket]:
+        """
+        Iterate over every bucket that may hold entries, including unmigrated buckets of an incremental resize.
+
+        :return: An iterator over the buckets.
+        """
+        if self._old_buckets is not None:
+            yield from islice(self._old_buckets, self._rehash_index, None)
+        yield from self.buckets
+
+    def _iter_values(self) -> Iterator[V]:
+        """
+        Iterate over the values without building an intermediate list.
+
+        :return: An iterator over the values.
+        """
+        for bucket in self._iter_buckets():
+            for entry in bucket:
+                yield entry[2]
+
+    def _iter_items(self) -> Iterator[Tuple[K, V]]:
+        """
+        Iterate over the key-value pairs without building an intermediate list.
+
+        :return: An iterator over the key-value pairs.
+        """
+        for bucket in self._iter_buckets():
+            for _, key, value in bucket:
+                yield key, value
+
+    def __iter__(self) -> Iterator[K]:
+        """
+        Iterate over the keys without building an intermediate list.
+
+        :return: An iterator over the keys.
+        """
+        for bucket in self._iter_buckets():
+            for entry in bucket:
+                yield entry[1]
+
+    def values(self) -> ValuesView:
+        """
+        Get a lazy view of the values.
+
+        :return: A view that streams the values from the buckets.
+        """
+        return _HashMapValuesView(self)
+
+    def items(self) -> ItemsView:
+        """
+        Get a lazy view of the key-value pairs.
+
+        :return: A view that streams the key-value pairs from the buckets.
+        """
+        return _HashMapItemsView(self)
+
+    def clear(self) -> None:
+        """
+        Remove every key-value pair, keeping the current capacity.
+        """
+        self.buckets = [[] for _ in range(self.capacity)]
+        self._old_buckets = None
+        self._rehash_index = 0
+        self.size = 0
+
+    def __contains__(self, key: object) -> bool:
+        """
+        Check whether a key is in the HashMap with a single probe.
+
+        :param key: The key to look up.
+        :return: True if the key exists, False otherwise.
+        """
+        return self._find_value(key) is not _MISSING
+
+    def __getitem__(self, key: K) -> V:
+        """
+        Retrieve the value associated with a key.
+
+        :param key: The key to look up.
+        :return: The value associated with the key.
+        :raises KeyError: If the key does not exist.
+        """
+        value = self._find_value(key)
+        if value is _MISSING:
+            raise KeyError(key)
+        return value
+
+    def __setitem__(self, key: K, value: V) -> None:
+        """
+        Insert or update a key-value pair.
+
+        :param key: The key to insert.
+        :param value: The value associated with the key.
+        """
+        self.put(key, value)
+
+    def __delitem__(self, key: K) -> None:
+        """
+        Remove a key-value pair.
+
+        :param key: The key to remove.
+        :raises KeyError: If the key does not exist.
+        """
+        size = self.size
+        self.remove(key)
+        if self.size == size:
+            raise KeyError(key)
+
     def __len__(self) -> int:
         """
         Get the number of elements in the HashMap.
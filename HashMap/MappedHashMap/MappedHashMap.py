@@ -0,0 +1,280 @@
+import mmap
+import os
+import struct
+import zlib
+from typing import TypeVar, Union
+
+from HashMap.BufferHashMap import BufferHashMap, _TABLE_OFFSET, _SLOT, _RECORD, _EMPTY, _TOMBSTONE
+from HashMap.Codec import Codec, PICKLE
+
+K = TypeVar('K')
+V = TypeVar('V')
+
+"""
+Why store a HashMap in a memory-mapped file?
+
+A HashMap built in one process has to be rebuilt (or unpickled) by every other process that needs it. A MappedHashMap
+keeps its whole table in a single file accessed through mmap, so opening an existing map only reads its header: pages
+are loaded by the operating system on first access, maps larger than RAM work, and processes that open the same file
+read-only share one copy of it in the page cache.
+
+The slot table and record heap follow the layout of BufferHashMap. The header region holds two header copies, each
+holding the entry count, tombstone count, table capacity, end of the heap, a generation number and a CRC32. Headers are
+written alternately, and opening a file picks the valid copy with the highest generation, so a crash while a header is
+being written leaves the other copy intact.
+
+Crash consistency: flush() writes the table and heap to disk before writing a header, and the first change after a
+flush marks the header dirty. Records are only appended, so the records of the last flush stay intact past it; what a
+change destroys is the old content of a slot. Each slot therefore carries a shadow after its hash and offset: the first
+time a slot changes after a flush, its previous offset is saved in the shadow, tagged with the generation of the dirty
+header. The shadow sits in the same 32-byte slot as the offset it restores, so both reach the disk together. Opening a
+dirty file puts back the previous offset of every slot tagged with that header's generation, so the map comes back
+exactly as it was at the last flush(), including keys updated or removed since then. A read-only map recovers in a
+private copy-on-write mapping and leaves the file untouched. Rebuilding writes a new file and atomically replaces the
+old one.
+"""
+
+MODES = ("r", "w", "c", "n")
+
+_MAGIC = b"HASHMAP\x00"
+_VERSION = 2
+_HEADER = struct.Struct("<8sIIQQQQQ")  # magic, version, flags, generation, capacity, size, tombstones, heap end
+_CRC = struct.Struct("<I")
+_HEADER_SIZE = _TABLE_OFFSET // 2
+_DIRTY = 1
+_SHADOW = struct.Struct("<QQ")  # previous record offset, generation of the dirty header it was saved under
+
+
+class MappedHashMap(BufferHashMap[K, V]):
+    """
+    A HashMap stored in a memory-mapped file, using fixed-size slots and a heap of variable-length records.
+    """
+    _slot_size = _SLOT.size + _SHADOW.size
+
+    def __init__(
+        self,
+        path: Union[str, os.PathLike],
+        mode: str = "c",
+        capacity: int = 1024,
+        key_codec: Codec[K] = PICKLE,
+        value_codec: Codec[V] = PICKLE,
+        max_load_factor: float = 0.7,
+    ) -> None:
+        """
+        Open or create a MappedHashMap.
+
+        :param path: The path of the file holding the map.
+        :param mode: "r" opens an existing map read-only, "w" opens an existing map for reading and writing, "c"
+            (default) opens the map, creating it if it does not exist, and "n" always creates a new, empty map.
+        :param capacity: The initial number of slots of a new map, rounded up to a power of two. Defaults to 1024.
+        :param key_codec: The codec converting keys to bytes. Defaults to PICKLE.
+        :param value_codec: The codec converting values to bytes. Defaults to PICKLE.
+        :param max_load_factor: Rebuild the table when (size + tombstones) / capacity would exceed this value.
+            Must be below 1. Defaults to 0.7.
+        :raises FileNotFoundError: If mode is "r" or "w" and the file does not exist.
+        :raises ValueError: If the file is not a valid MappedHashMap.
+        """
+        if mode not in MODES:
+            raise ValueError(f"Unknown mode: {mode!r}")
+        if not 0 < max_load_factor < 1:
+            raise ValueError("max_load_factor must be between 0 and 1")
+
+        self.path = os.fspath(path)
+        self.mode = mode
+        self.readonly = mode == "r"
+        self.key_codec = key_codec
+        self.value_codec = value_codec
+        self.max_load_factor = max_load_factor
+
+        if mode == "n" or (mode == "c" and not os.path.exists(self.path)):
+            self._create(self._round_capacity(capacity))
+        else:
+            self._load()
+
+    def _map(self) -> None:
+        """
+        Open the file and map it into memory.
+        """
+        self._file = open(self.path, "rb" if self.readonly else "r+b")
+        self._buffer = mmap.mmap(self._file.fileno(), 0,
+                                 access=mmap.ACCESS_READ if self.readonly else mmap.ACCESS_WRITE)
+
+    def _unmap(self) -> None:
+        """
+        Unmap the file and close it.
+        """
+        self._buffer.close()
+        self._file.close()
+
+    def _create(self, capacity: int) -> None:
+        """
+        Create a new, empty map file, replacing any existing file.
+
+        :param capacity: The number of slots, which must be a power of two.
+        """
+        self.capacity = capacity
+        self.size = 0
+        self._tombstones = 0
+        self._heap_end = self._table_end(capacity)
+        self._generation = 0
+        self._dirty = False
+
+        with open(self.path, "wb") as f:
+            f.truncate(self._heap_end + max(mmap.PAGESIZE, capacity * 32))
+        self._map()
+        self._write_header()
+
+    def _load(self) -> None:
+        """
+        Map an existing file and read its newest valid header, recovering from an unclean shutdown if needed.
+
+        :raises ValueError: If the file has no valid header.
+        """
+        self._map()
+        buffer = self._buffer
+
+        header = None
+        if len(buffer) >= _TABLE_OFFSET:
+            for offset in (0, _HEADER_SIZE):
+                raw = buffer[offset:offset + _HEADER.size]
+                if _CRC.unpack_from(buffer, offset + _HEADER.size)[0] != zlib.crc32(raw):
+                    continue
+                fields = _HEADER.unpack(raw)
+                if fields[0] == _MAGIC and fields[1] == _VERSION and (header is None or fields[3] > header[3]):
+                    header = fields
+
+        if header is None:
+            self._unmap()
+            raise ValueError(f"{self.path} is not a MappedHashMap file")
+
+        _, _, flags, self._generation, self.capacity, self.size, self._tombstones, self._heap_end = header
+        self._dirty = bool(flags & _DIRTY)
+        if self._dirty:
+            self._recover()
+
+    def _recover(self) -> None:
+        """
+        Restore the slots changed after the last flush from their shadows and recount the entries.
+        """
+        if self.readonly:
+            self._buffer.close()  # Recover in a private copy of the pages, without writing to the file
+            self._buffer = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_COPY)
+
+        buffer = self._buffer
+        heap_end = self._heap_end
+        size = tombstones = 0
+
+        for position in range(_TABLE_OFFSET, self._table_end(self.capacity), self._slot_size):
+            key_hash, offset = _SLOT.unpack_from(buffer, position)
+            previous, generation = _SHADOW.unpack_from(buffer, position + _SLOT.size)
+            if generation == self._generation:
+                offset = previous
+                if offset > _TOMBSTONE:  # The slot may have held another key before a tombstone was reused
+                    key_length = _RECORD.unpack_from(buffer, offset)[0]
+                    start = offset + _RECORD.size
+                    key_hash = self._hash(buffer[start:start + key_length])
+                _SLOT.pack_into(buffer, position, key_hash, offset)
+                _SHADOW.pack_into(buffer, position + _SLOT.size, _EMPTY, 0)
+
+            if offset == _EMPTY:
+                continue
+            if offset == _TOMBSTONE or offset >= heap_end:
+                tombstones += 1
+                if offset != _TOMBSTONE:
+                    _SLOT.pack_into(buffer, position, key_hash, _TOMBSTONE)
+            else:
+                size += 1
+
+        self.size = size
+        self._tombstones = tombstones
+        if not self.readonly:
+            self.flush()
+
+    def _write_header(self) -> None:
+        """
+        Write the header copy that is not the newest and flush it to disk.
+        """
+        self._generation += 1
+        raw = _HEADER.pack(_MAGIC, _VERSION, _DIRTY if self._dirty else 0, self._generation, self.capacity,
+                           self.size, self._tombstones, self._heap_end)
+        offset = (self._generation % 2) * _HEADER_SIZE
+        self._buffer[offset:offset + _HEADER.size] = raw
+        _CRC.pack_into(self._buffer, offset + _HEADER.size, zlib.crc32(raw))
+        self._buffer.flush(0, _TABLE_OFFSET)
+
+    def _begin_write(self, index: int) -> None:
+        """
+        Mark the header dirty before the first change after a flush, and save the offset of a slot in its shadow before
+        the first change to that slot after a flush.
+
+        :param index: The index of the slot about to be written.
+        """
+        if not self._dirty:
+            self._dirty = True
+            self._write_header()
+
+        position = _TABLE_OFFSET + index * self._slot_size
+        if _SHADOW.unpack_from(self._buffer, position + _SLOT.size)[1] != self._generation:
+            offset = _SLOT.unpack_from(self._buffer, position)[1]
+            _SHADOW.pack_into(self._buffer, position + _SLOT.size, offset, self._generation)
+
+    def _grow_heap(self, needed: int) -> None:
+        """
+        Grow the file so that at least needed more bytes of records fit, and map it again. Records and slots do not
+        move. Extending the file and mapping it anew works on every platform, unlike mmap.resize, which needs mremap.
+
+        :param needed: The number of bytes to make room for.
+        """
+        size = max(2 * len(self._buffer), self._heap_end + needed)
+        self._buffer.close()
+        os.ftruncate(self._file.fileno(), size)
+        self._buffer = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_WRITE)
+
+    def _rebuild(self, new_capacity: int) -> None:
+        """
+        Rebuild the map into a new file, then atomically replace the old file.
+
+        :param new_capacity: The number of slots, which must be a power of two.
+        """
+        rebuilt = MappedHashMap(f"{self.path}.rebuild", "n", new_capacity, self.key_codec, self.value_codec,
+                                self.max_load_factor)
+        rebuilt._grow_heap(self._heap_end - self._table_end(self.capacity))
+        rebuilt._heap_end = self._copy_records(rebuilt._buffer, new_capacity)
+        rebuilt.size = self.size
+        rebuilt.flush()
+        rebuilt._unmap()
+
+        self._unmap()
+        os.replace(rebuilt.path, self.path)
+        self._load()
+
+    def flush(self) -> None:
+        """
+        Write every change to disk and mark the header clean. Does nothing for a read-only map.
+        """
+        if self.readonly:
+            return
+
+        self._buffer.flush()  # Table and heap must reach the disk before the header that describes them
+        self._dirty = False
+        self._write_header()
+
+    def close(self) -> None:
+        """
+        Flush any pending changes and close the file.
+        """
+        if self._dirty and not self.readonly:
+            self.flush()
+        self._unmap()
+
+    def __enter__(self) -> 'MappedHashMap[K, V]':
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def __str__(self) -> str:
+        return f"MappedHashMap({self.path!r}, size={self.size}, capacity={self.capacity})"
+
+    def __repr__(self) -> str:
+        return self.__str__()
@@ -0,0 +1,194 @@
+import os
+import shutil
+import tempfile
+import unittest
+from collections.abc import MutableMapping
+
+from HashMap.Codec import STR, INT, BYTES, PICKLE
+from HashMap.MappedHashMap.MappedHashMap import MappedHashMap, _HEADER_SIZE
+
+
+class TestMappedHashMap(unittest.TestCase):
+    def setUp(self) -> None:
+        """
+        Set up a MappedHashMap in a temporary directory for testing.
+        """
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.directory.name, "map.bin")
+        self.hash_map = MappedHashMap[str, int](self.path, "n", key_codec=STR, value_codec=INT)
+
+    def tearDown(self) -> None:
+        if not self.hash_map._buffer.closed:
+            self.hash_map.close()
+        self.directory.cleanup()
+
+    def test_put_get_remove(self):
+        """
+        Test inserting, updating, retrieving and removing key-value pairs.
+        """
+        self.hash_map.put("apple", 10)
+        self.hash_map.put("banana", 20)
+        self.hash_map.put("apple", 15)
+        self.hash_map.remove("banana")
+        self.hash_map.remove("missing")
+
+        self.assertEqual(self.hash_map.get("apple"), 15)
+        self.assertIsNone(self.hash_map.get("banana"))
+        self.assertEqual(self.hash_map.get("banana", -1), -1)
+        self.assertEqual(len(self.hash_map), 1)
+
+    def test_mapping_protocol(self):
+        """
+        Test the MutableMapping protocol: [], in, del and iteration.
+        """
+        self.hash_map["apple"] = 10
+        self.hash_map["banana"] = 20
+        del self.hash_map["banana"]
+
+        self.assertIsInstance(self.hash_map, MutableMapping)
+        self.assertIn("apple", self.hash_map)
+        self.assertNotIn("banana", self.hash_map)
+        self.assertEqual(dict(self.hash_map), {"apple": 10})
+        with self.assertRaises(KeyError):
+            self.hash_map["banana"]
+        with self.assertRaises(KeyError):
+            del self.hash_map["banana"]
+
+    def test_resize_and_reopen(self):
+        """
+        Test that the table grows past its initial capacity and the contents survive closing and reopening.
+        """
+        for i in range(5000):
+            self.hash_map.put(f"key{i}", i)
+        self.assertGreater(self.hash_map.capacity, 1024)
+        self.hash_map.close()
+
+        self.hash_map = MappedHashMap(self.path, "r", key_codec=STR, value_codec=INT)
+        self.assertEqual(len(self.hash_map), 5000)
+        self.assertEqual(self.hash_map.get("key4321"), 4321)
+        self.assertEqual(sorted(self.hash_map.values()), list(range(5000)))
+
+    def test_read_only(self):
+        """
+        Test that a map opened read-only rejects writes.
+        """
+        self.hash_map.put("apple", 10)
+        self.hash_map.flush()
+
+        reader = MappedHashMap(self.path, "r", key_codec=STR, value_codec=INT)
+        self.assertEqual(reader["apple"], 10)
+        with self.assertRaises(TypeError):
+            reader.put("banana", 20)
+        with self.assertRaises(TypeError):
+            reader.remove("apple")
+        reader.close()
+
+    def test_open_modes(self):
+        """
+        Test opening missing, existing and invalid files.
+        """
+        missing = os.path.join(self.directory.name, "missing.bin")
+        with self.assertRaises(FileNotFoundError):
+            MappedHashMap(missing, "r")
+        with self.assertRaises(ValueError):
+            MappedHashMap(missing, "x")
+
+        with MappedHashMap(missing) as created:
+            created.put(("a", 1), [1, 2, 3])
+        with MappedHashMap(missing, "w") as reopened:
+            self.assertEqual(reopened.get(("a", 1)), [1, 2, 3])
+
+        invalid = os.path.join(self.directory.name, "invalid.bin")
+        with open(invalid, "wb") as f:
+            f.write(b"\xff" * 4096)
+        with self.assertRaises(ValueError):
+            MappedHashMap(invalid, "r")
+
+    def test_recovery_after_crash(self):
+        """
+        Test that changes made after the last flush are rolled back when the file was not closed cleanly.
+        """
+        self.hash_map.put("apple", 10)
+        self.hash_map.put("banana", 20)
+        self.hash_map.flush()
+
+        self.hash_map.put("cherry", 30)
+        self.hash_map.remove("banana")
+        self.hash_map._buffer.flush()
+        self.hash_map._unmap()  # Simulate a crash: pages reach the disk but the header stays dirty
+
+        with MappedHashMap(self.path, "w", key_codec=STR, value_codec=INT) as recovered:
+            self.assertEqual(dict(recovered), {"apple": 10, "banana": 20})
+            recovered.put("cherry", 31)
+            self.assertEqual(recovered.get("cherry"), 31)
+
+        self.hash_map = MappedHashMap(self.path, "r", key_codec=STR, value_codec=INT)
+        self.assertEqual(dict(self.hash_map), {"apple": 10, "banana": 20, "cherry": 31})
+
+    def test_recovery_after_update(self):
+        """
+        Test that keys updated or removed after the last flush come back with their flushed values after a crash.
+        """
+        for i in range(20):
+            self.hash_map.put(f"k{i}", i)
+        self.hash_map.flush()
+        for i in range(5):
+            self.hash_map.put(f"k{i}", 100 + i)
+            self.hash_map.put(f"k{i}", 200 + i)
+        self.hash_map.remove("k5")
+        self.hash_map.put("new", 1)
+        self.hash_map._buffer.flush()
+
+        crashed = os.path.join(self.directory.name, "crashed.bin")
+        shutil.copyfile(self.path, crashed)  # Simulate a crash: a copy of the file with the header still dirty
+        expected = {f"k{i}": i for i in range(20)}
+
+        with MappedHashMap(crashed, "r", key_codec=STR, value_codec=INT) as recovered:
+            self.assertEqual(dict(recovered), expected)
+        with MappedHashMap(crashed, "w", key_codec=STR, value_codec=INT) as recovered:
+            self.assertEqual(dict(recovered), expected)
+            self.assertEqual(len(recovered), 20)
+            recovered.put("k0", -1)
+        with MappedHashMap(crashed, "r", key_codec=STR, value_codec=INT) as reopened:
+            self.assertEqual(reopened["k0"], -1)
+            self.assertEqual(reopened["k1"], 1)
+
+    def test_torn_header(self):
+        """
+        Test that a corrupted header copy falls back to the other copy, which describes the map before the last flush.
+        """
+        self.hash_map.put("apple", 10)
+        self.hash_map.flush()
+        self.hash_map.put("banana", 20)
+        self.hash_map.flush()
+        newest = (self.hash_map._generation % 2) * _HEADER_SIZE
+        self.hash_map._buffer[newest:newest + 8] = b"\x00" * 8
+        self.hash_map._unmap()
+
+        self.hash_map = MappedHashMap(self.path, "r", key_codec=STR, value_codec=INT)
+        self.assertEqual(dict(self.hash_map), {"apple": 10})
+
+    def test_compact(self):
+        """
+        Test that compact() shrinks the table and reclaims removed and replaced records.
+        """
+        for i in range(5000):
+            self.hash_map.put(f"key{i}", i)
+        for i in range(4990):
+            self.hash_map.remove(f"key{i}")
+        file_size = os.path.getsize(self.path)
+
+        self.hash_map.compact()
+        self.assertEqual(self.hash_map.capacity, 32)
+        self.assertLess(os.path.getsize(self.path), file_size)
+        self.assertEqual(sorted(self.hash_map.values()), list(range(4990, 5000)))
+
+    def test_codecs(self):
+        """
+        Test that the built-in codecs round-trip their values.
+        """
+        for codec, value in ((STR, "héllo"), (INT, -2 ** 63), (BYTES, b"\x00\x01"), (PICKLE, {"a": (1, 2)})):
+            self.assertEqual(codec.decode(codec.encode(value)), value)
+
+if __name__ == "__main__":
+    unittest.main()
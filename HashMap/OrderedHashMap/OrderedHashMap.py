@@ -0,0 +1,530 @@
+import secrets
+from array import array
+from itertools import islice
+from typing import TypeVar, List, Optional, Iterable, Iterator, Tuple, Union, Callable, Dict
+
+from HashMap.HashMap import HashMap, _MISSING, _MASK64
+
+K = TypeVar('K')
+V = TypeVar('V')
+
+"""
+Why split the table into dense entries and a sparse index?
+
+The chained HashMap iterates in bucket order, which changes whenever the table is resized. The compact layout used by
+CPython's dict keeps every entry in dense parallel arrays of hashes, keys and values, appended in insertion order, and
+resolves keys through a separate table of small integers holding positions in those arrays:
+
+- Iteration walks the dense arrays, so entries come out in insertion order and a full scan touches no empty slots.
+- The index table is the only part sized for the load factor, and its integers are 1, 2, 4 or 8 bytes wide depending on
+  the capacity, so empty slots cost far less than a list slot or a per-entry tuple.
+- Removing an entry marks its position deleted and leaves a dummy in its index slot, so probe sequences stay intact.
+  Deleted positions and dummies are dropped whenever the table is rebuilt.
+
+popitem() and move_to_end() work at either end of the dense arrays in amortized O(1). Moving an entry to the front needs
+free positions before the first entry, so the first such move rebuilds the arrays with headroom at the front, which
+every later rebuild keeps.
+"""
+
+_FREE = -1  # Index slot that has never been used, which ends a probe sequence
+_DUMMY = -2  # Index slot whose entry was removed, which probe sequences must skip
+_DELETED = object()  # Key of a dense position whose entry was removed or moved
+
+_PERTURB_SHIFT = 5
+
+# The narrowest array typecode able to hold every position of a table of up to that many slots
+_INDEX_TYPES = [(1 << (8 * array(typecode).itemsize - 1), typecode) for typecode in "bhiq"]
+
+
+class OrderedHashMap(HashMap[K, V]):
+    """
+    An insertion-ordered HashMap storing entries in dense parallel arrays, looked up through a sparse index table.
+    """
+
+    def __init__(
+        self,
+        capacity: int = 10,
+        engine: str = "ordered",
+        randomize_hash: bool = False,
+        max_load_factor: float = 0.7,
+        min_load_factor: float = 0.0,
+        on_resize: Optional[Callable[[int, int, float], None]] = None,
+    ) -> None:
+        """
+        Initialize the OrderedHashMap with a given capacity.
+
+        :param capacity: The initial number of index slots, rounded up to a power of two. Defaults to 10.
+        :param engine: The storage engine. Only "ordered" is accepted.
+        :param randomize_hash: Mix a random per-instance seed into every hash code to resist hash flooding.
+        :param max_load_factor: Rebuild the table when the used index slots or dense positions would exceed this
+            fraction of the capacity. Must be below 1 so that every probe sequence reaches a free slot. Defaults to 0.7.
+        :param min_load_factor: Shrink the table when a removal drops size / capacity below this value.
+            Defaults to 0.0, which never shrinks automatically.
+        :param on_resize: A callback invoked after every rebuild with the old capacity, the new capacity and the
+            duration of the rebuild in seconds.
+        """
+        if engine != "ordered":
+            raise ValueError(f"Unknown engine: {engine!r}")
+        self._validate_load_factors(max_load_factor, min_load_factor)
+        if max_load_factor >= 1:
+            raise ValueError("max_load_factor must be below 1 for open addressing")
+
+        self.engine = engine
+        self.size = 0
+        self.max_load_factor = max_load_factor
+        self.min_load_factor = min_load_factor
+        self._hash_seed = secrets.randbits(64) | 1 if randomize_hash else 0
+        self._grows_front = False  # Set by the first move_to_end(last=False) that runs out of headroom
+        self._min_capacity = self._round_capacity(capacity)
+        self._allocate(self._min_capacity)
+
+        self.on_resize = on_resize
+        self._resize_count = 0
+        self._resize_time = 0.0
+
+    @staticmethod
+    def _round_capacity(capacity: int) -> int:
+        """
+        Round a capacity up to the next power of two so that slot indices can be computed with a mask.
+
+        :param capacity: The requested capacity.
+        :return: The smallest power of two greater than or equal to the capacity (at least 8).
+        """
+        rounded = 8
+        while rounded < capacity:
+            rounded *= 2
+        return rounded
+
+    def _allocate(self, capacity: int) -> None:
+        """
+        Replace the index table with an empty table of the given capacity, and the dense arrays with empty arrays.
+
+        :param capacity: The number of index slots, which must be a power of two.
+        """
+        typecode = next(typecode for limit, typecode in _INDEX_TYPES if capacity <= limit)
+        self.capacity = capacity
+        self._mask = capacity - 1
+        self._indices = array(typecode, [_FREE]) * capacity
+        self._hashes = array('q')
+        self._keys: List[object] = []
+        self._values: List[Optional[V]] = []
+        self._start = 0  # Dense positions before _start are headroom for move_to_end(last=False)
+        self._tombstones = 0
+
+    def _headroom(self) -> int:
+        """
+        Get the number of free positions a rebuild leaves before the first entry.
+
+        :return: The size of the map once entries have been moved to the front, 0 otherwise.
+        """
+        return self.size if self._grows_front else 0
+
+    def _is_full(self) -> bool:
+        """
+        Check whether adding an entry would push the used index slots or dense positions past the load factor.
+
+        :return: True if the table must be rebuilt before the next insertion.
+        """
+        return max(len(self._keys), self.size + self._tombstones) + 1 > self.capacity * self.max_load_factor
+
+    def _lookup(self, key: K, key_hash: int) -> Tuple[int, int]:
+        """
+        Find the index slot and dense position of a key.
+
+        :param key: The key to look up.
+        :param key_hash: The hash of the key.
+        :return: The index slot and the dense position of the key, or (-1, -1) if the key is not in the map.
+        """
+        indices = self._indices
+        hashes = self._hashes
+        keys = self._keys
+        mask = self._mask
+        perturb = key_hash & _MASK64
+        slot = perturb & mask
+
+        while True:
+            position = indices[slot]
+            if position == _FREE:
+                return -1, -1
+
+            if position >= 0 and hashes[position] == key_hash:
+                slot_key = keys[position]
+                if slot_key is key or slot_key == key:
+                    return slot, position
+
+            # CPython's probe sequence: the higher hash bits take part until they are shifted out
+            perturb >>= _PERTURB_SHIFT
+            slot = (slot * 5 + perturb + 1) & mask
+
+    def _free_slot(self, key_hash: int) -> int:
+        """
+        Find the first free or dummy index slot of a hash's probe sequence.
+
+        :param key_hash: The hash of a key that is not in the map.
+        :return: The index slot.
+        """
+        indices = self._indices
+        mask = self._mask
+        perturb = key_hash & _MASK64
+        slot = perturb & mask
+
+        while indices[slot] >= 0:
+            perturb >>= _PERTURB_SHIFT
+            slot = (slot * 5 + perturb + 1) & mask
+
+        return slot
+
+    def _slot_of(self, key_hash: int, position: int) -> int:
+        """
+        Find the index slot pointing at a dense position.
+
+        :param key_hash: The hash of the entry at the position.
+        :param position: The dense position.
+        :return: The index slot.
+        """
+        indices = self._indices
+        mask = self._mask
+        perturb = key_hash & _MASK64
+        slot = perturb & mask
+
+        while indices[slot] != position:
+            perturb >>= _PERTURB_SHIFT
+            slot = (slot * 5 + perturb + 1) & mask
+
+        return slot
+
+    def _append(self, key_hash: int, key: K, value: V) -> None:
+        """
+        Append an entry that is known not to be in the map. The caller must have checked that there is room.
+
+        :param key_hash: The hash of the key.
+        :param key: The key to insert.
+        :param value: The value associated with the key.
+        """
+        slot = self._free_slot(key_hash)
+        if self._indices[slot] == _DUMMY:
+            self._tombstones -= 1
+
+        self._indices[slot] = len(self._keys)
+        self._hashes.append(key_hash)
+        self._keys.append(key)
+        self._values.append(value)
+
+    def _delete(self, slot: int, position: int) -> None:
+        """
+        Remove the entry at a dense position, leaving a dummy in its index slot.
+
+        :param slot: The index slot pointing at the position.
+        :param position: The dense position.
+        """
+        self._indices[slot] = _DUMMY
+        self._keys[position] = _DELETED
+        self._values[position] = None
+        self._tombstones += 1
+        self.size -= 1
+
+    def _insert(self, key: K, value: V) -> bool:
+        """
+        Insert or update a key-value pair without checking the load factor. The caller must have reserved room.
+
+        :param key: The key to insert.
+        :param value: The value associated with the key.
+        :return: True if a new key was added, False if an existing key was updated.
+        """
+        key_hash = self._hash(key)
+        position = self._lookup(key, key_hash)[1]
+        if position != -1:
+            self._values[position] = value
+            return False
+
+        self._append(key_hash, key, value)
+        self.size += 1
+        return True
+
+    def put(self, key: K, value: V) -> None:
+        """
+        Insert or update a key-value pair in the OrderedHashMap. Updating a key keeps its position in the order.
+
+        :param key: The key to insert.
+        :param value: The value associated with the key.
+        """
+        key_hash = self._hash(key)
+        position = self._lookup(key, key_hash)[1]
+        if position != -1:
+            self._values[position] = value  # Update the value
+            return
+
+        if self._is_full():
+            self._resize()
+
+        self._append(key_hash, key, value)
+        self.size += 1
+
+    def _find_value(self, key: K) -> Union[V, object]:
+        """
+        Look up the value of a key with a single probe.
+
+        :param key: The key to look up.
+        :return: The value associated with the key, or _MISSING if the key does not exist.
+        """
+        position = self._lookup(key, self._hash(key))[1]
+        if position == -1:
+            return _MISSING
+        return self._values[position]
+
+    def get_or_insert(self, key: K, factory: Callable[[], V]) -> V:
+        """
+        Retrieve the value associated with a key, inserting factory() first if the key does not exist.
+
+        :param key: The key to look up.
+        :param factory: A callable producing the value to insert for a missing key.
+        :return: The existing or newly inserted value.
+        """
+        key_hash = self._hash(key)
+        position = self._lookup(key, key_hash)[1]
+        if position != -1:
+            return self._values[position]
+
+        value = factory()
+        if self._is_full():
+            self._resize()
+
+        self._append(key_hash, key, value)
+        self.size += 1
+        return value
+
+    def _discard(self, key: K) -> bool:
+        """
+        Remove a key, leaving a dummy in its index slot, without checking the low-water mark.
+
+        :param key: The key to remove.
+        :return: True if the key was present and removed, False otherwise.
+        """
+        slot, position = self._lookup(key, self._hash(key))
+        if slot == -1:
+            return False
+
+        self._delete(slot, position)
+        return True
+
+    def popitem(self, last: bool = True) -> Tuple[K, V]:
+        """
+        Remove and return the most recently inserted key-value pair, or the oldest one.
+
+        :param last: Remove the last pair in iteration order if True (default), the first one otherwise.
+        :return: The removed key-value pair.
+        :raises KeyError: If the map is empty.
+        """
+        if not self.size:
+            raise KeyError("popitem(): OrderedHashMap is empty")
+
+        keys = self._keys
+        if last:
+            while keys[-1] is _DELETED:
+                self._hashes.pop()
+                keys.pop()
+                self._values.pop()
+            position = len(keys) - 1
+        else:
+            while keys[self._start] is _DELETED:
+                self._start += 1
+            position = self._start
+
+        key, value = keys[position], self._values[position]
+        self._delete(self._slot_of(self._hashes[position], position), position)
+
+        # Positions freed at either end are reused: by the next append, or as headroom before the first entry
+        if last:
+            self._hashes.pop()
+            keys.pop()
+            self._values.pop()
+        else:
+            self._start += 1
+
+        self._maybe_shrink()
+        return key, value
+
+    def move_to_end(self, key: K, last: bool = True) -> None:
+        """
+        Move an existing key to either end of the iteration order.
+
+        :param key: The key to move.
+        :param last: Move the key to the end if True (default), to the front otherwise.
+        :raises KeyError: If the key does not exist.
+        """
+        key_hash = self._hash(key)
+        slot, position = self._lookup(key, key_hash)
+        if slot == -1:
+            raise KeyError(key)
+
+        if last:
+            if position == len(self._keys) - 1:
+                return
+            if len(self._keys) + 1 > self.capacity * self.max_load_factor:
+                self._resize()
+                slot, position = self._lookup(key, key_hash)
+
+            target = len(self._keys)
+            self._hashes.append(key_hash)
+            self._keys.append(key)
+            self._values.append(self._values[position])
+        else:
+            if position == self._start:
+                return
+            if self._start == 0:
+                self._grows_front = True
+                self._resize()
+                slot, position = self._lookup(key, key_hash)
+
+            self._start -= 1
+            target = self._start
+            self._hashes[target] = key_hash
+            self._keys[target] = key
+            self._values[target] = self._values[position]
+
+        self._keys[position] = _DELETED
+        self._values[position] = None
+        self._indices[slot] = target
+
+    def _iter_values(self) -> Iterator[V]:
+        """
+        Iterate over the values in insertion order without building an intermediate list.
+
+        :return: An iterator over the values.
+        """
+        values = self._values
+        for position, key in enumerate(islice(self._keys, self._start, None), self._start):
+            if key is not _DELETED:
+                yield values[position]
+
+    def _iter_items(self) -> Iterator[Tuple[K, V]]:
+        """
+        Iterate over the key-value pairs in insertion order without building an intermediate list.
+
+        :return: An iterator over the key-value pairs.
+        """
+        for key, value in zip(islice(self._keys, self._start, None), islice(self._values, self._start, None)):
+            if key is not _DELETED:
+                yield key, value
+
+    def __iter__(self) -> Iterator[K]:
+        """
+        Iterate over the keys in insertion order without building an intermediate list.
+
+        :return: An iterator over the keys.
+        """
+        for key in islice(self._keys, self._start, None):
+            if key is not _DELETED:
+                yield key
+
+    def __reversed__(self) -> Iterator[K]:
+        """
+        Iterate over the keys in reverse insertion order.
+
+        :return: An iterator over the keys, newest first.
+        """
+        keys = self._keys
+        for position in range(len(keys) - 1, self._start - 1, -1):
+            key = keys[position]
+            if key is not _DELETED:
+                yield key
+
+    def clear(self) -> None:
+        """
+        Remove every key-value pair, keeping the current capacity.
+        """
+        self._allocate(self.capacity)
+        self.size = 0
+
+    def rehash_step(self, n: int = 1) -> bool:
+        """
+        Ordered tables are always rebuilt in a single pass, so there is never a migration in progress.
+
+        :param n: Ignored.
+        :return: Always False.
+        """
+        return False
+
+    def _rebuild(self, new_capacity: Optional[int] = None) -> None:
+        """
+        Rebuild the index table and the dense arrays, dropping dummies and deleted positions while keeping the order.
+
+        :param new_capacity: The capacity to rebuild with. By default the capacity is doubled until the entries and
+            their headroom fill at most half of max_load_factor, so a table of mostly deleted entries keeps its size.
+            An explicit capacity is raised if the entries and headroom would not fit.
+        """
+        headroom = self._headroom()
+        needed = headroom + self.size + 1
+        if new_capacity is None:
+            new_capacity = self.capacity
+            while needed / new_capacity > self.max_load_factor / 2:
+                new_capacity *= 2
+        while needed / new_capacity > self.max_load_factor:
+            new_capacity *= 2
+
+        live = [position for position, key in enumerate(islice(self._keys, self._start, None), self._start)
+                if key is not _DELETED]
+        hashes, keys, values = self._hashes, self._keys, self._values
+        self._allocate(new_capacity)
+
+        self._hashes = array('q', bytes(8 * headroom))
+        self._hashes.extend(hashes[position] for position in live)
+        self._keys = [_DELETED] * headroom + [keys[position] for position in live]
+        self._values = [None] * headroom + [values[position] for position in live]
+        self._start = headroom
+
+        # Stored hashes are reused, so keys are never re-hashed
+        indices = self._indices
+        for position in range(headroom, len(self._keys)):
+            indices[self._free_slot(self._hashes[position])] = position
+
+    def stats(self) -> Dict[str, object]:
+        """
+        Report how the dense arrays and the index table are used, and how much time has been spent rebuilding.
+
+        :return: A dictionary with the size, capacity, load_factor, resize_count and resize_time (in seconds), plus:
+            - deleted_entries: the number of dense positions left behind by removed or moved entries
+            - tombstones: the number of index slots holding a dummy
+            - index_bytes: the size of the index table in bytes
+        """
+        stats = self._base_stats()
+        stats.update({
+            "deleted_entries": len(self._keys) - self._start - self.size,
+            "tombstones": self._tombstones,
+            "index_bytes": self.capacity * self._indices.itemsize,
+        })
+        return stats
+
+    def _reserve(self, expected_size: int) -> None:
+        """
+        Rebuild the table once so that expected_size entries fit without exceeding the load factor.
+
+        :param expected_size: The number of entries the table should hold.
+        """
+        added = expected_size - self.size
+        if max(len(self._keys), self.size + self._tombstones) + added + 1 <= self.capacity * self.max_load_factor:
+            return
+
+        capacity = self.capacity
+        while (self._headroom() + expected_size + 1) / capacity > self.max_load_factor:
+            capacity *= 2
+        self._resize(capacity)
+
+    def get_many(self, keys: Iterable[K]) -> List[Optional[V]]:
+        """
+        Retrieve the values associated with many keys.
+
+        :param keys: The keys to look up.
+        :return: The values in the same order as the keys, with None for keys that do not exist.
+        """
+        lookup = self._lookup
+        hash_key = self._hash
+        values = self._values
+        results: List[Optional[V]] = []
+        append = results.append
+
+        for key in keys:
+            position = lookup(key, hash_key(key))[1]
+            append(None if position == -1 else values[position])
+
+        return results
@@ -0,0 +1,157 @@
+import random
+import unittest
+from collections import OrderedDict
+from collections.abc import MutableMapping
+
+from HashMap.HashMap import HashMap
+from HashMap.OrderedHashMap.OrderedHashMap import OrderedHashMap
+
+
+class CollidingKey:
+    def __init__(self, value):
+        self.value = value
+
+    def __hash__(self):
+        # Force collision by returning the same hash for all keys
+        return 42
+
+    def __eq__(self, other):
+        return isinstance(other, CollidingKey) and self.value == other.value
+
+
+class TestOrderedHashMap(unittest.TestCase):
+    def setUp(self) -> None:
+        """
+        Set up an OrderedHashMap instance for testing.
+        """
+        self.hash_map = HashMap[str, int](engine="ordered")
+
+    def test_engine_selection(self):
+        """
+        Test that the engine keyword selects the ordered implementation.
+        """
+        self.assertIsInstance(self.hash_map, OrderedHashMap)
+        self.assertIsInstance(HashMap(16, "ordered"), OrderedHashMap)
+        self.assertIsInstance(self.hash_map, MutableMapping)
+
+    def test_put_get_remove(self):
+        """
+        Test inserting, updating, retrieving and removing key-value pairs.
+        """
+        self.hash_map.put("apple", 10)
+        self.hash_map.put("banana", 20)
+        self.hash_map.put("apple", 15)
+        self.hash_map.remove("banana")
+        self.hash_map.remove("missing")
+
+        self.assertEqual(self.hash_map.get("apple"), 15)
+        self.assertIsNone(self.hash_map.get("banana"))
+        self.assertEqual(len(self.hash_map), 1)
+        self.assertEqual(self.hash_map.stats()["tombstones"], 1)
+
+    def test_insertion_order_survives_resize(self):
+        """
+        Test that iteration follows insertion order through resizes, updates and removals.
+        """
+        keys = [f"key-{i}" for i in random.Random(0).sample(range(10_000), 1000)]
+        for i, key in enumerate(keys):
+            self.hash_map[key] = i
+        self.hash_map[keys[0]] = -1
+        for key in keys[::3]:
+            del self.hash_map[key]
+
+        expected = [key for i, key in enumerate(keys) if i % 3]
+        self.assertGreater(self.hash_map.stats()["resize_count"], 0)
+        self.assertEqual(list(self.hash_map), expected)
+        self.assertEqual(list(reversed(self.hash_map)), expected[::-1])
+        self.assertEqual(list(self.hash_map.values()), [keys.index(key) for key in expected])
+
+    def test_popitem(self):
+        """
+        Test removing the newest and oldest entries.
+        """
+        for i, key in enumerate("abcde"):
+            self.hash_map[key] = i
+        del self.hash_map["e"]
+
+        self.assertEqual(self.hash_map.popitem(), ("d", 3))
+        self.assertEqual(self.hash_map.popitem(last=False), ("a", 0))
+        self.hash_map["f"] = 5
+        self.assertEqual(list(self.hash_map.items()), [("b", 1), ("c", 2), ("f", 5)])
+
+        self.hash_map.clear()
+        with self.assertRaises(KeyError):
+            self.hash_map.popitem()
+
+    def test_move_to_end(self):
+        """
+        Test moving keys to either end of the order.
+        """
+        for i, key in enumerate("abcd"):
+            self.hash_map[key] = i
+
+        self.hash_map.move_to_end("b")
+        self.assertEqual(list(self.hash_map), ["a", "c", "d", "b"])
+        self.hash_map.move_to_end("d", last=False)
+        self.hash_map.move_to_end("c", last=False)
+        self.assertEqual(list(self.hash_map), ["c", "d", "a", "b"])
+        self.assertEqual(self.hash_map["d"], 3)
+
+        with self.assertRaises(KeyError):
+            self.hash_map.move_to_end("missing")
+
+    def test_matches_ordered_dict(self):
+        """
+        Test a random mix of operations against collections.OrderedDict, including colliding keys.
+        """
+        rng = random.Random(1)
+        expected = OrderedDict()
+        hash_map = OrderedHashMap(min_load_factor=0.1)
+        pool = [f"key-{i}" for i in range(60)] + [CollidingKey(i) for i in range(20)]
+
+        for _ in range(5000):
+            key = rng.choice(pool)
+            operation = rng.randrange(6)
+            if operation < 2:
+                expected[key] = hash_map[key] = rng.randrange(100)
+            elif operation == 2 and key in expected:
+                del expected[key]
+                del hash_map[key]
+            elif operation == 3 and key in expected:
+                last = rng.random() < 0.5
+                expected.move_to_end(key, last)
+                hash_map.move_to_end(key, last)
+            elif operation == 4 and expected:
+                last = rng.random() < 0.5
+                self.assertEqual(hash_map.popitem(last), expected.popitem(last))
+            self.assertEqual(len(hash_map), len(expected))
+
+        self.assertEqual(list(hash_map.items()), list(expected.items()))
+        self.assertEqual([key in hash_map for key in pool], [key in expected for key in pool])
+
+    def test_index_width(self):
+        """
+        Test that the index table uses the narrowest integers able to hold every position.
+        """
+        self.assertEqual(self.hash_map._indices.itemsize, 1)
+        self.hash_map.put_many((f"key-{i}", i) for i in range(1000))
+        self.assertEqual(self.hash_map._indices.itemsize, 2)
+        self.assertEqual(self.hash_map.stats()["index_bytes"], 2 * self.hash_map.capacity)
+
+    def test_compact(self):
+        """
+        Test that compact() drops deleted positions while keeping the order.
+        """
+        for i in range(100):
+            self.hash_map[f"key-{i}"] = i
+        for i in range(0, 100, 2):
+            del self.hash_map[f"key-{i}"]
+
+        self.hash_map.compact()
+        stats = self.hash_map.stats()
+        self.assertEqual((stats["deleted_entries"], stats["tombstones"]), (0, 0))
+        self.assertEqual(list(self.hash_map), [f"key-{i}" for i in range(1, 100, 2)])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,444 @@
+from typing import TypeVar, List, Optional, Iterable, Iterator, Tuple, Union, Type, Mapping, Any
+
+from HashMap.HashMap import HashMap, _MISSING, _MASK64, _HashMapValuesView, _HashMapItemsView
+
+K = TypeVar('K')
+V = TypeVar('V')
+
+Entry = Tuple[int, K, V]  # (hash code, key, value)
+Child = Union[Entry, '_BitmapNode', '_CollisionNode']
+
+"""
+Why a hash array mapped trie?
+
+Taking a consistent snapshot of a mutable HashMap means copying it, which costs O(n) time and memory every time. A
+PersistentHashMap is never modified: put and remove return a new version of the map, and every version stays valid.
+Versions share all of their structure except the nodes on the path to the changed key, so keeping an old version
+(a snapshot) costs nothing, and an update costs O(log32 n).
+
+The map is a hash array mapped trie (HAMT). Each level consumes 5 bits of the key's hash code and holds up to 32
+children in a compact list, with a 32-bit bitmap recording which of the 32 possible children are present. A child is
+either an entry, stored as a (hash, key, value) triple like in HashMap, or a node one level down. Keys whose full hash
+codes are equal end up in a collision node, which is searched linearly.
+
+put_many, remove_many and from_items apply a whole batch under a fresh edit token: nodes created during the batch carry
+the token and are updated in place by later operations of the same batch, so a bulk load does not copy a path per key.
+Once the batch returns, the token is unreachable and those nodes are as immutable as any other.
+"""
+
+_BITS = 5
+_MASK = (1 << _BITS) - 1
+
+_popcount = getattr(int, "bit_count", None) or (lambda x: bin(x).count("1"))
+
+
+def _merge(shift: int, first: Entry, second: Entry, edit: Optional[object]) -> '_Node':
+    """
+    Build the smallest subtree holding two entries with different keys.
+
+    :param shift: The hash bit offset of the level the subtree starts at.
+    :param first: An entry.
+    :param second: Another entry.
+    :param edit: The edit token of the running batch, or None.
+    :return: A node holding both entries.
+    """
+    if first[0] == second[0]:
+        return _CollisionNode(first[0], [first, second], edit)
+
+    first_index = (first[0] >> shift) & _MASK
+    second_index = (second[0] >> shift) & _MASK
+    if first_index == second_index:
+        return _BitmapNode(1 << first_index, [_merge(shift + _BITS, first, second, edit)], edit)
+    if first_index > second_index:
+        first, second = second, first
+    return _BitmapNode((1 << first_index) | (1 << second_index), [first, second], edit)
+
+
+class _BitmapNode:
+    """
+    A trie node holding up to 32 children, indexed by 5 bits of the hash code and stored compactly behind a bitmap.
+    """
+    __slots__ = ("bitmap", "children", "edit")
+
+    def __init__(self, bitmap: int, children: List[Child], edit: Optional[object] = None):
+        self.bitmap = bitmap
+        self.children = children
+        self.edit = edit
+
+    def _editable(self, edit: Optional[object]) -> '_BitmapNode':
+        """
+        Get a node that may be modified under an edit token: this node if the token created it, a copy otherwise.
+
+        :param edit: The edit token of the running batch, or None.
+        :return: A node with the same children that the caller may modify.
+        """
+        if edit is not None and self.edit is edit:
+            return self
+        return _BitmapNode(self.bitmap, self.children[:], edit)
+
+    def find(self, shift: int, key_hash: int, key: K) -> Union[V, object]:
+        bit = 1 << ((key_hash >> shift) & _MASK)
+        if not self.bitmap & bit:
+            return _MISSING
+
+        child = self.children[_popcount(self.bitmap & (bit - 1))]
+        if type(child) is tuple:
+            if child[0] == key_hash and (child[1] is key or child[1] == key):
+                return child[2]
+            return _MISSING
+        return child.find(shift + _BITS, key_hash, key)
+
+    def put(self, shift: int, key_hash: int, key: K, value: V, edit: Optional[object]) -> Tuple['_Node', bool]:
+        """
+        Insert or update an entry.
+
+        :return: The updated node (self if nothing changed) and whether a new key was added.
+        """
+        bit = 1 << ((key_hash >> shift) & _MASK)
+        position = _popcount(self.bitmap & (bit - 1))
+
+        if not self.bitmap & bit:
+            node = self._editable(edit)
+            node.bitmap |= bit
+            node.children.insert(position, (key_hash, key, value))
+            return node, True
+
+        child = self.children[position]
+        if type(child) is tuple:
+            if child[0] == key_hash and (child[1] is key or child[1] == key):
+                if child[2] is value:
+                    return self, False
+                new_child, added = (key_hash, child[1], value), False
+            else:
+                new_child, added = _merge(shift + _BITS, child, (key_hash, key, value), edit), True
+        else:
+            new_child, added = child.put(shift + _BITS, key_hash, key, value, edit)
+            if new_child is child:
+                return self, added
+
+        node = self._editable(edit)
+        node.children[position] = new_child
+        return node, added
+
+    def remove(self, shift: int, key_hash: int, key: K, edit: Optional[object]) -> Tuple[Optional[Child], bool]:
+        """
+        Remove an entry.
+
+        :return: The updated node (self if the key was not found), a single remaining entry to be stored in the
+            parent, or None if the node is empty; and whether the key was removed.
+        """
+        bit = 1 << ((key_hash >> shift) & _MASK)
+        if not self.bitmap & bit:
+            return self, False
+
+        position = _popcount(self.bitmap & (bit - 1))
+        child = self.children[position]
+        if type(child) is tuple:
+            if child[0] != key_hash or not (child[1] is key or child[1] == key):
+                return self, False
+            new_child = None
+        else:
+            new_child, removed = child.remove(shift + _BITS, key_hash, key, edit)
+            if not removed:
+                return self, False
+
+        if new_child is None:
+            if self.bitmap == bit:
+                return None, True
+            if shift and len(self.children) == 2 and type(self.children[1 - position]) is tuple:
+                return self.children[1 - position], True  # Collapse a lone entry into the parent
+            node = self._editable(edit)
+            node.bitmap ^= bit
+            del node.children[position]
+            return node, True
+
+        if shift and len(self.children) == 1 and type(new_child) is tuple:
+            return new_child, True
+        node = self._editable(edit)
+        node.children[position] = new_child
+        return node, True
+
+    def __iter__(self) -> Iterator[Entry]:
+        for child in self.children:
+            if type(child) is tuple:
+                yield child
+            else:
+                yield from child
+
+
+class _CollisionNode:
+    """
+    A trie node holding entries whose keys have the same full hash code.
+    """
+    __slots__ = ("key_hash", "entries", "edit")
+
+    def __init__(self, key_hash: int, entries: List[Entry], edit: Optional[object] = None):
+        self.key_hash = key_hash
+        self.entries = entries
+        self.edit = edit
+
+    def _index(self, key: K) -> int:
+        for index, entry in enumerate(self.entries):
+            if entry[1] is key or entry[1] == key:
+                return index
+        return -1
+
+    def find(self, shift: int, key_hash: int, key: K) -> Union[V, object]:
+        if key_hash != self.key_hash:
+            return _MISSING
+        index = self._index(key)
+        return _MISSING if index == -1 else self.entries[index][2]
+
+    def put(self, shift: int, key_hash: int, key: K, value: V, edit: Optional[object]) -> Tuple['_Node', bool]:
+        if key_hash != self.key_hash:
+            # A key with a different hash reached this level: push the collision node down one level next to it
+            node = _BitmapNode(1 << ((self.key_hash >> shift) & _MASK), [self], edit)
+            return node.put(shift, key_hash, key, value, edit)
+
+        index = self._index(key)
+        if index != -1 and self.entries[index][2] is value:
+            return self, False
+
+        node = self if edit is not None and self.edit is edit else _CollisionNode(key_hash, self.entries[:], edit)
+        if index == -1:
+            node.entries.append((key_hash, key, value))
+            return node, True
+        node.entries[index] = (key_hash, self.entries[index][1], value)
+        return node, False
+
+    def remove(self, shift: int, key_hash: int, key: K, edit: Optional[object]) -> Tuple[Optional[Child], bool]:
+        index = self._index(key) if key_hash == self.key_hash else -1
+        if index == -1:
+            return self, False
+        if len(self.entries) == 2:
+            return self.entries[1 - index], True
+
+        node = self if edit is not None and self.edit is edit else _CollisionNode(key_hash, self.entries[:], edit)
+        del node.entries[index]
+        return node, True
+
+    def __iter__(self) -> Iterator[Entry]:
+        return iter(self.entries)
+
+
+_Node = Union[_BitmapNode, _CollisionNode]
+
+_EMPTY_ROOT = _BitmapNode(0, [])
+
+
+class PersistentHashMap(Mapping[K, V]):
+    """
+    An immutable HashMap whose put and remove return new versions that share structure with the old one.
+    """
+    __slots__ = ("_root", "size")
+
+    def __init__(self, items: Optional[Iterable[Tuple[K, V]]] = None) -> None:
+        """
+        Initialize the PersistentHashMap.
+
+        :param items: The key-value pairs to start with. Defaults to an empty map.
+        """
+        self._root = _EMPTY_ROOT
+        self.size = 0
+        if items is not None:
+            self._root, self.size = self._apply_puts(items)
+
+    @classmethod
+    def _version(cls: Type['PersistentHashMap[K, V]'], root: _BitmapNode, size: int) -> 'PersistentHashMap[K, V]':
+        """
+        Wrap a root node in a new map without copying it.
+        """
+        version = cls.__new__(cls)
+        version._root = root
+        version.size = size
+        return version
+
+    @staticmethod
+    def _key_hash(key: K) -> int:
+        """
+        Compute the hash code of a key as an unsigned 64-bit integer, so every level sees non-negative bits.
+
+        :param key: The key to hash.
+        :return: The hash code of the key.
+        """
+        return hash(key) & _MASK64
+
+    def _apply_puts(self, items: Iterable[Tuple[K, V]]) -> Tuple[_BitmapNode, int]:
+        """
+        Insert a batch of key-value pairs into the root under a fresh edit token.
+
+        :param items: The key-value pairs to insert.
+        :return: The new root and size.
+        """
+        edit = object()
+        root, size = self._root, self.size
+        key_hash = self._key_hash
+        for key, value in items:
+            root, added = root.put(0, key_hash(key), key, value, edit)
+            size += added
+        return root, size
+
+    def put(self, key: K, value: V) -> 'PersistentHashMap[K, V]':
+        """
+        Insert or update a key-value pair.
+
+        :param key: The key to insert.
+        :param value: The value associated with the key.
+        :return: A new version of the map holding the pair, or this map if it already maps key to value.
+        """
+        root, added = self._root.put(0, self._key_hash(key), key, value, None)
+        if root is self._root:
+            return self
+        return self._version(root, self.size + added)
+
+    def get(self, key: K, default: Optional[V] = None) -> Optional[V]:
+        """
+        Retrieve the value associated with a key.
+
+        :param key: The key to look up.
+        :param default: The value to return if the key does not exist. Defaults to None.
+        :return: The value associated with the key, or default if the key does not exist.
+        """
+        value = self._root.find(0, self._key_hash(key), key)
+        return default if value is _MISSING else value
+
+    def remove(self, key: K) -> 'PersistentHashMap[K, V]':
+        """
+        Remove a key-value pair.
+
+        :param key: The key to remove.
+        :return: A new version of the map without the key, or this map if the key does not exist.
+        """
+        root, removed = self._root.remove(0, self._key_hash(key), key, None)
+        if not removed:
+            return self
+        return self._version(_EMPTY_ROOT if root is None else root, self.size - 1)
+
+    def put_many(self, items: Iterable[Tuple[K, V]]) -> 'PersistentHashMap[K, V]':
+        """
+        Insert or update many key-value pairs, copying each changed node at most once.
+
+        :param items: The key-value pairs to insert.
+        :return: A new version of the map holding the pairs.
+        """
+        root, size = self._apply_puts(items)
+        return self if root is self._root else self._version(root, size)
+
+    def remove_many(self, keys: Iterable[K]) -> 'PersistentHashMap[K, V]':
+        """
+        Remove many keys, copying each changed node at most once.
+
+        :param keys: The keys to remove.
+        :return: A new version of the map without the keys.
+        """
+        edit = object()
+        root, size = self._root, self.size
+        key_hash = self._key_hash
+        for key in keys:
+            new_root, removed = root.remove(0, key_hash(key), key, edit)
+            if removed:
+                root = _EMPTY_ROOT if new_root is None else new_root
+                size -= 1
+        return self if root is self._root else self._version(root, size)
+
+    @classmethod
+    def from_items(cls: Type['PersistentHashMap[K, V]'], items: Iterable[Tuple[K, V]]) -> 'PersistentHashMap[K, V]':
+        """
+        Build a PersistentHashMap from key-value pairs.
+
+        :param items: The key-value pairs to insert.
+        :return: A new PersistentHashMap containing the items.
+        """
+        return cls(items)
+
+    @classmethod
+    def from_hash_map(cls: Type['PersistentHashMap[K, V]'], hash_map: HashMap[K, V]) -> 'PersistentHashMap[K, V]':
+        """
+        Build a PersistentHashMap holding the entries of a HashMap, streaming them without intermediate lists.
+
+        :param hash_map: The HashMap to copy.
+        :return: A new PersistentHashMap containing the same entries.
+        """
+        return cls(hash_map.items())
+
+    def to_hash_map(self, **kwargs: Any) -> HashMap[K, V]:
+        """
+        Copy the entries into a new, mutable HashMap sized for them up front.
+
+        :param kwargs: Additional HashMap constructor arguments, such as engine.
+        :return: A new HashMap containing the same entries.
+        """
+        return HashMap.from_items(self.items(), expected_size=self.size, **kwargs)
+
+    def _iter_values(self) -> Iterator[V]:
+        """
+        Iterate over the values without building an intermediate list.
+
+        :return: An iterator over the values.
+        """
+        for entry in self._root:
+            yield entry[2]
+
+    def _iter_items(self) -> Iterator[Tuple[K, V]]:
+        """
+        Iterate over the key-value pairs without building an intermediate list.
+
+        :return: An iterator over the key-value pairs.
+        """
+        for _, key, value in self._root:
+            yield key, value
+
+    def values(self) -> _HashMapValuesView:
+        """
+        Get a lazy view of the values.
+
+        :return: A view that streams the values from the trie.
+        """
+        return _HashMapValuesView(self)
+
+    def items(self) -> _HashMapItemsView:
+        """
+        Get a lazy view of the key-value pairs.
+
+        :return: A view that streams the key-value pairs from the trie.
+        """
+        return _HashMapItemsView(self)
+
+    def __iter__(self) -> Iterator[K]:
+        """
+        Iterate over the keys without building an intermediate list.
+
+        :return: An iterator over the keys.
+        """
+        for entry in self._root:
+            yield entry[1]
+
+    def __contains__(self, key: object) -> bool:
+        """
+        Check whether a key is in the map.
+
+        :param key: The key to look up.
+        :return: True if the key exists, False otherwise.
+        """
+        return self._root.find(0, self._key_hash(key), key) is not _MISSING
+
+    def __getitem__(self, key: K) -> V:
+        """
+        Retrieve the value associated with a key.
+
+        :param key: The key to look up.
+        :return: The value associated with the key.
+        :raises KeyError: If the key does not exist.
+        """
+        value = self._root.find(0, self._key_hash(key), key)
+        if value is _MISSING:
+            raise KeyError(key)
+        return value
+
+    def __len__(self) -> int:
+        """
+        Get the number of elements in the map.
+
+        :return: The number of key-value pairs in the map.
+        """
+        return self.size
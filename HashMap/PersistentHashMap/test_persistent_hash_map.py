@@ -0,0 +1,120 @@
+import random
+import unittest
+from collections.abc import Mapping
+
+from HashMap.HashMap import HashMap
+from HashMap.PersistentHashMap.PersistentHashMap import PersistentHashMap
+
+
+class CollidingKey:
+    def __init__(self, value):
+        self.value = value
+
+    def __hash__(self):
+        # Force collision by returning the same hash for all keys
+        return 42
+
+    def __eq__(self, other):
+        return isinstance(other, CollidingKey) and self.value == other.value
+
+
+class TestPersistentHashMap(unittest.TestCase):
+    def setUp(self) -> None:
+        """
+        Set up an empty PersistentHashMap instance for testing.
+        """
+        self.hash_map = PersistentHashMap[str, int]()
+
+    def test_put_get_remove(self):
+        """
+        Test that put and remove return new versions and leave the original untouched.
+        """
+        first = self.hash_map.put("apple", 10).put("banana", 20)
+        second = first.put("apple", 15).remove("banana")
+
+        self.assertEqual(len(self.hash_map), 0)
+        self.assertEqual(dict(first), {"apple": 10, "banana": 20})
+        self.assertEqual(dict(second), {"apple": 15})
+        self.assertIsNone(second.get("banana"))
+        self.assertEqual(second.get("banana", -1), -1)
+        self.assertIsInstance(second, Mapping)
+
+    def test_unchanged_versions(self):
+        """
+        Test that operations which change nothing return the same version.
+        """
+        value = object()
+        hash_map = PersistentHashMap().put("apple", value)
+
+        self.assertIs(hash_map.put("apple", value), hash_map)
+        self.assertIs(hash_map.remove("missing"), hash_map)
+        self.assertIs(hash_map.put_many([]), hash_map)
+
+    def test_snapshots_share_structure(self):
+        """
+        Test that every version keeps its contents while later versions are derived from it.
+        """
+        rng = random.Random(0)
+        expected = {}
+        hash_map = self.hash_map
+        snapshots = []
+
+        for step in range(5000):
+            key = f"key-{rng.randrange(500)}"
+            if rng.random() < 0.7:
+                expected[key] = step
+                hash_map = hash_map.put(key, step)
+            else:
+                expected.pop(key, None)
+                hash_map = hash_map.remove(key)
+            if step % 500 == 0:
+                snapshots.append((hash_map, dict(expected)))
+
+        for snapshot, contents in snapshots:
+            self.assertEqual(len(snapshot), len(contents))
+            self.assertEqual(dict(snapshot.items()), contents)
+
+    def test_colliding_keys(self):
+        """
+        Test keys whose hash codes are equal, mixed with keys that share only a hash prefix.
+        """
+        keys = [CollidingKey(i) for i in range(10)] + [42 + (1 << 40), 42 + (1 << 50)]
+        hash_map = PersistentHashMap((key, i) for i, key in enumerate(keys))
+
+        self.assertEqual([hash_map[key] for key in keys], list(range(12)))
+        for key in keys[:9]:
+            hash_map = hash_map.remove(key)
+        self.assertEqual(dict(hash_map), {keys[9]: 9, keys[10]: 10, keys[11]: 11})
+        with self.assertRaises(KeyError):
+            hash_map[keys[0]]
+
+    def test_batches(self):
+        """
+        Test that put_many and remove_many do not modify the version they start from.
+        """
+        base = PersistentHashMap.from_items((f"key-{i}", i) for i in range(1000))
+        grown = base.put_many((f"key-{i}", -i) for i in range(500, 1500))
+        shrunk = grown.remove_many(f"key-{i}" for i in range(0, 1500, 2))
+
+        self.assertEqual(dict(base), {f"key-{i}": i for i in range(1000)})
+        self.assertEqual(len(grown), 1500)
+        self.assertEqual(grown["key-700"], -700)
+        self.assertEqual(len(shrunk), 750)
+        self.assertNotIn("key-2", shrunk)
+
+    def test_hash_map_conversion(self):
+        """
+        Test converting to and from HashMap.
+        """
+        source = HashMap.from_items((f"key-{i}", i) for i in range(100))
+        persistent = PersistentHashMap.from_hash_map(source)
+        source.put("key-0", -1)
+
+        self.assertEqual(persistent["key-0"], 0)
+        round_trip = persistent.to_hash_map(engine="robin_hood")
+        self.assertEqual(round_trip.engine, "robin_hood")
+        self.assertEqual(dict(round_trip), dict(persistent))
+
+
+if __name__ == '__main__':
+    unittest.main()
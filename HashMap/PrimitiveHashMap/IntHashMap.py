@@ -0,0 +1,106 @@
+import operator
+from array import array
+from typing import Iterable, Union
+
+from HashMap.PrimitiveHashMap.PrimitiveHashMap import PrimitiveHashMap, _EMPTY, _FULL, _FIBONACCI
+
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional: without it, bulk operations loop over the array module storage
+    np = None
+
+
+class IntHashMap(PrimitiveHashMap[int]):
+    """
+    A HashMap from 64-bit integer keys to 64-bit integers, storing keys and values in array('q') instead of boxed tuples.
+
+    When NumPy is installed, get_many and increment_many accept NumPy arrays of keys and probe the table for all of
+    them at once, through zero-copy views of the same array('q') storage.
+    """
+    _vacant_key = 0
+
+    def _new_keys(self, capacity: int) -> array:
+        return array('q', bytes(8 * capacity))
+
+    def _key_hash(self, key: int) -> int:
+        return operator.index(key)
+
+    def __contains__(self, key: object) -> bool:
+        try:
+            return self._find_slot(key)[0] != -1
+        except TypeError:
+            return False
+
+    def _find_slots(self, keys: 'np.ndarray') -> 'np.ndarray':
+        """
+        Find the slots holding many keys, advancing every unresolved probe sequence one slot per round.
+
+        :param keys: A NumPy int64 array of keys.
+        :return: A NumPy int64 array of slot indices, with -1 for keys that are not in the map.
+        """
+        states = np.frombuffer(self._states, dtype=np.uint8)
+        stored = np.frombuffer(self._keys, dtype=np.int64)
+        slots = ((keys.astype(np.uint64) * np.uint64(_FIBONACCI)) >> np.uint64(self._shift)).astype(np.int64)
+        results = np.full(keys.shape[0], -1, dtype=np.int64)
+        pending = np.arange(keys.shape[0])
+
+        while pending.size:
+            probe = slots[pending]
+            state = states[probe]
+            hit = (state == _FULL) & (stored[probe] == keys[pending])
+            results[pending[hit]] = probe[hit]
+            pending = pending[~(hit | (state == _EMPTY))]
+            slots[pending] = (slots[pending] + 1) & self._mask
+
+        return results
+
+    def get_many(self, keys: Iterable[int], default: int = 0) -> Union[array, 'np.ndarray']:
+        """
+        Retrieve the values associated with many keys.
+
+        :param keys: The keys to look up. A NumPy array is looked up with vectorized probing.
+        :param default: The value returned for keys that do not exist. Defaults to 0.
+        :return: The values in the same order as the keys: a NumPy int64 array for NumPy input, an array('q')
+            otherwise.
+        """
+        if np is None or not isinstance(keys, np.ndarray):
+            return super().get_many(keys, default)
+
+        slots = self._find_slots(keys.astype(np.int64, copy=False))
+        found = slots >= 0
+        results = np.full(slots.shape[0], default, dtype=np.int64)
+        results[found] = np.frombuffer(self._values, dtype=np.int64)[slots[found]]
+        return results
+
+    def increment_many(self, keys: Iterable[int], deltas: Union[int, Iterable[int]] = 1) -> None:
+        """
+        Add deltas to the values of many keys, inserting missing keys.
+
+        A NumPy array of keys is first reduced to its distinct keys and their summed deltas, so every distinct key is
+        probed once and all values are updated in a single vectorized addition.
+
+        :param keys: The keys to increment. A key may appear several times.
+        :param deltas: The amount to add to every key, or one amount per key. Defaults to 1.
+        """
+        if np is None or not isinstance(keys, np.ndarray):
+            super().increment_many(keys, deltas)
+            return
+
+        unique, inverse = np.unique(keys.astype(np.int64, copy=False), return_inverse=True)
+        inverse = inverse.ravel()
+        if isinstance(deltas, int):
+            totals = np.bincount(inverse, minlength=unique.shape[0]).astype(np.int64) * deltas
+        else:
+            totals = np.zeros(unique.shape[0], dtype=np.int64)
+            np.add.at(totals, inverse, np.asarray(deltas, dtype=np.int64))
+
+        slots = self._find_slots(unique)
+        missing = np.flatnonzero(slots < 0)
+        if missing.size:
+            # Rebuild at most once, then insert the new keys with a value of 0 before the vectorized addition
+            self._reserve(self.size + int(missing.size))
+            for key in unique[missing].tolist():
+                self._insert_at(self._find_slot(key)[1], key, 0)
+            slots = self._find_slots(unique)
+
+        np.frombuffer(self._values, dtype=np.int64)[slots] += totals
@@ -0,0 +1,338 @@
+import sys
+from array import array
+from itertools import repeat
+from typing import TypeVar, Optional, Iterable, Iterator, Tuple, Union, MutableMapping
+
+K = TypeVar('K')
+
+"""
+Why specialize HashMaps for primitive values?
+
+The generic HashMap stores every entry as a (hash, key, value) tuple holding boxed objects, which costs well over 100
+bytes per entry for an int -> int map. A PrimitiveHashMap stores its slots in flat typed arrays instead: one byte of
+state per slot in a bytearray, and the values as 64-bit integers in an array('q'). Subclasses choose how keys are
+stored: IntHashMap keeps them in a second array('q'), StrHashMap keeps references to the str objects in a list.
+
+Collisions are resolved by linear probing from a home slot chosen by Fibonacci hashing (multiplying by 2^64 / phi
+and keeping the top bits), which spreads sequential and strided integer keys evenly. Removed keys leave a tombstone
+that later insertions reuse and rebuilds drop.
+
+The values are counters or ids, so get_many and increment_many are the main bulk operations. Values must fit in a
+signed 64-bit integer.
+"""
+
+_EMPTY = 0
+_FULL = 1
+_TOMBSTONE = 2
+
+_FIBONACCI = 0x9E3779B97F4A7C15  # 2^64 / golden ratio, rounded to odd
+_MASK64 = (1 << 64) - 1
+
+
+class PrimitiveHashMap(MutableMapping[K, int]):
+    """
+    An open-addressing HashMap from keys to 64-bit integers, storing its slots in flat typed arrays.
+    """
+    _vacant_key: Optional[K] = None  # The key stored in empty and removed slots
+
+    def __init__(self, capacity: int = 8, max_load_factor: float = 0.7) -> None:
+        """
+        Initialize the PrimitiveHashMap with a given capacity.
+
+        :param capacity: The initial number of slots, rounded up to a power of two. Defaults to 8.
+        :param max_load_factor: Rebuild the table when (size + tombstones) / capacity would exceed this value.
+            Must be below 1. Defaults to 0.7.
+        """
+        if not 0 < max_load_factor < 1:
+            raise ValueError("max_load_factor must be between 0 and 1")
+
+        self.size = 0
+        self.max_load_factor = max_load_factor
+        self._tombstones = 0
+        self._allocate(self._round_capacity(capacity))
+
+    @staticmethod
+    def _round_capacity(capacity: int) -> int:
+        """
+        Round a capacity up to the next power of two so that home slots can be computed with a shift.
+
+        :param capacity: The requested capacity.
+        :return: The smallest power of two greater than or equal to the capacity (at least 8).
+        """
+        rounded = 8
+        while rounded < capacity:
+            rounded *= 2
+        return rounded
+
+    def _new_keys(self, capacity: int):
+        """
+        Create the key storage for a table of the given capacity.
+
+        :param capacity: The number of slots.
+        :return: A sequence of capacity vacant keys.
+        """
+        raise NotImplementedError
+
+    def _key_hash(self, key: K) -> int:
+        """
+        Get the integer that is mixed into a key's home slot.
+
+        :param key: The key.
+        :return: An integer identifying the key.
+        """
+        raise NotImplementedError
+
+    def _allocate(self, capacity: int) -> None:
+        """
+        Replace the slot storage with empty storage of the given capacity.
+
+        :param capacity: The number of slots, which must be a power of two.
+        """
+        self.capacity = capacity
+        self._mask = capacity - 1
+        self._shift = 64 - capacity.bit_length() + 1
+        self._states = bytearray(capacity)
+        self._keys = self._new_keys(capacity)
+        self._values = array('q', bytes(8 * capacity))
+
+    def _home(self, key: K) -> int:
+        """
+        Compute the home slot of a key with Fibonacci hashing.
+
+        :param key: The key.
+        :return: The slot where probing for the key starts.
+        """
+        return ((self._key_hash(key) * _FIBONACCI) & _MASK64) >> self._shift
+
+    def _find_slot(self, key: K) -> Tuple[int, int]:
+        """
+        Find the slot holding a key.
+
+        :param key: The key to look up.
+        :return: The slot index of the key (or -1 if it is not in the map), and the first free slot of its probe
+            sequence.
+        """
+        states = self._states
+        keys = self._keys
+        mask = self._mask
+        index = self._home(key)
+        free = -1
+
+        while True:
+            state = states[index]
+            if state == _EMPTY:
+                return -1, index if free == -1 else free
+            if state == _FULL:
+                if keys[index] == key:
+                    return index, free
+            elif free == -1:
+                free = index
+            index = (index + 1) & mask
+
+    def _insert_at(self, index: int, key: K, value: int) -> None:
+        """
+        Store a new key in a free slot.
+
+        :param index: The free slot, found by _find_slot.
+        :param key: The key to insert.
+        :param value: The value associated with the key.
+        """
+        self._values[index] = value  # Assign the typed arrays first, so an out-of-range value leaves no trace
+        self._keys[index] = key
+        if self._states[index] == _TOMBSTONE:
+            self._tombstones -= 1
+        self._states[index] = _FULL
+        self.size += 1
+
+    def _free_slot(self, key: K, free: int) -> int:
+        """
+        Make sure a new key can be stored without exceeding the load factor.
+
+        :param key: The key about to be inserted.
+        :param free: The free slot found by _find_slot.
+        :return: The free slot to store the key in, which changes if the table was rebuilt.
+        """
+        if self._states[free] == _EMPTY and (self.size + self._tombstones + 1) / self.capacity > self.max_load_factor:
+            self._rebuild()
+            free = self._find_slot(key)[1]
+        return free
+
+    def _rebuild(self, new_capacity: Optional[int] = None) -> None:
+        """
+        Rebuild the slot storage, dropping tombstones.
+
+        :param new_capacity: The capacity to rebuild with. By default the capacity is doubled, unless most of the
+            load is tombstones, in which case the table is rebuilt at its current capacity.
+        """
+        if new_capacity is None:
+            new_capacity = self.capacity
+            if (self.size + 1) / self.capacity > self.max_load_factor / 2:
+                new_capacity *= 2
+
+        old_states, old_keys, old_values = self._states, self._keys, self._values
+        self._allocate(new_capacity)
+        self._tombstones = 0
+
+        states, keys, values = self._states, self._keys, self._values
+        mask = self._mask
+        for old_index, state in enumerate(old_states):
+            if state == _FULL:
+                key = old_keys[old_index]
+                index = self._home(key)
+                while states[index] != _EMPTY:
+                    index = (index + 1) & mask
+                states[index] = _FULL
+                keys[index] = key
+                values[index] = old_values[old_index]
+
+    def _reserve(self, expected_size: int) -> None:
+        """
+        Rebuild the table once so that expected_size entries fit without exceeding the load factor.
+
+        :param expected_size: The number of entries the table should hold.
+        """
+        if (expected_size + self._tombstones + 1) / self.capacity <= self.max_load_factor:
+            return
+
+        capacity = self.capacity
+        while (expected_size + 1) / capacity > self.max_load_factor:
+            capacity *= 2
+        self._rebuild(capacity)
+
+    def put(self, key: K, value: int) -> None:
+        """
+        Insert or update a key-value pair.
+
+        :param key: The key to insert.
+        :param value: The value associated with the key.
+        :raises OverflowError: If the value does not fit in a signed 64-bit integer.
+        """
+        index, free = self._find_slot(key)
+        if index != -1:
+            self._values[index] = value
+            return
+
+        self._insert_at(self._free_slot(key, free), key, value)
+
+    def get(self, key: K, default: Optional[int] = None) -> Optional[int]:
+        """
+        Retrieve the value associated with a key.
+
+        :param key: The key to look up.
+        :param default: The value to return if the key does not exist. Defaults to None.
+        :return: The value associated with the key, or default if the key does not exist.
+        """
+        index = self._find_slot(key)[0]
+        return default if index == -1 else self._values[index]
+
+    def remove(self, key: K) -> None:
+        """
+        Remove a key-value pair, leaving a tombstone in its slot.
+
+        :param key: The key to remove.
+        """
+        index = self._find_slot(key)[0]
+        if index == -1:
+            return
+
+        self._states[index] = _TOMBSTONE
+        self._keys[index] = self._vacant_key  # Release the key
+        self._values[index] = 0
+        self._tombstones += 1
+        self.size -= 1
+
+    def increment(self, key: K, delta: int = 1) -> int:
+        """
+        Add delta to the value of a key, inserting the key with value delta if it does not exist.
+
+        :param key: The key to increment.
+        :param delta: The amount to add. Defaults to 1.
+        :return: The new value.
+        """
+        index, free = self._find_slot(key)
+        if index != -1:
+            self._values[index] += delta
+            return self._values[index]
+
+        self._insert_at(self._free_slot(key, free), key, delta)
+        return delta
+
+    def get_many(self, keys: Iterable[K], default: int = 0) -> array:
+        """
+        Retrieve the values associated with many keys.
+
+        :param keys: The keys to look up.
+        :param default: The value returned for keys that do not exist. Defaults to 0.
+        :return: An array('q') of the values in the same order as the keys.
+        """
+        find = self._find_slot
+        values = self._values
+        results = array('q')
+        append = results.append
+
+        for key in keys:
+            index = find(key)[0]
+            append(default if index == -1 else values[index])
+
+        return results
+
+    def increment_many(self, keys: Iterable[K], deltas: Union[int, Iterable[int]] = 1) -> None:
+        """
+        Add deltas to the values of many keys, inserting missing keys.
+
+        :param keys: The keys to increment. A key may appear several times.
+        :param deltas: The amount to add to every key, or one amount per key. Defaults to 1.
+        """
+        increment = self.increment
+        for key, delta in zip(keys, repeat(deltas) if isinstance(deltas, int) else deltas):
+            increment(key, delta)
+
+    def memory_per_entry(self) -> float:
+        """
+        Compute the bytes of slot storage per entry, including empty slots.
+
+        :return: The size of the slot arrays divided by the number of entries.
+        """
+        table = sys.getsizeof(self._states) + sys.getsizeof(self._keys) + sys.getsizeof(self._values)
+        return table / max(self.size, 1)
+
+    def clear(self) -> None:
+        """
+        Remove every key-value pair, keeping the current capacity.
+        """
+        self._allocate(self.capacity)
+        self._tombstones = 0
+        self.size = 0
+
+    def __contains__(self, key: object) -> bool:
+        return self._find_slot(key)[0] != -1
+
+    def __getitem__(self, key: K) -> int:
+        index = self._find_slot(key)[0]
+        if index == -1:
+            raise KeyError(key)
+        return self._values[index]
+
+    def __setitem__(self, key: K, value: int) -> None:
+        self.put(key, value)
+
+    def __delitem__(self, key: K) -> None:
+        size = self.size
+        self.remove(key)
+        if self.size == size:
+            raise KeyError(key)
+
+    def __iter__(self) -> Iterator[K]:
+        keys = self._keys
+        for index, state in enumerate(self._states):
+            if state == _FULL:
+                yield keys[index]
+
+    def __len__(self) -> int:
+        return self.size
+
+    def __str__(self) -> str:
+        return f"{type(self).__name__}(size={self.size}, capacity={self.capacity})"
+
+    def __repr__(self) -> str:
+        return self.__str__()
@@ -0,0 +1,18 @@
+from typing import List, Optional
+
+from HashMap.PrimitiveHashMap.PrimitiveHashMap import PrimitiveHashMap
+
+
+class StrHashMap(PrimitiveHashMap[str]):
+    """
+    A HashMap from str keys to 64-bit integers, storing the values in an array('q') instead of boxed tuples.
+
+    Keys are kept as references to the str objects, whose hash codes CPython caches, so rebuilding never re-hashes
+    a key's characters.
+    """
+
+    def _new_keys(self, capacity: int) -> List[Optional[str]]:
+        return [None] * capacity
+
+    def _key_hash(self, key: str) -> int:
+        return hash(key)
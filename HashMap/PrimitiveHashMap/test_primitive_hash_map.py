@@ -0,0 +1,135 @@
+import unittest
+from array import array
+from collections.abc import MutableMapping
+
+from HashMap.PrimitiveHashMap.IntHashMap import IntHashMap, np
+from HashMap.PrimitiveHashMap.StrHashMap import StrHashMap
+
+
+class TestIntHashMap(unittest.TestCase):
+    def setUp(self) -> None:
+        """
+        Set up an IntHashMap instance for testing.
+        """
+        self.hash_map = IntHashMap()
+
+    def test_put_get_remove(self):
+        """
+        Test inserting, updating, retrieving and removing key-value pairs, including negative keys.
+        """
+        self.hash_map.put(1, 10)
+        self.hash_map.put(-1, 20)
+        self.hash_map.put(1, 15)
+        self.hash_map.remove(-1)
+        self.hash_map.remove(42)
+
+        self.assertEqual(self.hash_map.get(1), 15)
+        self.assertIsNone(self.hash_map.get(-1))
+        self.assertEqual(len(self.hash_map), 1)
+        self.assertEqual(self.hash_map._tombstones, 1)
+
+        with self.assertRaises(OverflowError):
+            self.hash_map.put(2, 2 ** 63)
+        self.assertNotIn(2, self.hash_map)
+        self.assertNotIn("1", self.hash_map)
+
+    def test_resize(self):
+        """
+        Test that strided keys are spread out and survive resizes.
+        """
+        for i in range(5000):
+            self.hash_map.put(i * 1024, i)
+
+        self.assertEqual(len(self.hash_map), 5000)
+        self.assertLessEqual(len(self.hash_map) / self.hash_map.capacity, 0.7)
+        self.assertEqual(self.hash_map.get_many([i * 1024 for i in range(5000)]), array('q', range(5000)))
+
+    def test_increment(self):
+        """
+        Test increment and increment_many with a shared delta and per-key deltas.
+        """
+        self.assertEqual(self.hash_map.increment(7), 1)
+        self.assertEqual(self.hash_map.increment(7, 5), 6)
+
+        self.hash_map.increment_many([1, 2, 1, 1])
+        self.hash_map.increment_many([2, 3], [10, -3])
+        self.assertEqual(dict(self.hash_map), {7: 6, 1: 3, 2: 11, 3: -3})
+        self.assertEqual(self.hash_map.get_many([1, 4], default=-1), array('q', [3, -1]))
+
+    def test_mapping_protocol(self):
+        """
+        Test the MutableMapping protocol: [], in, del and iteration.
+        """
+        self.hash_map[1] = 10
+        del self.hash_map[1]
+        self.hash_map[2] = 20
+
+        self.assertIsInstance(self.hash_map, MutableMapping)
+        self.assertEqual(self.hash_map[2], 20)
+        with self.assertRaises(KeyError):
+            self.hash_map[1]
+        with self.assertRaises(KeyError):
+            del self.hash_map[1]
+
+        self.hash_map.clear()
+        self.assertEqual(list(self.hash_map), [])
+
+    def test_memory_per_entry(self):
+        """
+        Test that the slot storage takes far less memory per entry than a tuple per entry.
+        """
+        for i in range(10000):
+            self.hash_map.put(i, i)
+
+        self.assertLess(self.hash_map.memory_per_entry(), 40)
+
+    @unittest.skipUnless(np is not None, "NumPy is not installed")
+    def test_numpy_bulk_operations(self):
+        """
+        Test that vectorized get_many and increment_many match the scalar operations.
+        """
+        keys = np.array([5, -5, 5, 2 ** 40, 5], dtype=np.int64)
+        self.hash_map.increment(5, 100)
+        self.hash_map.increment_many(keys)
+        self.hash_map.increment_many(np.arange(1000), np.arange(1000))
+
+        self.assertEqual(self.hash_map[5], 108)
+        self.assertEqual(self.hash_map[-5], 1)
+        self.assertEqual(self.hash_map[2 ** 40], 1)
+        self.assertEqual(self.hash_map[999], 999)
+        self.assertEqual(self.hash_map.get_many(np.array([5, 6, 7, 12345])).tolist(), [108, 6, 7, 0])
+
+
+class TestStrHashMap(unittest.TestCase):
+    def setUp(self) -> None:
+        """
+        Set up a StrHashMap instance for testing.
+        """
+        self.hash_map = StrHashMap()
+
+    def test_put_get_remove(self):
+        """
+        Test inserting, updating, retrieving and removing key-value pairs.
+        """
+        for i in range(1000):
+            self.hash_map.put(f"key{i}", i)
+        self.hash_map.put("key0", -1)
+        for i in range(1, 500):
+            self.hash_map.remove(f"key{i}")
+
+        self.assertEqual(len(self.hash_map), 501)
+        self.assertEqual(self.hash_map.get("key0"), -1)
+        self.assertIsNone(self.hash_map.get("key1"))
+        self.assertEqual(self.hash_map.get("key999"), 999)
+
+    def test_increment_many(self):
+        """
+        Test counting repeated str keys.
+        """
+        self.hash_map.increment_many(["home", "cart", "home", "checkout", "home"])
+
+        self.assertEqual(dict(self.hash_map), {"home": 3, "cart": 1, "checkout": 1})
+        self.assertEqual(self.hash_map.get_many(["home", "search"]), array('q', [3, 0]))
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,428 @@
+import secrets
+from array import array
+from typing import TypeVar, List, Optional, Iterable, Iterator, Tuple, Union, Callable, Dict
+
+from HashMap.HashMap import HashMap, _MISSING, _mix_hash
+
+K = TypeVar('K')
+V = TypeVar('V')
+
+"""
+Why use Robin Hood open addressing with parallel arrays?
+
+The chained HashMap allocates a tuple for every entry and a list (or DoublyLinkedList) for every bucket, so each lookup
+follows several pointers before it reaches a key. Open addressing stores every entry directly in the table instead:
+three flat arrays hold the hash, the key and the value of each slot, and collisions are resolved by probing the
+following slots.
+
+Robin Hood hashing keeps probe sequences short by letting an entry that is far from its home slot take the place of an
+entry that is closer to its own ("take from the rich, give to the poor"). This bounds the variance of probe lengths and
+lets a lookup stop as soon as it reaches a slot whose entry is closer to home than the key being searched for.
+
+The home slot is taken from the low bits of the hash, and Python's int hash is the identity, so keys with a
+power-of-two stride would all share a few home slots and turn every probe sequence into a linear scan. Every hash is
+therefore scrambled with the splitmix64 finalizer before it is stored, whether or not randomize_hash adds a seed.
+
+Removed entries leave a tombstone behind: the key is replaced by a sentinel while the hash is kept, so probe distances
+stay valid for the entries after it. Tombstones are reused by later insertions and dropped whenever the table is rebuilt.
+"""
+
+_EMPTY = -1  # hash() never returns -1, so it can mark an empty slot
+_TOMBSTONE = object()
+
+
+class RobinHoodHashMap(HashMap[K, V]):
+    """
+    An open-addressing HashMap using Robin Hood hashing over parallel arrays of hashes, keys and values.
+    """
+
+    def __init__(
+        self,
+        capacity: int = 10,
+        engine: str = "robin_hood",
+        randomize_hash: bool = False,
+        max_load_factor: float = 0.7,
+        min_load_factor: float = 0.0,
+        on_resize: Optional[Callable[[int, int, float], None]] = None,
+    ) -> None:
+        """
+        Initialize the RobinHoodHashMap with a given capacity.
+
+        :param capacity: The initial capacity of the hash map, rounded up to a power of two. Defaults to 10.
+        :param engine: The storage engine. Only "robin_hood" is accepted.
+        :param randomize_hash: Mix a random per-instance seed into every hash code to resist hash flooding.
+        :param max_load_factor: Rebuild the table when (size + tombstones) / capacity would exceed this value.
+            Must be below 1 so that every probe sequence reaches an empty slot. Defaults to 0.7.
+        :param min_load_factor: Shrink the table when a removal drops size / capacity below this value.
+            Defaults to 0.0, which never shrinks automatically.
+        :param on_resize: A callback invoked after every rebuild with the old capacity, the new capacity and the
+            duration of the rebuild in seconds.
+        """
+        if engine != "robin_hood":
+            raise ValueError(f"Unknown engine: {engine!r}")
+        self._validate_load_factors(max_load_factor, min_load_factor)
+        if max_load_factor >= 1:
+            raise ValueError("max_load_factor must be below 1 for open addressing")
+
+        self.engine = engine
+        self.size = 0
+        self.max_load_factor = max_load_factor
+        self.min_load_factor = min_load_factor
+        self._tombstones = 0
+        self._hash_seed = secrets.randbits(64) | 1 if randomize_hash else 0
+        self._min_capacity = self._round_capacity(capacity)
+        self._allocate(self._min_capacity)
+
+        self.on_resize = on_resize
+        self._resize_count = 0
+        self._resize_time = 0.0
+
+    def _hash(self, key: K) -> int:
+        """
+        Compute the scrambled hash code of a key, so that the low bits used for the home slot depend on every bit.
+
+        :param key: The key to hash.
+        :return: The non-negative hash code of the key.
+        """
+        return _mix_hash(hash(key) ^ self._hash_seed)
+
+    @staticmethod
+    def _round_capacity(capacity: int) -> int:
+        """
+        Round a capacity up to the next power of two so that slot indices can be computed with a mask.
+
+        :param capacity: The requested capacity.
+        :return: The smallest power of two greater than or equal to the capacity (at least 8).
+        """
+        rounded = 8
+        while rounded < capacity:
+            rounded *= 2
+        return rounded
+
+    def _allocate(self, capacity: int) -> None:
+        """
+        Replace the slot arrays with empty arrays of the given capacity.
+
+        :param capacity: The number of slots, which must be a power of two.
+        """
+        self.capacity = capacity
+        self._mask = capacity - 1
+        self._hashes = array('q', [_EMPTY]) * capacity
+        self._keys: List[Optional[K]] = [None] * capacity
+        self._values: List[Optional[V]] = [None] * capacity
+
+    def _find_slot(self, key: K, key_hash: int) -> int:
+        """
+        Find the slot holding a key.
+
+        :param key: The key to look up.
+        :param key_hash: The hash of the key.
+        :return: The slot index, or -1 if the key is not in the map.
+        """
+        hashes = self._hashes
+        keys = self._keys
+        mask = self._mask
+        index = key_hash & mask
+        distance = 0
+
+        while True:
+            slot_hash = hashes[index]
+            if slot_hash == _EMPTY:
+                return -1
+
+            # Robin Hood invariant: the key would have displaced any entry closer to its home slot
+            if distance > ((index - (slot_hash & mask)) & mask):
+                return -1
+
+            if slot_hash == key_hash:
+                slot_key = keys[index]
+                if slot_key is not _TOMBSTONE and (slot_key is key or slot_key == key):
+                    return index
+
+            index = (index + 1) & mask
+            distance += 1
+
+    def _insert_new(self, key_hash: int, key: K, value: V, index: int = -1, distance: int = 0) -> None:
+        """
+        Insert an entry that is known not to be in the map, displacing entries closer to their home slots.
+
+        :param key_hash: The hash of the key.
+        :param key: The key to insert.
+        :param value: The value associated with the key.
+        :param index: The slot to start probing from. Defaults to the key's home slot.
+        :param distance: The probe distance of the starting slot from the key's home slot.
+        """
+        hashes = self._hashes
+        keys = self._keys
+        values = self._values
+        mask = self._mask
+        if index == -1:
+            index = key_hash & mask
+
+        while True:
+            slot_hash = hashes[index]
+            if slot_hash == _EMPTY:
+                hashes[index] = key_hash
+                keys[index] = key
+                values[index] = value
+                return
+
+            slot_distance = (index - (slot_hash & mask)) & mask
+            if slot_distance <= distance and keys[index] is _TOMBSTONE:
+                # Reusing the tombstone never lowers the slot's probe distance, so lookups stay correct
+                hashes[index] = key_hash
+                keys[index] = key
+                values[index] = value
+                self._tombstones -= 1
+                return
+
+            if slot_distance < distance:
+                hashes[index], key_hash = key_hash, slot_hash
+                keys[index], key = key, keys[index]
+                values[index], value = value, values[index]
+                distance = slot_distance
+
+            index = (index + 1) & mask
+            distance += 1
+
+    def _insert(self, key: K, value: V) -> bool:
+        """
+        Insert or update a key-value pair without checking the load factor. The caller must have reserved a free slot.
+
+        :param key: The key to insert.
+        :param value: The value associated with the key.
+        :return: True if a new key was added, False if an existing key was updated.
+        """
+        key_hash = self._hash(key)
+        index = self._find_slot(key, key_hash)
+        if index != -1:
+            self._values[index] = value
+            return False
+
+        self._insert_new(key_hash, key, value)
+        self.size += 1
+        return True
+
+    def put(self, key: K, value: V) -> None:
+        """
+        Insert or update a key-value pair in the RobinHoodHashMap.
+
+        :param key: The key to insert.
+        :param value: The value associated with the key.
+        """
+        key_hash = self._hash(key)
+        index = self._find_slot(key, key_hash)
+        if index != -1:
+            self._values[index] = value  # Update the value
+            return
+
+        # Keep at least one empty slot so that every probe sequence terminates
+        if (self.size + self._tombstones + 1) / self.capacity > self.max_load_factor:
+            self._resize()
+
+        self._insert_new(key_hash, key, value)
+        self.size += 1
+
+    def _find_value(self, key: K) -> Union[V, object]:
+        """
+        Look up the value of a key with a single probe.
+
+        :param key: The key to look up.
+        :return: The value associated with the key, or _MISSING if the key does not exist.
+        """
+        index = self._find_slot(key, self._hash(key))
+        if index == -1:
+            return _MISSING
+        return self._values[index]
+
+    def get_or_insert(self, key: K, factory: Callable[[], V]) -> V:
+        """
+        Retrieve the value associated with a key, inserting factory() first if the key does not exist.
+
+        A missing key is inserted starting from the slot where its lookup stopped, so the table is probed only once.
+
+        :param key: The key to look up.
+        :param factory: A callable producing the value to insert for a missing key.
+        :return: The existing or newly inserted value.
+        """
+        # Reserve the free slot before probing so the probe position stays valid for the insertion
+        if (self.size + self._tombstones + 1) / self.capacity > self.max_load_factor:
+            self._resize()
+
+        key_hash = self._hash(key)
+        hashes = self._hashes
+        keys = self._keys
+        mask = self._mask
+        index = key_hash & mask
+        distance = 0
+
+        while True:
+            slot_hash = hashes[index]
+            if slot_hash == _EMPTY or distance > ((index - (slot_hash & mask)) & mask):
+                break
+
+            if slot_hash == key_hash:
+                slot_key = keys[index]
+                if slot_key is not _TOMBSTONE and (slot_key is key or slot_key == key):
+                    return self._values[index]
+
+            index = (index + 1) & mask
+            distance += 1
+
+        value = factory()
+        self._insert_new(key_hash, key, value, index, distance)
+        self.size += 1
+        return value
+
+    def _discard(self, key: K) -> bool:
+        """
+        Remove a key, leaving a tombstone in its slot, without checking the low-water mark.
+
+        :param key: The key to remove.
+        :return: True if the key was present and removed, False otherwise.
+        """
+        index = self._find_slot(key, self._hash(key))
+        if index == -1:
+            return False
+
+        self._keys[index] = _TOMBSTONE
+        self._values[index] = None
+        self._tombstones += 1
+        self.size -= 1
+        return True
+
+    def _iter_values(self) -> Iterator[V]:
+        """
+        Iterate over the values without building an intermediate list.
+
+        :return: An iterator over the values.
+        """
+        keys = self._keys
+        values = self._values
+        for index, key_hash in enumerate(self._hashes):
+            if key_hash != _EMPTY and keys[index] is not _TOMBSTONE:
+                yield values[index]
+
+    def _iter_items(self) -> Iterator[Tuple[K, V]]:
+        """
+        Iterate over the key-value pairs without building an intermediate list.
+
+        :return: An iterator over the key-value pairs.
+        """
+        keys = self._keys
+        values = self._values
+        for index, key_hash in enumerate(self._hashes):
+            if key_hash != _EMPTY and keys[index] is not _TOMBSTONE:
+                yield keys[index], values[index]
+
+    def __iter__(self) -> Iterator[K]:
+        """
+        Iterate over the keys without building an intermediate list.
+
+        :return: An iterator over the keys.
+        """
+        keys = self._keys
+        for index, key_hash in enumerate(self._hashes):
+            if key_hash != _EMPTY:
+                key = keys[index]
+                if key is not _TOMBSTONE:
+                    yield key
+
+    def clear(self) -> None:
+        """
+        Remove every key-value pair, keeping the current capacity.
+        """
+        self._allocate(self.capacity)
+        self._tombstones = 0
+        self.size = 0
+
+    def rehash_step(self, n: int = 1) -> bool:
+        """
+        Robin Hood tables are always rebuilt in a single pass, so there is never a migration in progress.
+
+        :param n: Ignored.
+        :return: Always False.
+        """
+        return False
+
+    def _rebuild(self, new_capacity: Optional[int] = None) -> None:
+        """
+        Rebuild the slot arrays, dropping tombstones.
+
+        :param new_capacity: The capacity to rebuild with. By default the capacity is doubled, unless most of the
+            load is tombstones, in which case the table is rebuilt at its current capacity.
+        """
+        if new_capacity is None:
+            new_capacity = self.capacity
+            if (self.size + 1) / self.capacity > self.max_load_factor / 2:
+                new_capacity *= 2
+
+        hashes, keys, values = self._hashes, self._keys, self._values
+        self._allocate(new_capacity)
+        self._tombstones = 0
+
+        # Stored hashes are reused, so keys are never re-hashed
+        for index, key_hash in enumerate(hashes):
+            if key_hash != _EMPTY and keys[index] is not _TOMBSTONE:
+                self._insert_new(key_hash, keys[index], values[index])
+
+    def stats(self) -> Dict[str, object]:
+        """
+        Report how far entries sit from their home slots and how much time has been spent rebuilding.
+
+        :return: A dictionary with the size, capacity, load_factor, resize_count and resize_time (in seconds), plus:
+            - probe_histogram: the number of entries at each distance from their home slot, keyed by distance
+            - max_probe_distance: the largest distance of an entry from its home slot
+            - avg_probe_distance: the average distance of an entry from its home slot
+            - tombstones: the number of slots holding a tombstone
+        """
+        histogram: Dict[int, int] = {}
+        keys = self._keys
+        mask = self._mask
+
+        for index, key_hash in enumerate(self._hashes):
+            if key_hash != _EMPTY and keys[index] is not _TOMBSTONE:
+                distance = (index - (key_hash & mask)) & mask
+                histogram[distance] = histogram.get(distance, 0) + 1
+
+        stats = self._base_stats()
+        stats.update({
+            "probe_histogram": dict(sorted(histogram.items())),
+            "max_probe_distance": max(histogram, default=0),
+            "avg_probe_distance": sum(d * c for d, c in histogram.items()) / self.size if self.size else 0.0,
+            "tombstones": self._tombstones,
+        })
+        return stats
+
+    def _reserve(self, expected_size: int) -> None:
+        """
+        Rebuild the table once so that expected_size entries fit without exceeding the load factor.
+
+        :param expected_size: The number of entries the table should hold.
+        """
+        if (expected_size + self._tombstones + 1) / self.capacity <= self.max_load_factor:
+            return
+
+        capacity = self.capacity
+        while (expected_size + 1) / capacity > self.max_load_factor:
+            capacity *= 2
+        self._resize(capacity)
+
+    def get_many(self, keys: Iterable[K]) -> List[Optional[V]]:
+        """
+        Retrieve the values associated with many keys.
+
+        :param keys: The keys to look up.
+        :return: The values in the same order as the keys, with None for keys that do not exist.
+        """
+        find = self._find_slot
+        hash_key = self._hash
+        values = self._values
+        results: List[Optional[V]] = []
+        append = results.append
+
+        for key in keys:
+            index = find(key, hash_key(key))
+            append(None if index == -1 else values[index])
+
+        return results
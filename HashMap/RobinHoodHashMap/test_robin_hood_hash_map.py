@@ -0,0 +1,262 @@
+import unittest
+from collections.abc import MutableMapping
+
+from HashMap.HashMap import HashMap
+from HashMap.RobinHoodHashMap.RobinHoodHashMap import RobinHoodHashMap
+
+class CollidingKey:
+    def __init__(self, value):
+        self.value = value
+
+    def __hash__(self):
+        # Force collision by returning the same hash for all keys
+        return 42
+
+    def __eq__(self, other):
+        return isinstance(other, CollidingKey) and self.value == other.value
+
+class TestRobinHoodHashMap(unittest.TestCase):
+    def setUp(self) -> None:
+        """
+        Set up a RobinHoodHashMap instance for testing.
+        """
+        self.hash_map = HashMap[str, int](engine="robin_hood")
+
+    def test_engine_selection(self):
+        """
+        Test that the engine keyword selects the open-addressing implementation.
+        """
+        self.assertIsInstance(self.hash_map, RobinHoodHashMap)
+        self.assertIsInstance(HashMap(16, "robin_hood"), RobinHoodHashMap)
+        self.assertNotIsInstance(HashMap(), RobinHoodHashMap)
+
+        with self.assertRaises(ValueError):
+            HashMap(engine="cuckoo")
+
+    def test_chained_options_rejected(self):
+        """
+        Test that options of the chained engine raise a ValueError naming the option and the engine.
+        """
+        for engine in ("robin_hood", "ordered"):
+            for option, value in (("incremental_resize", True), ("rehash_batch", 8), ("treeify_threshold", 8)):
+                with self.assertRaisesRegex(ValueError, f"{option} is not supported by the '{engine}' engine"):
+                    HashMap(engine=engine, **{option: value})
+
+        self.assertIsInstance(HashMap(engine="robin_hood", randomize_hash=True, max_load_factor=0.5), RobinHoodHashMap)
+
+    def test_put_and_get(self):
+        """
+        Test inserting key-value pairs and retrieving them.
+        """
+        self.hash_map.put("apple", 10)
+        self.hash_map.put("banana", 20)
+
+        self.assertEqual(self.hash_map.get("apple"), 10)
+        self.assertEqual(self.hash_map.get("banana"), 20)
+        self.assertIsNone(self.hash_map.get("cherry"))
+
+    def test_update_value(self):
+        """
+        Test updating the value of an existing key.
+        """
+        self.hash_map.put("apple", 10)
+        self.hash_map.put("apple", 15)
+
+        self.assertEqual(self.hash_map.get("apple"), 15)
+        self.assertEqual(len(self.hash_map), 1)
+
+    def test_remove_leaves_tombstone(self):
+        """
+        Test that removing a key leaves a tombstone that later insertions reuse.
+        """
+        self.hash_map.put("apple", 10)
+        self.hash_map.put("banana", 20)
+
+        self.hash_map.remove("apple")
+        self.hash_map.remove("missing")
+        self.assertIsNone(self.hash_map.get("apple"))
+        self.assertEqual(self.hash_map.get("banana"), 20)
+        self.assertEqual(len(self.hash_map), 1)
+        self.assertEqual(self.hash_map._tombstones, 1)
+
+        self.hash_map.put("apple", 30)
+        self.assertEqual(self.hash_map.get("apple"), 30)
+        self.assertEqual(self.hash_map._tombstones, 0)
+
+    def test_resize(self):
+        """
+        Test that the table grows and keeps every entry reachable.
+        """
+        for i in range(1000):
+            self.hash_map.put(f"key{i}", i)
+
+        self.assertEqual(len(self.hash_map), 1000)
+        self.assertLessEqual(len(self.hash_map) / self.hash_map.capacity, 0.7)
+        for i in range(1000):
+            self.assertEqual(self.hash_map.get(f"key{i}"), i)
+
+    def test_churn_does_not_grow(self):
+        """
+        Test that repeated insert/remove cycles rebuild in place instead of growing the table.
+        """
+        for i in range(10000):
+            self.hash_map.put(f"key{i}", i)
+            self.hash_map.remove(f"key{i}")
+
+        self.assertEqual(len(self.hash_map), 0)
+        self.assertEqual(self.hash_map.capacity, 16)
+
+    def test_collision_handling(self):
+        """
+        Test that keys with identical hashes are stored and removed correctly.
+        """
+        map_with_collisions = HashMap[CollidingKey, int](engine="robin_hood")
+        keys = [CollidingKey(i) for i in range(20)]
+
+        for i, key in enumerate(keys):
+            map_with_collisions.put(key, i)
+        map_with_collisions.remove(keys[5])
+
+        for i, key in enumerate(keys):
+            self.assertEqual(map_with_collisions.get(key), None if i == 5 else i)
+
+    def test_bulk_operations(self):
+        """
+        Test from_items, put_many, get_many and remove_many on the open-addressing engine.
+        """
+        hash_map = HashMap.from_items(((f"key{i}", i) for i in range(1000)), expected_size=1000, engine="robin_hood")
+        self.assertIsInstance(hash_map, RobinHoodHashMap)
+        self.assertEqual(hash_map.capacity, 2048)
+
+        self.assertEqual(hash_map.put_many([("key0", -1), ("extra", 1)]), 1)
+        self.assertEqual(hash_map.get_many(["key0", "extra", "missing"]), [-1, 1, None])
+        self.assertEqual(hash_map.remove_many(["key0", "missing"]), 1)
+        self.assertEqual(len(hash_map), 1000)
+
+    def test_mapping_protocol(self):
+        """
+        Test the MutableMapping protocol: [], in, del, get with a default and iteration.
+        """
+        self.hash_map["apple"] = 10
+        self.hash_map["banana"] = None
+
+        self.assertIsInstance(self.hash_map, MutableMapping)
+        self.assertEqual(self.hash_map["apple"], 10)
+        self.assertIn("banana", self.hash_map)
+        self.assertNotIn("cherry", self.hash_map)
+        self.assertEqual(self.hash_map.get("cherry", -1), -1)
+        self.assertIsNone(self.hash_map.get("banana", -1))
+
+        with self.assertRaises(KeyError):
+            self.hash_map["cherry"]
+        with self.assertRaises(KeyError):
+            del self.hash_map["cherry"]
+
+        del self.hash_map["banana"]
+        self.assertEqual(dict(self.hash_map), {"apple": 10})
+
+    def test_views(self):
+        """
+        Test that keys, values and items are lazy views over the current contents.
+        """
+        items = self.hash_map.items()
+        for i in range(50):
+            self.hash_map[f"key{i}"] = i
+
+        self.assertEqual(len(items), 50)
+        self.assertEqual(sorted(self.hash_map.values()), list(range(50)))
+        self.assertEqual(set(self.hash_map.keys()), {f"key{i}" for i in range(50)})
+        self.assertEqual(dict(items), {f"key{i}": i for i in range(50)})
+        self.assertIn(("key7", 7), items)
+
+        self.hash_map.clear()
+        self.assertEqual(len(self.hash_map), 0)
+        self.assertEqual(list(items), [])
+
+    def test_setdefault_and_get_or_insert(self):
+        """
+        Test that setdefault and get_or_insert only insert missing keys.
+        """
+        self.assertEqual(self.hash_map.setdefault("apple", 10), 10)
+        self.assertEqual(self.hash_map.setdefault("apple", 20), 10)
+
+        calls = []
+
+        def factory():
+            calls.append(1)
+            return len(calls)
+
+        for i in range(30):
+            self.hash_map.get_or_insert(f"key{i % 15}", factory)
+        self.assertEqual(len(calls), 15)
+        self.assertEqual(self.hash_map["key14"], 15)
+        self.assertEqual(len(self.hash_map), 16)
+
+    def test_randomize_hash(self):
+        """
+        Test that seeded hash codes are valid slot hashes and keep every key reachable.
+        """
+        seeded_map = HashMap[int, int](engine="robin_hood", randomize_hash=True)
+        for i in range(1000):
+            seeded_map.put(i * 1024, i)
+
+        self.assertTrue(all(seeded_map._hash(key) >= 0 for key in (-1, -2, 0, 2 ** 63, "key")))
+        self.assertEqual(seeded_map.get_many([i * 1024 for i in range(1000)]), list(range(1000)))
+
+    def test_strided_int_keys(self):
+        """
+        Test that int keys with a power-of-two stride spread over the table without a seed.
+        """
+        strided_map = HashMap[int, int](engine="robin_hood")
+        for i in range(5000):
+            strided_map.put(i * 1024, i)
+
+        self.assertEqual(strided_map.get_many([i * 1024 for i in range(5000)]), list(range(5000)))
+        self.assertLess(strided_map.stats()["max_probe_distance"], 32)
+
+    def test_shrink_and_compact(self):
+        """
+        Test shrinking below min_load_factor and compacting away tombstones.
+        """
+        shrinking_map = HashMap[int, int](engine="robin_hood", min_load_factor=0.1)
+        for i in range(1000):
+            shrinking_map.put(i, i)
+        shrinking_map.remove_many(range(990))
+        self.assertEqual(shrinking_map.capacity, 32)
+        self.assertEqual(shrinking_map._tombstones, 0)
+        self.assertEqual(sorted(shrinking_map), list(range(990, 1000)))
+
+        for i in range(1000):
+            self.hash_map.put(f"key{i}", i)
+        self.hash_map.remove_many([f"key{i}" for i in range(900)])
+        self.hash_map.compact()
+        self.assertEqual(self.hash_map.capacity, 256)
+        self.assertEqual(self.hash_map._tombstones, 0)
+        self.assertEqual(self.hash_map.get("key950"), 950)
+
+        with self.assertRaises(ValueError):
+            HashMap(engine="robin_hood", max_load_factor=1.0)
+
+    def test_stats(self):
+        """
+        Test the probe-distance histogram, tombstone count and resize tracking.
+        """
+        resizes = []
+        stats_map = HashMap[CollidingKey, int](engine="robin_hood", on_resize=lambda old, new, t: resizes.append(new))
+        for i in range(4):
+            stats_map.put(CollidingKey(i), i)
+        stats_map.remove(CollidingKey(3))
+
+        stats = stats_map.stats()
+        self.assertEqual(stats["probe_histogram"], {0: 1, 1: 1, 2: 1})
+        self.assertEqual(stats["max_probe_distance"], 2)
+        self.assertEqual(stats["avg_probe_distance"], 1.0)
+        self.assertEqual(stats["tombstones"], 1)
+
+        for i in range(4, 13):
+            stats_map.put(CollidingKey(i), i)
+        self.assertEqual(resizes, [32])
+        self.assertEqual(stats_map.stats()["resize_count"], 1)
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,265 @@
+import mmap
+import struct
+import sys
+from multiprocessing import shared_memory
+from typing import TypeVar, Optional, Iterable, Tuple, Type
+
+from HashMap.BufferHashMap import BufferHashMap, _RECORD
+from HashMap.Codec import Codec, CODECS, PICKLE
+
+K = TypeVar('K')
+V = TypeVar('V')
+
+"""
+Why a HashMap in shared memory?
+
+A pre-fork worker pool that gives every process its own copy of a read-mostly HashMap pays for the map once per
+worker, and forking does not help for long: CPython's reference counting writes to every object it touches, so the
+copy-on-write pages of an inherited map are duplicated as soon as workers read it.
+
+A SharedHashMap lays the map out in a multiprocessing.shared_memory segment using the slot table and record heap of
+BufferHashMap. A single writer creates and fills the segment, and any number of processes attach to it by name. Readers
+never copy the map: every lookup probes the shared slots and decodes only the value it returns.
+
+A segment cannot grow in place, so when the table or heap of the writer runs out of room the map is rebuilt into a new
+segment with a new name, and the old one is unlinked. Readers should therefore attach after the writer has finished
+building the map, for example by building it with from_items before forking.
+
+The header records the names of the key and value codecs, so readers attaching to a map built with the BYTES, STR, INT
+or PICKLE codecs do not need to pass them.
+"""
+
+_MAGIC = b"SHMHMAP\x00"
+_VERSION = 1
+_HEADER = struct.Struct("<8sIQQQQ16s16s")  # magic, version, capacity, size, tombstones, heap end, codec names
+
+
+def _attach(name: str) -> shared_memory.SharedMemory:
+    """
+    Attach to an existing shared memory segment without taking ownership of it.
+
+    :param name: The name of the segment.
+    :return: The attached segment.
+    """
+    if sys.version_info >= (3, 13):
+        return shared_memory.SharedMemory(name, track=False)
+    # Before 3.13 attaching also registers the segment with the resource tracker. Workers started by multiprocessing
+    # share the writer's tracker, which only unlinks segments the writer leaked when the whole pool shuts down.
+    return shared_memory.SharedMemory(name)
+
+
+class SharedHashMap(BufferHashMap[K, V]):
+    """
+    A HashMap stored in a shared memory segment, written by one process and read by many without copying.
+    """
+
+    def __init__(
+        self,
+        name: Optional[str] = None,
+        create: bool = False,
+        capacity: int = 1024,
+        heap_size: int = 0,
+        key_codec: Optional[Codec[K]] = None,
+        value_codec: Optional[Codec[V]] = None,
+        max_load_factor: float = 0.7,
+    ) -> None:
+        """
+        Create a SharedHashMap, or attach to an existing one read-only.
+
+        :param name: The name of the shared memory segment. Required when attaching; a unique name is generated when
+            creating if omitted.
+        :param create: Create a new, writable map instead of attaching to an existing one. Defaults to False.
+        :param capacity: The initial number of slots of a new map, rounded up to a power of two. Defaults to 1024.
+        :param heap_size: The number of bytes reserved for records in a new map. The map is rebuilt into a larger
+            segment when they run out.
+        :param key_codec: The codec converting keys to bytes. When creating, defaults to PICKLE; when attaching,
+            defaults to the codec recorded by the writer.
+        :param value_codec: The codec converting values to bytes, with the same defaults as key_codec.
+        :param max_load_factor: Rebuild the table when (size + tombstones) / capacity would exceed this value.
+            Must be below 1. Defaults to 0.7.
+        :raises FileNotFoundError: If attaching and no segment has the given name.
+        :raises ValueError: If the segment is not a SharedHashMap or its codecs cannot be determined.
+        """
+        if not 0 < max_load_factor < 1:
+            raise ValueError("max_load_factor must be between 0 and 1")
+        if not create and name is None:
+            raise ValueError("name is required to attach to an existing SharedHashMap")
+
+        self.readonly = not create
+        self.max_load_factor = max_load_factor
+
+        if create:
+            self.key_codec = key_codec or PICKLE
+            self.value_codec = value_codec or PICKLE
+            self.capacity = self._round_capacity(capacity)
+            self.size = 0
+            self._tombstones = 0
+            self._heap_end = self._table_end(self.capacity)
+            self._shm = self._new_segment(self.capacity, heap_size, name)
+            self._buffer = self._shm.buf
+            self._write_header()
+        else:
+            self._shm = _attach(name)
+            self._buffer = self._shm.buf
+            self._read_header(key_codec, value_codec)
+
+    @property
+    def name(self) -> str:
+        """
+        The name of the shared memory segment that readers attach to. It changes whenever the writer rebuilds the map.
+        """
+        return self._shm.name
+
+    def _new_segment(self, capacity: int, heap_size: int, name: Optional[str] = None) -> shared_memory.SharedMemory:
+        """
+        Create a new, zero-filled segment, which holds an empty table of the given capacity.
+
+        :param capacity: The number of slots, which must be a power of two.
+        :param heap_size: The number of bytes reserved for records.
+        :param name: The name of the segment. Defaults to a unique generated name.
+        :return: The new segment.
+        """
+        size = self._table_end(capacity) + max(heap_size, mmap.PAGESIZE)
+        return shared_memory.SharedMemory(name, create=True, size=size)
+
+    def _read_header(self, key_codec: Optional[Codec[K]], value_codec: Optional[Codec[V]]) -> None:
+        """
+        Read the header of an attached segment.
+
+        :param key_codec: The key codec passed by the caller, or None to use the codec recorded by the writer.
+        :param value_codec: The value codec passed by the caller, or None to use the codec recorded by the writer.
+        :raises ValueError: If the segment is not a SharedHashMap or its codecs cannot be determined.
+        """
+        magic, version, self.capacity, self.size, self._tombstones, self._heap_end, key_name, value_name = \
+            _HEADER.unpack_from(self._buffer, 0)
+        if magic != _MAGIC or version != _VERSION:
+            self.close()
+            raise ValueError(f"{self.name} is not a SharedHashMap segment")
+
+        self.key_codec = key_codec or CODECS.get(key_name.rstrip(b"\x00").decode())
+        self.value_codec = value_codec or CODECS.get(value_name.rstrip(b"\x00").decode())
+        if self.key_codec is None or self.value_codec is None:
+            self.close()
+            raise ValueError("The map uses custom codecs, which must be passed as key_codec and value_codec")
+
+    def _write_header(self) -> None:
+        """
+        Publish the current size, capacity and heap end to readers.
+        """
+        _HEADER.pack_into(self._buffer, 0, _MAGIC, _VERSION, self.capacity, self.size, self._tombstones,
+                          self._heap_end, self.key_codec.name.encode(), self.value_codec.name.encode())
+
+    def _begin_write(self, index: int) -> None:
+        """
+        Writes go straight to the segment, so there is nothing to prepare.
+        """
+
+    def _grow_heap(self, needed: int) -> None:
+        """
+        Rebuild the map into a segment with at least needed more bytes of free heap.
+
+        :param needed: The number of bytes to make room for.
+        """
+        used = self._heap_end - self._table_end(self.capacity)
+        self._rebuild(self.capacity, 2 * used + needed)
+
+    def _rebuild(self, new_capacity: int, heap_size: Optional[int] = None) -> None:
+        """
+        Rebuild the map into a new segment, then unlink the old one.
+
+        :param new_capacity: The number of slots, which must be a power of two.
+        :param heap_size: The number of bytes reserved for records. Defaults to twice the heap bytes in use.
+        """
+        used = self._heap_end - self._table_end(self.capacity)
+        if heap_size is None:
+            heap_size = 2 * used
+
+        segment = self._new_segment(new_capacity, max(heap_size, used))
+        heap_end = self._copy_records(segment.buf, new_capacity)
+        self.close()
+        self.unlink()
+
+        self._shm = segment
+        self._buffer = segment.buf
+        self.capacity = new_capacity
+        self._heap_end = heap_end
+        self._tombstones = 0
+        self._write_header()
+
+    def put(self, key: K, value: V) -> None:
+        """
+        Insert or update a key-value pair.
+
+        :param key: The key to insert.
+        :param value: The value associated with the key.
+        :raises TypeError: If the map was attached read-only.
+        """
+        super().put(key, value)
+        self._write_header()
+
+    def remove(self, key: K) -> None:
+        """
+        Remove a key-value pair, leaving a tombstone in its slot.
+
+        :param key: The key to remove.
+        :raises TypeError: If the map was attached read-only.
+        """
+        super().remove(key)
+        self._write_header()
+
+    @classmethod
+    def from_items(
+        cls: Type['SharedHashMap[K, V]'],
+        items: Iterable[Tuple[K, V]],
+        name: Optional[str] = None,
+        key_codec: Codec[K] = PICKLE,
+        value_codec: Codec[V] = PICKLE,
+        max_load_factor: float = 0.7,
+    ) -> 'SharedHashMap[K, V]':
+        """
+        Build a SharedHashMap in a segment sized exactly for the given items, so it is never rebuilt.
+
+        :param items: The key-value pairs to insert.
+        :param name: The name of the segment. Defaults to a unique generated name.
+        :param key_codec: The codec converting keys to bytes. Defaults to PICKLE.
+        :param value_codec: The codec converting values to bytes. Defaults to PICKLE.
+        :param max_load_factor: The maximum load factor of the table. Defaults to 0.7.
+        :return: A writable SharedHashMap holding the items.
+        """
+        encoded = [(key_codec.encode(key), value_codec.encode(value)) for key, value in items]
+
+        capacity = 8
+        while (len(encoded) + 1) / capacity > max_load_factor:
+            capacity *= 2
+        heap_size = sum(_RECORD.size + len(k) + len(v) for k, v in encoded)
+
+        shared_map = cls(name, True, capacity, heap_size, key_codec, value_codec, max_load_factor)
+        for key_bytes, value_bytes in encoded:
+            shared_map._put_encoded(key_bytes, value_bytes)
+        shared_map._write_header()
+        return shared_map
+
+    def close(self) -> None:
+        """
+        Detach from the segment. The segment itself lives on until the writer calls unlink().
+        """
+        self._buffer = None
+        self._shm.close()
+
+    def unlink(self) -> None:
+        """
+        Destroy the segment once every process has detached. Only the writer should call this.
+        """
+        self._shm.unlink()
+
+    def __enter__(self) -> 'SharedHashMap[K, V]':
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def __str__(self) -> str:
+        return f"SharedHashMap({self.name!r}, size={self.size}, capacity={self.capacity})"
+
+    def __repr__(self) -> str:
+        return self.__str__()
@@ -0,0 +1,121 @@
+import multiprocessing
+import unittest
+from collections.abc import MutableMapping
+
+from HashMap.Codec import Codec, STR, INT
+from HashMap.SharedHashMap.SharedHashMap import SharedHashMap
+
+
+def _read_from_worker(name: str, keys: list, results) -> None:
+    """
+    Attach to a SharedHashMap from another process and report the values of some keys.
+    """
+    with SharedHashMap(name) as shared_map:
+        results.put([shared_map.get(key) for key in keys])
+
+
+class TestSharedHashMap(unittest.TestCase):
+    def setUp(self) -> None:
+        """
+        Set up a writable SharedHashMap for testing.
+        """
+        self.hash_map = SharedHashMap[str, int](create=True, capacity=8, key_codec=STR, value_codec=INT)
+
+    def tearDown(self) -> None:
+        if self.hash_map._buffer is not None:
+            self.hash_map.close()
+        self.hash_map.unlink()
+
+    def test_put_get_remove(self):
+        """
+        Test inserting, updating, retrieving and removing key-value pairs.
+        """
+        self.hash_map.put("apple", 10)
+        self.hash_map.put("banana", 20)
+        self.hash_map.put("apple", 15)
+        self.hash_map.remove("banana")
+        self.hash_map.remove("missing")
+
+        self.assertEqual(self.hash_map.get("apple"), 15)
+        self.assertIsNone(self.hash_map.get("banana"))
+        self.assertEqual(len(self.hash_map), 1)
+        self.assertIsInstance(self.hash_map, MutableMapping)
+
+    def test_attach_read_only(self):
+        """
+        Test that a reader attached by name sees the writer's entries, picks up the codecs from the header, and
+        cannot write.
+        """
+        self.hash_map.update({"apple": 10, "banana": 20})
+
+        with SharedHashMap(self.hash_map.name) as reader:
+            self.assertIs(reader.key_codec, STR)
+            self.assertIs(reader.value_codec, INT)
+            self.assertEqual(dict(reader), {"apple": 10, "banana": 20})
+            with self.assertRaises(TypeError):
+                reader.put("cherry", 30)
+            with self.assertRaises(TypeError):
+                del reader["apple"]
+
+    def test_attach_errors(self):
+        """
+        Test attaching without a name, and to a map written with custom codecs.
+        """
+        with self.assertRaises(ValueError):
+            SharedHashMap()
+
+        custom = Codec("upper", lambda key: key.upper().encode(), lambda data: str(data, "utf-8"))
+        with SharedHashMap(create=True, key_codec=custom, value_codec=INT) as writer:
+            writer.put("apple", 10)
+            with self.assertRaises(ValueError):
+                SharedHashMap(writer.name)
+            with SharedHashMap(writer.name, key_codec=custom) as reader:
+                self.assertEqual(reader["APPLE"], 10)
+            writer.unlink()
+
+    def test_rebuild_moves_segment(self):
+        """
+        Test that outgrowing the table and the heap rebuilds the map into a new segment with every entry.
+        """
+        name = self.hash_map.name
+        for i in range(1000):
+            self.hash_map.put(f"key-{i}", i)
+
+        self.assertNotEqual(self.hash_map.name, name)
+        self.assertGreaterEqual(self.hash_map.capacity, 1024)
+        with SharedHashMap(self.hash_map.name) as reader:
+            self.assertEqual(len(reader), 1000)
+            self.assertEqual(reader["key-999"], 999)
+
+    def test_from_items(self):
+        """
+        Test that from_items builds the map in a single segment without rebuilding.
+        """
+        items = [(f"key-{i}", i) for i in range(500)]
+        with SharedHashMap.from_items(items, key_codec=STR, value_codec=INT) as shared_map:
+            name = shared_map.name
+            self.assertEqual(len(shared_map), 500)
+            self.assertEqual(dict(shared_map), dict(items))
+            self.assertEqual(shared_map.name, name)
+            shared_map.unlink()
+
+    def test_attach_from_other_process(self):
+        """
+        Test that worker processes attach to the map by name and read its entries.
+        """
+        self.hash_map.update({"apple": 10, "banana": 20})
+        context = multiprocessing.get_context()
+        results = context.Queue()
+        workers = [context.Process(target=_read_from_worker, args=(self.hash_map.name, ["apple", "banana", "x"],
+                                                                   results)) for _ in range(2)]
+        for worker in workers:
+            worker.start()
+        values = [results.get(timeout=30) for _ in workers]
+        for worker in workers:
+            worker.join()
+
+        self.assertEqual(values, [[10, 20, None]] * 2)
+
+
+if __name__ == '__main__':
+    unittest.main()
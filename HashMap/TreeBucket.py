@@ -0,0 +1,195 @@
+from bisect import bisect_left
+from typing import TypeVar, Generic, List, Optional, Tuple, Iterator, Iterable
+
+from Graph.Tree.RedBlackTree.RedBlackTree import RedBlackTree
+
+K = TypeVar('K')
+V = TypeVar('V')
+
+Entry = Tuple[int, K, V]  # (hash code, key, value)
+
+"""
+Why treeify heavily collided buckets?
+
+A chained bucket is scanned linearly, so a key set crafted to land in a single bucket turns every operation into O(n).
+Like Java 8's HashMap, a bucket that grows past a threshold is converted into a balanced tree ordered by the full hash
+code. Keys that share a bucket index rarely share their full hash, so the tree restores O(log n) operations.
+
+Entries whose full hash codes are identical are grouped into a single bin. Python's built-in str and bytes hashes are
+randomized per process, but int hashes are not: n and n + 2**61 - 1 share a full hash code, so a bin can still be
+flooded. Like Java's tie-break on Comparable keys, a bin keeps its entries sorted by key while every key in it is an
+int, str or bytes of one type, and finds a key by binary search. Those types are totally ordered consistently with
+__eq__, which arbitrary types with __lt__ (such as frozenset) are not. A bin holding any other key falls back to
+scanning its entries with __eq__.
+"""
+
+_ORDERED_TYPES = (int, str, bytes)  # Key types whose ordering can be used to search a bin
+
+
+class _HashBin(Generic[K, V]):
+    """
+    The entries of a TreeBucket that share one full hash code, ordered in the tree by that hash code.
+    """
+    __slots__ = ("key_hash", "entries", "keys")
+
+    def __init__(self, key_hash: int):
+        self.key_hash = key_hash
+        self.entries: List[Entry] = []
+        # The keys of the entries in sorted order, or None once a key without a usable ordering was added
+        self.keys: Optional[List[K]] = []
+
+    def index(self, key: K) -> int:
+        """
+        Find the position of a key among the entries.
+
+        :param key: The key to look up.
+        :return: The index of the entry, or -1 if the key is not in the bin.
+        """
+        keys = self.keys
+        if keys and type(key) is type(keys[0]):
+            i = bisect_left(keys, key)
+            return i if i < len(keys) and keys[i] == key else -1
+
+        for i, entry in enumerate(self.entries):
+            if entry[1] is key or entry[1] == key:
+                return i
+
+        return -1
+
+    def add(self, entry: Entry) -> None:
+        """
+        Add an entry whose key is not yet in the bin, keeping the entries sorted by key while possible.
+
+        :param entry: The (hash, key, value) entry to add.
+        """
+        key = entry[1]
+        keys = self.keys
+        if keys is not None and type(key) in _ORDERED_TYPES and (not keys or type(key) is type(keys[0])):
+            i = bisect_left(keys, key)
+            keys.insert(i, key)
+            self.entries.insert(i, entry)
+        else:
+            self.keys = None
+            self.entries.append(entry)
+
+    def pop(self, i: int) -> Entry:
+        """
+        Remove the entry at a position.
+
+        :param i: The index of the entry.
+        :return: The removed entry.
+        """
+        if self.keys is not None:
+            del self.keys[i]
+        return self.entries.pop(i)
+
+    def __lt__(self, other: '_HashBin[K, V]') -> bool:
+        return self.key_hash < other.key_hash
+
+    def __eq__(self, other: object) -> bool:
+        return isinstance(other, _HashBin) and self.key_hash == other.key_hash
+
+
+class TreeBucket(Generic[K, V]):
+    """
+    A HashMap bucket backed by a RedBlackTree of hash bins, giving O(log n) operations under heavy collisions.
+    """
+
+    def __init__(self, entries: Optional[Iterable[Entry]] = None):
+        """
+        Initialize the TreeBucket.
+
+        :param entries: Optional (hash, key, value) entries to populate the bucket with.
+        """
+        self.tree: RedBlackTree[_HashBin[K, V]] = RedBlackTree()
+        self.size = 0
+
+        if entries is not None:
+            for entry in entries:
+                self.append(entry)
+
+    def _bin(self, key_hash: int) -> Optional[_HashBin[K, V]]:
+        """
+        Find the bin holding the entries for a hash code.
+
+        :param key_hash: The hash code to look up.
+        :return: The bin, or None if no entry has this hash code.
+        """
+        return self.tree.find(_HashBin(key_hash))
+
+    def append(self, entry: Entry) -> None:
+        """
+        Add an entry whose key is not yet in the bucket.
+
+        :param entry: The (hash, key, value) entry to add.
+        """
+        hash_bin = self._bin(entry[0])
+        if hash_bin is None:
+            hash_bin = _HashBin(entry[0])
+            self.tree.insert(hash_bin)
+
+        hash_bin.add(entry)
+        self.size += 1
+
+    def find(self, key_hash: int, key: K) -> Optional[Entry]:
+        """
+        Find the entry for a key.
+
+        :param key_hash: The hash code of the key.
+        :param key: The key to look up.
+        :return: The (hash, key, value) entry, or None if the key is not in the bucket.
+        """
+        hash_bin = self._bin(key_hash)
+        if hash_bin is not None:
+            i = hash_bin.index(key)
+            if i >= 0:
+                return hash_bin.entries[i]
+
+        return None
+
+    def replace(self, key_hash: int, key: K, value: V) -> bool:
+        """
+        Update the value of a key if it is present.
+
+        :param key_hash: The hash code of the key.
+        :param key: The key to update.
+        :param value: The new value.
+        :return: True if the key was found and updated, False otherwise.
+        """
+        hash_bin = self._bin(key_hash)
+        if hash_bin is not None:
+            i = hash_bin.index(key)
+            if i >= 0:
+                hash_bin.entries[i] = (key_hash, key, value)
+                return True
+
+        return False
+
+    def remove(self, key_hash: int, key: K) -> bool:
+        """
+        Remove a key if it is present.
+
+        :param key_hash: The hash code of the key.
+        :param key: The key to remove.
+        :return: True if the key was found and removed, False otherwise.
+        """
+        hash_bin = self._bin(key_hash)
+        if hash_bin is None:
+            return False
+
+        i = hash_bin.index(key)
+        if i < 0:
+            return False
+
+        hash_bin.pop(i)
+        if not hash_bin.entries:
+            self.tree.delete(hash_bin)
+        self.size -= 1
+        return True
+
+    def __len__(self) -> int:
+        return self.size
+
+    def __iter__(self) -> Iterator[Entry]:
+        for hash_bin in self.tree:
+            yield from hash_bin.entries
@@ -1,6 +1,9 @@
 import unittest
+from collections.abc import MutableMapping
 
 from HashMap.HashMap import HashMap
+from HashMap.TreeBucket import TreeBucket
+from LinkedList.DoublyLinkedList.DoublyLinkedList import DoublyLinkedList
 
 class TestHashMap(unittest.TestCase):
     def setUp(self) -> None:
@@ -90,5 +93,337 @@ class TestHashMap(unittest.TestCase):
         self.assertEqual(map_with_collisions.get(key1), 100)
         self.assertEqual(map_with_collisions.get(key2), 200)
 
+    def test_collision_bucket_update_and_remove(self):
+        """
+        Test updating and removing keys stored in a bucket converted to a DoublyLinkedList.
+        """
+        map_with_collisions = HashMap[int, str](capacity=100)
+        keys = [i * 100 for i in range(5)]  # All keys land in bucket 0
+
+        for key in keys:
+            map_with_collisions.put(key, "old")
+        map_with_collisions.put(keys[2], "new")
+        map_with_collisions.remove(keys[3])
+
+        self.assertIsInstance(map_with_collisions.buckets[0], DoublyLinkedList)
+        self.assertEqual(map_with_collisions.get(keys[2]), "new")
+        self.assertIsNone(map_with_collisions.get(keys[3]))
+        self.assertEqual(len(map_with_collisions), 4)
+
+    def test_cached_hashes(self):
+        """
+        Test that resizing never re-hashes keys and that __eq__ only runs when the cached hashes match.
+        """
+        calls = {"hash": 0, "eq": 0}
+
+        class CountingKey:
+            def __init__(self, value):
+                self.value = value
+
+            def __hash__(self):
+                calls["hash"] += 1
+                return hash(self.value)
+
+            def __eq__(self, other):
+                calls["eq"] += 1
+                return isinstance(other, CountingKey) and self.value == other.value
+
+        counting_map = HashMap[CountingKey, int]()
+        for i in range(100):
+            counting_map.put(CountingKey(i), i)
+
+        # One hash per put, even though the map resized several times
+        self.assertEqual(calls["hash"], 100)
+
+        calls["eq"] = 0
+        for i in range(100):
+            self.assertEqual(counting_map.get(CountingKey(i)), i)
+        self.assertEqual(calls["eq"], 100)
+
+    def test_incremental_resize(self):
+        """
+        Test that an incremental resize keeps every key reachable while buckets are migrated.
+        """
+        incremental_map = HashMap[str, int](capacity=8, incremental_resize=True, rehash_batch=1)
+        for i in range(6):
+            incremental_map.put(f"key{i}", i)
+
+        # The sixth put crossed the load factor, so the old table is still being migrated
+        self.assertIsNotNone(incremental_map._old_buckets)
+        self.assertEqual(incremental_map.capacity, 16)
+
+        incremental_map.put("key0", 100)
+        incremental_map.remove("key1")
+        self.assertEqual(incremental_map.get("key0"), 100)
+        self.assertIsNone(incremental_map.get("key1"))
+        for i in range(2, 6):
+            self.assertEqual(incremental_map.get(f"key{i}"), i)
+        self.assertEqual(len(incremental_map), 5)
+        self.assertEqual(dict(incremental_map.items()), {"key0": 100, "key2": 2, "key3": 3, "key4": 4, "key5": 5})
+
+        for i in range(6, 200):
+            incremental_map.put(f"key{i}", i)
+        for i in range(2, 200):
+            self.assertEqual(incremental_map.get(f"key{i}"), i)
+        self.assertEqual(len(incremental_map), 199)
+
+    def test_rehash_step(self):
+        """
+        Test that rehash_step drives an incremental resize to completion.
+        """
+        self.assertFalse(self.hash_map.rehash_step())
+
+        incremental_map = HashMap[str, int](capacity=8, incremental_resize=True)
+        for i in range(6):
+            incremental_map.put(f"key{i}", i)
+
+        self.assertTrue(incremental_map.rehash_step(1))
+        self.assertFalse(incremental_map.rehash_step(100))
+        self.assertIsNone(incremental_map._old_buckets)
+        self.assertEqual(sum(len(bucket) for bucket in incremental_map.buckets), 6)
+
+    def test_incremental_resize_is_lazy(self):
+        """
+        Test that an incremental resize allocates bucket lists on demand and migrates a bounded number per operation.
+        """
+        incremental_map = HashMap[int, int](capacity=1024, incremental_resize=True, rehash_batch=4)
+        i = 0
+        while incremental_map._old_buckets is None:
+            incremental_map.put(i, i)
+            i += 1
+
+        self.assertEqual(incremental_map.capacity, 2048)
+        self.assertFalse(any(isinstance(bucket, list) for bucket in incremental_map.buckets))
+
+        while incremental_map._old_buckets is not None:
+            rehash_index = incremental_map._rehash_index
+            incremental_map.put(i, i)
+            i += 1
+            if incremental_map._old_buckets is not None:
+                self.assertLessEqual(incremental_map._rehash_index - rehash_index, 4)
+
+            allocated = sum(1 for bucket in incremental_map.buckets if bucket)
+            self.assertEqual(allocated, sum(1 for bucket in incremental_map.buckets if isinstance(bucket, list)))
+
+        for key in range(i):
+            self.assertEqual(incremental_map.get(key), key)
+
+    def test_from_items(self):
+        """
+        Test building a HashMap from key-value pairs, including a generator.
+        """
+        items = [(f"key{i}", i) for i in range(1000)]
+        hash_map = HashMap.from_items(items)
+
+        self.assertEqual(len(hash_map), 1000)
+        self.assertLessEqual(len(hash_map) / hash_map.capacity, 0.7)
+        self.assertEqual(hash_map.get_many(["key0", "key999", "missing"]), [0, 999, None])
+
+        from_generator = HashMap.from_items(((i, i * i) for i in range(50)), expected_size=50)
+        self.assertEqual(from_generator.get(7), 49)
+
+        self.assertEqual(HashMap.from_items(items, capacity=4096).capacity, 4096)
+        self.assertEqual(HashMap.from_items(items[:10], capacity=4).capacity, 15)
+
+    def test_put_many_presizes(self):
+        """
+        Test that put_many resizes the table once up front and reports new keys.
+        """
+        self.hash_map.put("key0", -1)
+        self.assertEqual(self.hash_map.put_many([(f"key{i}", i) for i in range(100)]), 99)
+
+        self.assertEqual(self.hash_map.capacity, 160)
+        self.assertEqual(self.hash_map.get("key0"), 0)
+        self.assertEqual(len(self.hash_map), 100)
+
+    def test_get_many_and_remove_many(self):
+        """
+        Test batched lookups and removals.
+        """
+        self.hash_map.put_many([("apple", 10), ("banana", 20), ("cherry", 30)])
+
+        self.assertEqual(self.hash_map.get_many(["cherry", "durian", "apple"]), [30, None, 10])
+        self.assertEqual(self.hash_map.remove_many(["apple", "durian", "cherry"]), 2)
+        self.assertEqual(self.hash_map.get_many(["apple", "banana"]), [None, 20])
+        self.assertEqual(len(self.hash_map), 1)
+
+    def test_mapping_protocol(self):
+        """
+        Test the MutableMapping protocol: [], in, del, get with a default and iteration.
+        """
+        self.hash_map["apple"] = 10
+        self.hash_map["banana"] = None
+
+        self.assertIsInstance(self.hash_map, MutableMapping)
+        self.assertEqual(self.hash_map["apple"], 10)
+        self.assertIn("banana", self.hash_map)
+        self.assertNotIn("cherry", self.hash_map)
+        self.assertEqual(self.hash_map.get("cherry", -1), -1)
+        self.assertIsNone(self.hash_map.get("banana", -1))
+
+        with self.assertRaises(KeyError):
+            self.hash_map["cherry"]
+        with self.assertRaises(KeyError):
+            del self.hash_map["cherry"]
+
+        del self.hash_map["banana"]
+        self.assertEqual(dict(self.hash_map), {"apple": 10})
+
+    def test_views(self):
+        """
+        Test that keys, values and items are lazy views over the current contents.
+        """
+        items = self.hash_map.items()
+        for i in range(50):
+            self.hash_map[f"key{i}"] = i
+
+        self.assertEqual(len(items), 50)
+        self.assertEqual(sorted(self.hash_map.values()), list(range(50)))
+        self.assertEqual(set(self.hash_map.keys()), {f"key{i}" for i in range(50)})
+        self.assertEqual(dict(items), {f"key{i}": i for i in range(50)})
+        self.assertIn(("key7", 7), items)
+
+        self.hash_map.clear()
+        self.assertEqual(len(self.hash_map), 0)
+        self.assertEqual(list(items), [])
+
+    def test_setdefault_and_get_or_insert(self):
+        """
+        Test that setdefault and get_or_insert only insert missing keys.
+        """
+        self.assertEqual(self.hash_map.setdefault("apple", 10), 10)
+        self.assertEqual(self.hash_map.setdefault("apple", 20), 10)
+
+        calls = []
+
+        def factory():
+            calls.append(1)
+            return len(calls)
+
+        for i in range(30):
+            self.hash_map.get_or_insert(f"key{i % 15}", factory)
+        self.assertEqual(len(calls), 15)
+        self.assertEqual(self.hash_map["key14"], 15)
+        self.assertEqual(len(self.hash_map), 16)
+
+    def test_treeify_collided_bucket(self):
+        """
+        Test that a bucket exceeding treeify_threshold becomes a TreeBucket and survives resizes.
+        """
+        tree_map = HashMap[int, int](capacity=1000, treeify_threshold=8)
+        keys = [i * 1000 for i in range(20)]  # All keys land in bucket 0
+
+        for key in keys:
+            tree_map.put(key, key)
+        self.assertIsInstance(tree_map.buckets[0], TreeBucket)
+
+        tree_map.put(keys[3], -1)
+        tree_map.remove(keys[4])
+        self.assertEqual(tree_map.get(keys[3]), -1)
+        self.assertNotIn(keys[4], tree_map)
+        self.assertEqual(len(tree_map), 19)
+
+        for i in range(1, 1000):
+            tree_map.put(i, i)
+        self.assertGreater(tree_map.capacity, 1000)
+        self.assertTrue(any(isinstance(bucket, TreeBucket) for bucket in tree_map.buckets))
+        for key in keys[5:]:
+            self.assertEqual(tree_map[key], key)
+
+    def test_randomize_hash(self):
+        """
+        Test that a random per-instance seed spreads keys that collide modulo the capacity.
+        """
+        seeded_map = HashMap[int, int](capacity=1000, randomize_hash=True)
+        for i in range(50):
+            seeded_map.put(i * 1000, i)
+
+        self.assertLess(max(len(bucket) for bucket in seeded_map.buckets), 10)
+        self.assertEqual([seeded_map.get(i * 1000) for i in range(50)], list(range(50)))
+        self.assertNotEqual(seeded_map._hash(1000), HashMap(randomize_hash=True)._hash(1000))
+
+    def test_load_factor_parameters(self):
+        """
+        Test that the load-factor thresholds are configurable and validated.
+        """
+        dense_map = HashMap[int, int](capacity=10, max_load_factor=2.0)
+        for i in range(20):
+            dense_map.put(i, i)
+        self.assertEqual(dense_map.capacity, 10)
+
+        with self.assertRaises(ValueError):
+            HashMap(max_load_factor=0)
+        with self.assertRaises(ValueError):
+            HashMap(max_load_factor=0.7, min_load_factor=0.4)
+
+    def test_shrink_on_remove(self):
+        """
+        Test that removals below min_load_factor shrink the table, but never below the initial capacity.
+        """
+        shrinking_map = HashMap[int, int](min_load_factor=0.1)
+        for i in range(1000):
+            shrinking_map.put(i, i)
+        grown_capacity = shrinking_map.capacity
+
+        shrinking_map.remove_many(range(990))
+        self.assertLess(shrinking_map.capacity, grown_capacity)
+        self.assertEqual(shrinking_map.capacity, 40)
+        self.assertEqual([shrinking_map[i] for i in range(990, 1000)], list(range(990, 1000)))
+
+        for i in range(990, 1000):
+            shrinking_map.remove(i)
+        self.assertEqual(shrinking_map.capacity, 10)
+
+    def test_compact(self):
+        """
+        Test that compact releases the capacity left behind by removals.
+        """
+        for i in range(1000):
+            self.hash_map.put(f"key{i}", i)
+        for i in range(1000):
+            if i % 100:
+                self.hash_map.remove(f"key{i}")
+        self.assertEqual(self.hash_map.capacity, 2560)
+
+        self.hash_map.compact()
+        self.assertEqual(self.hash_map.capacity, 20)
+        self.assertEqual(dict(self.hash_map), {f"key{i}": i for i in range(0, 1000, 100)})
+
+    def test_stats(self):
+        """
+        Test the bucket histogram, chain lengths, converted bucket counts and resize tracking.
+        """
+        class CollidingKey:
+            def __init__(self, value):
+                self.value = value
+
+            def __hash__(self):
+                return 42
+
+            def __eq__(self, other):
+                return isinstance(other, CollidingKey) and self.value == other.value
+
+        resizes = []
+        stats_map = HashMap[CollidingKey, int](capacity=8, on_resize=lambda old, new, t: resizes.append((old, new)))
+        for i in range(5):
+            stats_map.put(CollidingKey(i), i)
+
+        stats = stats_map.stats()
+        self.assertEqual(stats["size"], 5)
+        self.assertEqual(stats["bucket_histogram"], {0: 7, 5: 1})
+        self.assertEqual(stats["max_chain_length"], 5)
+        self.assertEqual(stats["avg_chain_length"], 5.0)
+        self.assertEqual(stats["linked_list_buckets"], 1)
+        self.assertEqual(stats["tree_buckets"], 0)
+        self.assertEqual(stats["resize_count"], 0)
+
+        for i in range(5, 10):
+            stats_map.put(CollidingKey(i), i)
+        stats = stats_map.stats()
+        self.assertEqual(resizes, [(8, 16)])
+        self.assertEqual(stats["resize_count"], 1)
+        self.assertGreater(stats["resize_time"], 0)
+        self.assertEqual(sum(stats["bucket_histogram"].values()), 16)
+
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,86 @@
+import unittest
+
+from HashMap.TreeBucket import TreeBucket
+
+class TestTreeBucket(unittest.TestCase):
+    def setUp(self) -> None:
+        """
+        Set up a TreeBucket holding entries with distinct and shared hash codes.
+        """
+        self.bucket = TreeBucket([(hash_code, f"key{hash_code}", hash_code) for hash_code in range(20, 0, -1)])
+        self.bucket.append((5, "twin", -5))
+
+    def test_iteration_is_ordered_by_hash(self):
+        """
+        Test that entries are iterated in hash order, with shared hash codes grouped together.
+        """
+        self.assertEqual(len(self.bucket), 21)
+        self.assertEqual([entry[0] for entry in self.bucket], sorted([5] + list(range(1, 21))))
+
+    def test_find(self):
+        """
+        Test finding entries by hash code and key.
+        """
+        self.assertEqual(self.bucket.find(7, "key7"), (7, "key7", 7))
+        self.assertEqual(self.bucket.find(5, "twin"), (5, "twin", -5))
+        self.assertIsNone(self.bucket.find(7, "key8"))
+        self.assertIsNone(self.bucket.find(42, "key42"))
+
+    def test_replace(self):
+        """
+        Test updating the value of an entry.
+        """
+        self.assertTrue(self.bucket.replace(5, "twin", 50))
+        self.assertFalse(self.bucket.replace(42, "key42", 0))
+        self.assertEqual(self.bucket.find(5, "twin"), (5, "twin", 50))
+        self.assertEqual(self.bucket.find(5, "key5"), (5, "key5", 5))
+
+    def test_remove(self):
+        """
+        Test removing entries, including the last entry of a hash code.
+        """
+        self.assertTrue(self.bucket.remove(5, "key5"))
+        self.assertTrue(self.bucket.remove(12, "key12"))
+        self.assertFalse(self.bucket.remove(12, "key12"))
+
+        self.assertEqual(len(self.bucket), 19)
+        self.assertIsNone(self.bucket.find(12, "key12"))
+        self.assertEqual(self.bucket.find(5, "twin"), (5, "twin", -5))
+        self.assertNotIn(12, [entry[0] for entry in self.bucket])
+
+    def test_shared_hash_is_searched_by_key(self):
+        """
+        Test that entries sharing a full hash code are kept sorted by key when the keys are ints of one type.
+        """
+        keys = [(i * 7919) % 500 for i in range(500)]
+        bucket = TreeBucket([(1, key, key) for key in keys])
+        hash_bin = bucket.tree.find(next(iter(bucket.tree)))
+
+        self.assertEqual(hash_bin.keys, list(range(500)))
+        self.assertEqual([entry[1] for entry in bucket], list(range(500)))
+        self.assertEqual(bucket.find(1, 321), (1, 321, 321))
+        self.assertIsNone(bucket.find(1, 500))
+        self.assertTrue(bucket.replace(1, 42, -42))
+        self.assertEqual(bucket.find(1, 42), (1, 42, -42))
+        self.assertTrue(bucket.remove(1, 0))
+        self.assertFalse(bucket.remove(1, 0))
+        self.assertEqual(hash_bin.keys, list(range(1, 500)))
+
+    def test_shared_hash_with_mixed_keys_is_scanned(self):
+        """
+        Test that a bin falls back to comparing keys with __eq__ once its keys cannot be ordered.
+        """
+        bucket = TreeBucket([(1, 3, "three"), (1, 1, "one")])
+        bucket.append((1, "one", "string"))
+        bucket.append((1, frozenset({1}), "set"))
+        hash_bin = bucket.tree.find(next(iter(bucket.tree)))
+
+        self.assertIsNone(hash_bin.keys)
+        self.assertEqual(bucket.find(1, True), (1, 1, "one"))
+        self.assertEqual(bucket.find(1, "one"), (1, "one", "string"))
+        self.assertEqual(bucket.find(1, frozenset({1})), (1, frozenset({1}), "set"))
+        self.assertTrue(bucket.remove(1, 3))
+        self.assertEqual(len(bucket), 3)
+
+if __name__ == "__main__":
+    unittest.main()
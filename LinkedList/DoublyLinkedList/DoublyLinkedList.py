@@ -1,7 +1,35 @@
-from typing import TypeVar, Generic, Optional
+from typing import TypeVar, Generic, Optional, List, Iterable
 
 T = TypeVar('T')
 
+"""
+Why pool nodes?
+
+Every append or prepend allocates a ListNode, and every removal drops one. A list used as a work queue that pushes and
+pops millions of items allocates and frees millions of nodes, and because linked nodes reference each other they are
+tracked by the garbage collector, whose collections are triggered by the allocation count.
+
+With pool_size > 0, a list keeps up to pool_size removed nodes on a free list and reuses them for new items instead of
+allocating. Only nodes removed by pop, popleft, remove or clear are pooled: nodes removed with remove_node may still be
+referenced by the caller (for example to append_node them to another list), so they are never reused behind its back.
+Likewise, a node handle returned by append or prepend must not be used after its node has been popped or cleared from a
+pooled list, because the node may already hold another item.
+
+Why keep a finger?
+
+Indexed access has to walk the list. Walking from whichever of head and tail is nearer halves the worst case, and the
+list also remembers the last node reached by index (the finger) with its index. An access near the previous one, such as
+a loop over range(len(lst)), then walks from the finger and costs O(distance) instead of O(index). Operations whose
+effect on indices is known keep the finger up to date; any other structural change discards it.
+
+Why is the size sometimes unknown?
+
+splice and concat relink two whole lists in O(1) and add their sizes. split_at cuts a list after a node in O(1), but
+the node's index is not known without a walk, so neither half knows its size afterwards. The size is then counted on
+the next call to len (or on the next access that needs it, such as indexing) and remembered from then on, so a split
+costs O(1) and each half pays for one count at most.
+"""
+
 class ListNode(Generic[T]):
     def __init__(self, data: T):
         self.data = data
@@ -15,45 +43,221 @@ class ListNode(Generic[T]):
         return str(self.data)
 
 class DoublyLinkedList(Generic[T]):
-    def __init__(self, items: Optional[list[T]] = None):
+    def __init__(self, items: Optional[Iterable[T]] = None, pool_size: int = 0):
+        """
+        Initialize the list
+        :param items: An iterable of items to append to the list, which is consumed lazily
+        :param pool_size: The maximum number of removed nodes kept for reuse. Defaults to 0, which disables pooling
+        """
+        if pool_size < 0:
+            raise ValueError("pool_size must be non-negative")
+
         self.head: Optional[ListNode[T]] = None
         self.tail: Optional[ListNode[T]] = None
-        self.size = 0
+        self._size: Optional[int] = 0  # None while the size is unknown after split_at
+
+        self.pool_size = pool_size
+        self._free: List[ListNode[T]] = []
+        self.nodes_allocated = 0  # Nodes created by this list
+        self.nodes_reused = 0  # Nodes taken from the free list instead
+
+        self._finger: Optional[ListNode[T]] = None  # The node last reached by index
+        self._finger_index = 0
 
         if items is not None:
-            for item in items:
-                self.append(item)
+            self.extend(items)
+
+    @property
+    def size(self) -> int:
+        """
+        Get the number of nodes, counting them if the size is unknown after split_at
+        :return: The number of nodes
+        """
+        if self._size is None:
+            count = 0
+            current = self.head
+            while current:
+                count += 1
+                current = current.next
+            self._size = count
+        return self._size
 
     def __len__(self) -> int:
         return self.size
 
-    def append(self, data: T) -> None:
+    def _node_at(self, index: int) -> ListNode[T]:
+        """
+        Get the node at a valid index, walking from the nearest of head, tail and the finger, and move the finger there
+        :param index: The index of the node, which must be in range
+        :return: The node
+        """
+        start, position = self.head, 0
+        if self.size - 1 - index < index:
+            start, position = self.tail, self.size - 1
+        if self._finger is not None and abs(self._finger_index - index) < abs(position - index):
+            start, position = self._finger, self._finger_index
+
+        current = start
+        while position < index:
+            current = current.next
+            position += 1
+        while position > index:
+            current = current.prev
+            position -= 1
+
+        self._finger = current
+        self._finger_index = index
+        return current
+
+    def _new_node(self, data: T) -> ListNode[T]:
+        """
+        Get a detached node holding the data, reusing a pooled node if there is one
+        :param data: The data of the node
+        :return: The node
+        """
+        if self._free:
+            node = self._free.pop()
+            node.data = data
+            self.nodes_reused += 1
+            return node
+
+        self.nodes_allocated += 1
+        return ListNode(data)
+
+    def _release(self, node: ListNode[T]) -> None:
+        """
+        Return a removed node to the free list, unless the free list is full
+        :param node: The detached node
+        """
+        if len(self._free) < self.pool_size:
+            node.data = None  # Do not keep the removed item alive
+            self._free.append(node)
+
+    def append(self, data: T) -> ListNode[T]:
         """
         Append a new node to the end of the list
         :param data: The data of the new node
         :return: The new node
         """
-        new_node = ListNode(data)
+        return self.append_node(self._new_node(data))
 
-        if self.size == 0:
-            self.head = new_node
-            self.tail = new_node
+    def append_node(self, node: ListNode[T]) -> ListNode[T]:
+        """
+        Append a detached node, such as one removed from another list by remove_node, to the end of the list in O(1)
+        :param node: The detached node
+        :return: The node
+        """
+        node.prev = self.tail
+        node.next = None
+
+        if self.head is None:
+            self.head = node
         else:
-            new_node.prev = self.tail
-            self.tail.next = new_node
-            self.tail = new_node
+            self.tail.next = node
+        self.tail = node
+
+        if self._size is not None:
+            self._size += 1
+        return node
+
+    def extend(self, items: Iterable[T]) -> None:
+        """
+        Append the items of an iterable to the end of the list, linking the new nodes in one pass
+        :param items: The items to append, which may be a generator
+        """
+        if items is self:
+            items = list(items)  # Iterating the list while appending to it would never end
+
+        tail = self.tail
+        count = 0
+        try:
+            for item in items:
+                node = self._new_node(item)
+                node.prev = tail
+                if tail is None:
+                    self.head = node
+                else:
+                    tail.next = node
+                tail = node
+                count += 1
+        finally:
+            # Publish the nodes linked so far even if the iterable raised, so the list stays consistent
+            self.tail = tail
+            if self._size is not None:
+                self._size += count
+
+    def splice(self, other: 'DoublyLinkedList[T]', node: Optional[ListNode[T]] = None) -> None:
+        """
+        Move all the nodes of another list into this list in O(1), leaving the other list empty
+        :param other: The list whose nodes to move, which must not be this list
+        :param node: The node of this list to insert them before. Defaults to None, which appends them to the end
+        """
+        if other is self:
+            raise ValueError("Cannot splice a list into itself")
+        if other.head is None:
+            return
+
+        first, last = other.head, other.tail
+        before = self.tail if node is None else node.prev
+        first.prev = before
+        last.next = node
+        if before is None:
+            self.head = first
+        else:
+            before.next = first
+        if node is None:
+            self.tail = last
+        else:
+            node.prev = last
+
+        if self._size is not None and other._size is not None:
+            self._size += other._size
+        else:
+            self._size = None
+        if node is not None:
+            self._finger = None  # Indices from node onwards shifted by an unknown amount
+
+        other.head = other.tail = other._finger = None
+        other._size = 0
+
+    def concat(self, other: 'DoublyLinkedList[T]') -> None:
+        """
+        Move all the nodes of another list to the end of this list in O(1), leaving the other list empty
+        :param other: The list whose nodes to move, which must not be this list
+        """
+        self.splice(other)
+
+    def split_at(self, node: ListNode[T]) -> 'DoublyLinkedList[T]':
+        """
+        Cut the list before a node in O(1), moving that node and every node after it to a new list
+        :param node: The node of this list that becomes the head of the new list
+        :return: The new list, which shares this list's pool size but not its free list
+        """
+        tail = DoublyLinkedList(pool_size=self.pool_size)
+        tail.head, tail.tail = node, self.tail
+        tail._size = None
+
+        self.tail = node.prev
+        if node.prev is None:
+            self.head = None
+            self._size = 0
+        else:
+            node.prev.next = None
+            self._size = None
+        node.prev = None
 
-        self.size += 1
+        self._finger = None
+        return tail
 
-    def prepend(self, data: T) -> None:
+    def prepend(self, data: T) -> ListNode[T]:
         """
         Prepend a new node to the beginning of the list
         :param data: The data of the new node
         :return: The new node
         """
-        new_node = ListNode(data)
+        new_node = self._new_node(data)
 
-        if self.size == 0:
+        if self.head is None:
             self.head = new_node
             self.tail = new_node
         else:
@@ -61,9 +265,12 @@ class DoublyLinkedList(Generic[T]):
             self.head.prev = new_node
             self.head = new_node
 
-        self.size += 1
+        self._finger_index += 1
+        if self._size is not None:
+            self._size += 1
+        return new_node
 
-    def insert(self, index: int, data: T) -> None:
+    def insert(self, index: int, data: T) -> ListNode[T]:
         """
         Insert a new node at the given index
         :param index: The index to insert the new node
@@ -74,60 +281,187 @@ class DoublyLinkedList(Generic[T]):
             raise ValueError("Invalid index")
 
         if index == 0:
-            self.prepend(data)
-        elif index == self.size:
-            self.append(data)
-        else:
-            new_node = ListNode(data)
-            current = self.head
-            for _ in range(index - 1):
-                current = current.next
+            return self.prepend(data)
+        if index == self.size:
+            return self.append(data)
+
+        new_node = self.insert_after(self._node_at(index - 1), data)
+        self._finger = new_node
+        self._finger_index = index
+        return new_node
+
+    def insert_after(self, node: ListNode[T], data: T) -> ListNode[T]:
+        """
+        Insert a new node right after a node of this list in O(1)
+        :param node: The node of this list to insert after
+        :param data: The data of the new node
+        :return: The new node
+        """
+        if node is self.tail:
+            return self.append(data)
+
+        new_node = self._new_node(data)
+        new_node.prev = node
+        new_node.next = node.next
+        node.next.prev = new_node
+        node.next = new_node
 
-            new_node.next = current.next
-            new_node.prev = current
-            current.next.prev = new_node
-            current.next = new_node
+        self._finger = None
+        if self._size is not None:
+            self._size += 1
+        return new_node
 
-            self.size += 1
+    def insert_before(self, node: ListNode[T], data: T) -> ListNode[T]:
+        """
+        Insert a new node right before a node of this list in O(1)
+        :param node: The node of this list to insert before
+        :param data: The data of the new node
+        :return: The new node
+        """
+        if node is self.head:
+            return self.prepend(data)
+        return self.insert_after(node.prev, data)
 
-    def remove(self, index: int) -> None:
+    def remove(self, index: int) -> T:
         """
         Remove the node at the given index
         :param index: The index to remove the node
-        :return: The removed node
+        :return: The data of the removed node
         """
         if index < 0 or index >= self.size:
             raise IndexError("Invalid index")
 
-        if index == 0:
-            self.head = self.head.next
-            if self.head:
-                self.head.prev = None
-            else:
-                self.tail = None
-        elif index == self.size - 1:
-            self.tail = self.tail.prev
-            if self.tail:
-                self.tail.next = None
-            else:
-                self.head = None
+        current = self._node_at(index)
+        # The next node takes over the index, or the previous one if the last node is removed
+        if current.next is not None:
+            following, following_index = current.next, index
         else:
-            current = self.head
-            for _ in range(index):
-                current = current.next
+            following, following_index = current.prev, index - 1
+
+        data = self.remove_node(current)
+        self._release(current)
+        self._finger = following
+        self._finger_index = following_index
+        return data
+
+    def pop(self) -> T:
+        """
+        Remove the last node in O(1)
+        :return: The data of the removed node
+        """
+        if self.head is None:
+            raise IndexError("Pop from empty list")
+
+        node = self.tail
+        finger = self._finger if self._finger is not node else None
+        data = self.remove_node(node)
+        self._release(node)
+
+        self._finger = finger  # Indices before the tail do not change
+        return data
+
+    def popleft(self) -> T:
+        """
+        Remove the first node in O(1)
+        :return: The data of the removed node
+        """
+        if self.head is None:
+            raise IndexError("Pop from empty list")
+
+        node = self.head
+        finger = self._finger if self._finger is not node else None
+        data = self.remove_node(node)
+        self._release(node)
+
+        self._finger = finger
+        self._finger_index -= 1
+        return data
+
+    def remove_node(self, node: ListNode[T]) -> T:
+        """
+        Remove a node of this list in O(1). The node is detached and may be linked again with append_node
+        :param node: The node to remove
+        :return: The data of the removed node
+        """
+        if node.prev:
+            node.prev.next = node.next
+        else:
+            self.head = node.next
+        if node.next:
+            node.next.prev = node.prev
+        else:
+            self.tail = node.prev
+
+        node.prev = node.next = None
+        self._finger = None
+        if self._size is not None:
+            self._size -= 1
+        return node.data
+
+    def move_to_front(self, node: ListNode[T]) -> None:
+        """
+        Move a node of this list to the beginning of the list in O(1)
+        :param node: The node to move
+        """
+        if node is self.head:
+            return
+
+        self.remove_node(node)
+        node.next = self.head
+        self.head.prev = node
+        self.head = node
+        if self._size is not None:
+            self._size += 1
 
-            current.prev.next = current.next
-            current.next.prev = current.prev
+    def move_to_back(self, node: ListNode[T]) -> None:
+        """
+        Move a node of this list to the end of the list in O(1)
+        :param node: The node to move
+        """
+        if node is not self.tail:
+            self.remove_node(node)
+            self.append_node(node)
+
+    def rotate(self, n: int) -> None:
+        """
+        Rotate the list n steps to the right, or -n steps to the left if n is negative, by relinking it at the split
+        point in O(min(k, size - k)) steps for k = n % size, without allocating nodes
+        :param n: The number of steps to rotate
+        """
+        size = self.size
+        if size == 0:
+            return
+
+        n %= size
+        if n == 0:
+            return
+
+        new_head = self._node_at(size - n)  # Walks from the nearer end, or from the finger
+        new_tail = new_head.prev
 
-        self.size -= 1
+        self.tail.next = self.head
+        self.head.prev = self.tail
+        new_tail.next = None
+        new_head.prev = None
+        self.head, self.tail = new_head, new_tail
+
+        self._finger_index = (self._finger_index + n) % size  # _node_at left the finger on a node, which moved by n
 
     def clear(self) -> None:
         """
-        Clear the list
+        Clear the list, returning its nodes to the free list while there is room
         """
+        current = self.head
+        while current and len(self._free) < self.pool_size:
+            next_node = current.next
+            current.prev = current.next = None
+            self._release(current)
+            current = next_node
+
         self.head = None
         self.tail = None
-        self.size = 0
+        self._finger = None
+        self._size = 0
 
     def __getitem__(self, index: int) -> T:
         """
@@ -138,10 +472,7 @@ class DoublyLinkedList(Generic[T]):
         if index < 0 or index >= self.size:
             raise IndexError("Invalid index")
 
-        current = self.head
-        for _ in range(index):
-            current = current.next
-        return current.data
+        return self._node_at(index).data
 
     def __setitem__(self, index: int, data: T) -> None:
         """
@@ -152,13 +483,10 @@ class DoublyLinkedList(Generic[T]):
         if index < 0 or index >= self.size:
             raise IndexError("Invalid index")
 
-        current = self.head
-        for _ in range(index):
-            current = current.next
-        current.data = data
+        self._node_at(index).data = data
 
     def __str__(self):
-        if self.size == 0:
+        if self.head is None:
             return "Empty"
 
         current = self.head
@@ -1,3 +1,4 @@
+import random
 import unittest
 
 from LinkedList.DoublyLinkedList.DoublyLinkedList import DoublyLinkedList
@@ -106,5 +107,227 @@ class TestDoubleLinkedList(unittest.TestCase):
         self.assertEqual(self.dll.head, None)
         self.assertEqual(self.dll.tail, None)
 
+    def test_append_returns_node(self):
+        """Test that append, prepend and insert return the handle of the new node."""
+        second = self.dll.append(2)
+        first = self.dll.prepend(1)
+        third = self.dll.insert(2, 3)
+        self.assertIs(self.dll.head, first)
+        self.assertIs(first.next, second)
+        self.assertIs(self.dll.tail, third)
+
+    def test_remove_node(self):
+        """Test removing nodes by handle from the middle and both ends."""
+        nodes = [self.dll.append(i) for i in range(4)]
+        self.assertEqual(self.dll.remove_node(nodes[1]), 1)
+        self.assertEqual(self.dll.remove_node(nodes[0]), 0)
+        self.assertEqual(self.dll.remove_node(nodes[3]), 3)
+        self.assertEqual(list(self.dll), [2])
+        self.assertIs(self.dll.head, self.dll.tail)
+        self.assertIsNone(nodes[1].prev)
+        self.assertIsNone(nodes[1].next)
+        self.dll.remove_node(nodes[2])
+        self.assertEqual(len(self.dll), 0)
+        self.assertIsNone(self.dll.head)
+        self.assertIsNone(self.dll.tail)
+
+    def test_move_nodes(self):
+        """Test moving nodes to either end of the list."""
+        nodes = [self.dll.append(i) for i in range(4)]
+        self.dll.move_to_back(nodes[1])
+        self.dll.move_to_front(nodes[3])
+        self.dll.move_to_front(nodes[3])
+        self.dll.move_to_back(nodes[1])
+        self.assertEqual(list(self.dll), [3, 0, 2, 1])
+        self.assertEqual(len(self.dll), 4)
+        self.assertIsNone(self.dll.head.prev)
+        self.assertIsNone(self.dll.tail.next)
+        self.assertEqual(self.dll.tail.prev.data, 2)
+
+    def test_insert_around_node(self):
+        """Test inserting next to a node handle, including at both ends."""
+        middle = self.dll.append(2)
+        self.dll.insert_before(middle, 1)
+        self.dll.insert_after(middle, 3)
+        self.dll.insert_before(self.dll.head, 0)
+        self.dll.insert_after(self.dll.tail, 4)
+        self.assertEqual(list(self.dll), [0, 1, 2, 3, 4])
+        self.assertEqual(self.dll.tail.data, 4)
+        self.assertEqual(self.dll.tail.prev.prev.data, 2)
+
+    def test_append_node_between_lists(self):
+        """Test moving a detached node to another list."""
+        other = DoublyLinkedList()
+        node = self.dll.append(1)
+        self.dll.append(2)
+        self.dll.remove_node(node)
+        self.assertIs(other.append_node(node), node)
+        self.assertEqual(list(self.dll), [2])
+        self.assertEqual(list(other), [1])
+
+    def test_pop_both_ends(self):
+        """Test popping from both ends, and from an empty list."""
+        for i in range(3):
+            self.dll.append(i)
+        self.assertEqual(self.dll.pop(), 2)
+        self.assertEqual(self.dll.popleft(), 0)
+        self.assertEqual(self.dll.pop(), 1)
+        self.assertIsNone(self.dll.head)
+        with self.assertRaises(IndexError):
+            self.dll.popleft()
+
+    def test_node_pool_reuses_nodes(self):
+        """Test that a pooled list reuses popped and cleared nodes, up to its pool size."""
+        dll = DoublyLinkedList(pool_size=2)
+        first = dll.append(1)
+        dll.append(2)
+        dll.append(3)
+        dll.popleft()
+        self.assertIsNone(first.data)
+        self.assertIs(dll.append(4), first)
+        self.assertEqual(list(dll), [2, 3, 4])
+
+        dll.clear()
+        for i in range(3):
+            dll.append(i)
+        self.assertEqual(dll.nodes_allocated, 4)
+        self.assertEqual(dll.nodes_reused, 3)
+        self.assertEqual(list(dll), [0, 1, 2])
+
+    def test_node_pool_skips_remove_node(self):
+        """Test that nodes removed by handle are never reused."""
+        dll = DoublyLinkedList(pool_size=4)
+        node = dll.append(1)
+        dll.remove_node(node)
+        self.assertIsNot(dll.append(2), node)
+        self.assertEqual(node.data, 1)
+        self.assertEqual(dll.nodes_reused, 0)
+
+        with self.assertRaises(ValueError):
+            DoublyLinkedList(pool_size=-1)
+
+    def test_indexing_matches_list(self):
+        """Test random indexed reads, writes, inserts and removals against a Python list."""
+        rng = random.Random(0)
+        expected = []
+        for step in range(3000):
+            operation = rng.randrange(7)
+            index = rng.randrange(len(expected) + 1)
+            if operation == 0 or not expected:
+                self.dll.insert(index, step)
+                expected.insert(index, step)
+            elif operation == 1:
+                self.dll.prepend(step)
+                expected.insert(0, step)
+            elif operation == 2 and index < len(expected):
+                self.assertEqual(self.dll.remove(index), expected.pop(index))
+            elif operation == 3:
+                self.assertEqual(self.dll.popleft(), expected.pop(0))
+            elif operation == 4:
+                self.assertEqual(self.dll.pop(), expected.pop())
+            elif index < len(expected):
+                self.dll[index] = -step
+                expected[index] = -step
+            if expected:
+                index = rng.randrange(len(expected))
+                self.assertEqual(self.dll[index], expected[index])
+        self.assertEqual(list(self.dll), expected)
+
+    def test_sequential_access_uses_finger(self):
+        """Test that a scan by index walks each node once, forwards and backwards."""
+        for i in range(100):
+            self.dll.append(i)
+        self.assertEqual([self.dll[i] for i in range(100)], list(range(100)))
+        self.assertEqual(self.dll._finger_index, 99)
+        self.assertEqual([self.dll[i] for i in reversed(range(100))], list(reversed(range(100))))
+        self.dll.remove(50)
+        self.assertEqual(self.dll._finger.data, 51)
+        self.assertEqual(self.dll[50], 51)
+
+    def test_construct_from_generator(self):
+        """Test building a list from a generator and extending it with another iterable."""
+        dll = DoublyLinkedList(i * i for i in range(4))
+        dll.extend(range(2))
+        dll.extend(dll)
+        self.assertEqual(list(dll), [0, 1, 4, 9, 0, 1] * 2)
+        self.assertEqual(len(dll), 12)
+        self.assertIsNone(dll.head.prev)
+        self.assertEqual(dll.tail.prev.data, 0)
+
+    def test_extend_with_failing_generator(self):
+        """Test that items linked before an iterable raises stay consistent with the tail and size."""
+        def failing():
+            yield 1
+            yield 2
+            raise RuntimeError("source failed")
+
+        dll = DoublyLinkedList([0])
+        with self.assertRaises(RuntimeError):
+            dll.extend(failing())
+        self.assertEqual(len(dll), 3)
+        self.assertEqual(dll.tail.data, 2)
+
+        dll.append(3)
+        self.assertEqual(list(dll), [0, 1, 2, 3])
+        self.assertEqual(len(dll), 4)
+
+    def test_splice_empties_donor(self):
+        """Test concatenating lists and splicing one before a node, leaving the donors empty."""
+        other = DoublyLinkedList([3, 4])
+        self.dll.extend([1, 2])
+        self.dll.concat(other)
+        self.assertEqual(list(self.dll), [1, 2, 3, 4])
+        self.assertEqual(len(other), 0)
+        self.assertIsNone(other.head)
+
+        middle = DoublyLinkedList(["a", "b"])
+        self.assertEqual(self.dll[3], 4)
+        self.dll.splice(middle, self.dll.head.next)
+        self.assertEqual(list(self.dll), [1, "a", "b", 2, 3, 4])
+        self.assertEqual(self.dll[3], 2)
+        self.dll.splice(DoublyLinkedList([0]), self.dll.head)
+        self.assertEqual(self.dll.head.data, 0)
+        self.assertEqual(self.dll.tail.prev.data, 3)
+        self.assertEqual(len(self.dll), 7)
+        with self.assertRaises(ValueError):
+            self.dll.splice(self.dll)
+
+    def test_split_at(self):
+        """Test splitting a list at a node and merging the halves back."""
+        nodes = [self.dll.append(i) for i in range(6)]
+        tail = self.dll.split_at(nodes[4])
+        self.assertEqual(list(self.dll), [0, 1, 2, 3])
+        self.assertEqual(list(tail), [4, 5])
+        self.assertEqual(len(self.dll), 4)
+        self.assertEqual(len(tail), 2)
+
+        rest = self.dll.split_at(nodes[2])
+        rest.append(6)
+        self.assertEqual(self.dll[1], 1)
+        self.assertEqual(rest[2], 6)
+        rest.concat(tail)
+        self.assertEqual(list(rest), [2, 3, 6, 4, 5])
+        self.assertEqual(len(rest), 5)
+
+        everything = self.dll.split_at(self.dll.head)
+        self.assertEqual(len(self.dll), 0)
+        self.assertIsNone(self.dll.tail)
+        self.assertEqual(list(everything), [0, 1])
+
+    def test_rotate_relinks_nodes(self):
+        """Test rotating in both directions keeps the nodes, their links and the finger consistent."""
+        nodes = [self.dll.append(i) for i in range(6)]
+        self.assertEqual(self.dll[1], 1)
+        self.dll.rotate(2)
+        self.assertEqual(list(self.dll), [4, 5, 0, 1, 2, 3])
+        self.assertIs(self.dll.head, nodes[4])
+        self.assertIsNone(self.dll.head.prev)
+        self.assertIsNone(self.dll.tail.next)
+        self.assertEqual([self.dll[i] for i in range(6)], [4, 5, 0, 1, 2, 3])
+        self.dll.rotate(-5)
+        self.assertEqual(list(self.dll), [3, 4, 5, 0, 1, 2])
+        self.assertEqual(self.dll.tail.prev.data, 1)
+        self.assertEqual(self.dll.nodes_allocated, 6)
+
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,125 @@
+from typing import TypeVar, Generic, Optional, Iterable, Iterator, Type
+
+from LinkedList.SinglyLinkedList.SinglyLinkedList import ListNode, SinglyLinkedList
+
+T = TypeVar('T')
+
+"""
+Why a persistent linked list?
+
+Keeping old versions of a mutable SinglyLinkedList, such as the states of an undo history, means copying the whole list
+for every version. A PersistentLinkedList is never modified: add_at_head returns a new list whose first node points at
+the first node of the old list, so the two versions share every node but one. Keeping a version costs one node, the
+old version stays valid, and head and tail are O(1) because the rest of a list is itself a list.
+
+The nodes are the ListNode of SinglyLinkedList. They are only linked while a list is being built, before any other list
+can reach them, and never relinked afterwards; to_singly_linked_list copies them, so the mutable list cannot change a
+node that a version shares.
+"""
+
+class PersistentLinkedList(Generic[T]):
+    __slots__ = ("_node", "size")
+
+    def __init__(self, items: Optional[Iterable[T]] = None):
+        """
+        Initialize the list with the items of an iterable, in order.
+        :param items: The items of the list, which may be a generator
+        """
+        self._node: Optional[ListNode[T]] = None
+        self.size = 0
+
+        if items is not None:
+            last = None
+            for item in items:
+                node = ListNode(item)
+                if last is None:
+                    self._node = node
+                else:
+                    last.next = node  # The node is not shared with any list yet
+                last = node
+                self.size += 1
+
+    @classmethod
+    def _version(cls: Type['PersistentLinkedList[T]'], node: Optional[ListNode[T]], size: int
+                 ) -> 'PersistentLinkedList[T]':
+        """
+        Wrap a chain of nodes in a new list without copying it.
+        :param node: The first node of the list
+        :param size: The number of nodes in the chain
+        :return: The new list
+        """
+        version = cls.__new__(cls)
+        version._node = node
+        version.size = size
+        return version
+
+    def __len__(self) -> int:
+        return self.size
+
+    def add_at_head(self, data: T) -> 'PersistentLinkedList[T]':
+        """
+        Add a value before the first element in O(1), sharing every node of this list.
+        :param data: The value to prepend
+        :return: A new list starting with the value, followed by this list
+        """
+        return self._version(ListNode(data, self._node), self.size + 1)
+
+    @property
+    def head(self) -> T:
+        """
+        Get the first value in O(1).
+        :return: The first value
+        """
+        if self._node is None:
+            raise IndexError("Head of empty list")
+        return self._node.value
+
+    @property
+    def tail(self) -> 'PersistentLinkedList[T]':
+        """
+        Get the list of every value but the first in O(1), sharing its nodes with this list.
+        :return: The rest of the list
+        """
+        if self._node is None:
+            raise IndexError("Tail of empty list")
+        return self._version(self._node.next, self.size - 1)
+
+    def reverse(self) -> 'PersistentLinkedList[T]':
+        """
+        Build the list of the values in reverse order, which shares no nodes with this list.
+        :return: The reversed list
+        """
+        node = None
+        for value in self:
+            node = ListNode(value, node)
+        return self._version(node, self.size)
+
+    @classmethod
+    def from_singly_linked_list(cls: Type['PersistentLinkedList[T]'], singly_linked_list: SinglyLinkedList[T]
+                                ) -> 'PersistentLinkedList[T]':
+        """
+        Build a persistent list holding the values of a SinglyLinkedList, copying its nodes.
+        :param singly_linked_list: The list to copy
+        :return: The persistent list
+        """
+        return cls(singly_linked_list)
+
+    def to_singly_linked_list(self) -> SinglyLinkedList[T]:
+        """
+        Copy the values into a new, mutable SinglyLinkedList.
+        :return: The mutable list
+        """
+        return SinglyLinkedList(self)
+
+    def __str__(self):
+        return '->'.join(str(value) for value in self)
+
+    def __repr__(self):
+        return self.__str__()
+
+    def __iter__(self) -> Iterator[T]:
+        current = self._node
+
+        while current:
+            yield current.value
+            current = current.next
@@ -0,0 +1,58 @@
+import unittest
+
+from LinkedList.PersistentLinkedList.PersistentLinkedList import PersistentLinkedList
+from LinkedList.SinglyLinkedList.SinglyLinkedList import SinglyLinkedList
+
+class TestPersistentLinkedList(unittest.TestCase):
+    def test_add_at_head_keeps_old_versions(self):
+        empty = PersistentLinkedList()
+        one = empty.add_at_head(1)
+        two = one.add_at_head(2)
+        branch = one.add_at_head(3)
+        self.assertEqual(list(empty), [])
+        self.assertEqual(list(one), [1])
+        self.assertEqual(list(two), [2, 1])
+        self.assertEqual(list(branch), [3, 1])
+        self.assertEqual(len(two), 2)
+        self.assertIs(two.tail._node, one._node)
+        self.assertIs(branch.tail._node, one._node)
+
+    def test_head_and_tail(self):
+        versions = PersistentLinkedList(i for i in range(3))
+        self.assertEqual(versions.head, 0)
+        self.assertEqual(list(versions.tail), [1, 2])
+        self.assertEqual(len(versions.tail.tail), 1)
+        self.assertEqual(str(versions), "0->1->2")
+        with self.assertRaises(IndexError):
+            PersistentLinkedList().head
+        with self.assertRaises(IndexError):
+            PersistentLinkedList().tail
+
+    def test_reverse(self):
+        versions = PersistentLinkedList([1, 2, 3])
+        reversed_versions = versions.reverse()
+        self.assertEqual(list(reversed_versions), [3, 2, 1])
+        self.assertEqual(list(versions), [1, 2, 3])
+        self.assertEqual(len(reversed_versions), 3)
+
+    def test_conversion_copies_nodes(self):
+        mutable = SinglyLinkedList([1, 2])
+        versions = PersistentLinkedList.from_singly_linked_list(mutable)
+        mutable.add_at_tail(3)
+        self.assertEqual(list(versions), [1, 2])
+
+        copy = versions.add_at_head(0).to_singly_linked_list()
+        copy.delete_at_index(1)
+        copy.add_at_tail(4)
+        self.assertEqual(list(copy), [0, 2, 4])
+        self.assertEqual(list(versions), [1, 2])
+
+    def test_iteration_is_lazy(self):
+        versions = PersistentLinkedList(range(3))
+        iterator = iter(versions)
+        self.assertEqual(next(iterator), 0)
+        self.assertEqual(list(iterator), [1, 2])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,7 +1,21 @@
-from typing import TypeVar, Generic, Optional
+from typing import TypeVar, Generic, Optional, Iterable, Iterator, Tuple
 
 T = TypeVar('T')
 
+"""
+Why keep a tail pointer?
+
+Without it, appending has to walk from head to the last node, so building a list of n items by appending costs O(n^2).
+The list keeps a reference to its last node and its size, and every operation that can change either updates them, so
+add_at_tail and extend only link nodes after the tail.
+
+Why sort bottom-up?
+
+A top-down merge sort has to find the middle of each sublist and recurses O(log n) deep. A bottom-up merge sort instead
+merges adjacent runs of 1, 2, 4, ... nodes in passes over the list, cutting each run off by counting nodes. Merging only
+relinks the existing nodes, so sorting allocates no nodes and uses O(1) extra space.
+"""
+
 class ListNode(Generic[T]):
     def __init__(self, value: T = 0, nxt: 'Optional[ListNode[T]]' = None):
         self.value = value
@@ -14,8 +28,16 @@ class ListNode(Generic[T]):
         return str(self.value)
 
 class SinglyLinkedList(Generic[T]):
-    def __init__(self):
+    def __init__(self, items: Optional[Iterable[T]] = None):
         self.head: Optional[ListNode[T]] = None
+        self.tail: Optional[ListNode[T]] = None
+        self.size = 0
+
+        if items is not None:
+            self.extend(items)
+
+    def __len__(self) -> int:
+        return self.size
 
     def add_at_head(self, data: T) -> None:
         """
@@ -24,6 +46,9 @@ class SinglyLinkedList(Generic[T]):
         :return: The linked list after the insertion
         """
         self.head = ListNode(data, self.head)
+        if self.tail is None:
+            self.tail = self.head
+        self.size += 1
 
     def add_at_tail(self, data: T) -> None:
         """
@@ -31,14 +56,37 @@ class SinglyLinkedList(Generic[T]):
         :param data: The data of the node to append
         :return: The linked list after the insertion
         """
-        if not self.head:
-            self.head = ListNode(data)
-            return
-
-        current = self.head
-        while current.next:
-            current = current.next
-        current.next = ListNode(data)
+        node = ListNode(data)
+        if self.tail is None:
+            self.head = node
+        else:
+            self.tail.next = node
+        self.tail = node
+        self.size += 1
+
+    def extend(self, items: Iterable[T]) -> None:
+        """
+        Append the items of an iterable to the end of the linked list, linking the new nodes in one pass.
+        :param items: The items to append, which may be a generator
+        """
+        if items is self:
+            items = list(items)  # Iterating the list while appending to it would never end
+
+        tail = self.tail
+        count = 0
+        try:
+            for item in items:
+                node = ListNode(item)
+                if tail is None:
+                    self.head = node
+                else:
+                    tail.next = node
+                tail = node
+                count += 1
+        finally:
+            # Publish the nodes linked so far even if the iterable raised, so the list stays consistent
+            self.tail = tail
+            self.size += count
 
     def add_at_index(self, index: int, data: T) -> None:
         """
@@ -47,23 +95,23 @@ class SinglyLinkedList(Generic[T]):
         :param data: The data of the node to insert
         :return: The linked list after the insertion
         """
-        if index < 0:
+        if index < 0 or index > self.size:
             return
 
         if index == 0:
             self.add_at_head(data)
             return
 
+        if index == self.size:
+            self.add_at_tail(data)
+            return
+
         current = self.head
         for _ in range(index - 1):
-            if not current:
-                return
             current = current.next
 
-        if not current:
-            return
-
         current.next = ListNode(data, current.next)
+        self.size += 1
 
     def delete_at_index(self, index: int) -> None:
         """
@@ -71,24 +119,91 @@ class SinglyLinkedList(Generic[T]):
         :param index: The index of the node to delete
         :return: The linked list after the deletion
         """
-        if index < 0:
+        if index < 0 or index >= self.size:
             return
 
-        if index == 0 and self.head:
+        self.size -= 1
+        if index == 0:
             self.head = self.head.next
+            if self.head is None:
+                self.tail = None
             return
 
         current = self.head
         for _ in range(index - 1):
-            if not current:
-                return
             current = current.next
 
-        if not current or not current.next:
-            return
-
+        if current.next is self.tail:
+            self.tail = current
         current.next = current.next.next
 
+    @staticmethod
+    def _cut(node: Optional[ListNode[T]], length: int) -> Optional[ListNode[T]]:
+        """
+        Detach the run of up to length nodes starting at a node from the nodes after it.
+        :param node: The first node of the run
+        :param length: The number of nodes in the run
+        :return: The first node after the run
+        """
+        for _ in range(length - 1):
+            if node is None:
+                return None
+            node = node.next
+
+        if node is None:
+            return None
+        rest = node.next
+        node.next = None
+        return rest
+
+    @staticmethod
+    def _merge(left: Optional[ListNode[T]], right: Optional[ListNode[T]]
+               ) -> Tuple[Optional[ListNode[T]], Optional[ListNode[T]]]:
+        """
+        Merge two sorted runs by relinking their nodes, taking from the left run on ties to keep the sort stable.
+        :param left: The first node of the left run
+        :param right: The first node of the right run
+        :return: The first and last nodes of the merged run
+        """
+        if right is None or (left is not None and not right.value < left.value):
+            head, left = left, left.next if left else None
+        else:
+            head, right = right, right.next
+        tail = head
+
+        while left is not None and right is not None:
+            if right.value < left.value:
+                tail.next, right = right, right.next
+            else:
+                tail.next, left = left, left.next
+            tail = tail.next
+
+        tail.next = left if left is not None else right
+        while tail.next is not None:
+            tail = tail.next
+        return head, tail
+
+    def sort(self) -> None:
+        """
+        Sort the linked list in place with a stable bottom-up merge sort, in O(n log n) time and without allocating nodes.
+        """
+        width = 1
+        while width < self.size:
+            current = self.head
+            head = tail = None
+            while current is not None:
+                left = current
+                right = self._cut(left, width)
+                current = self._cut(right, width)
+                merged_head, merged_tail = self._merge(left, right)
+                if tail is None:
+                    head = merged_head
+                else:
+                    tail.next = merged_head
+                tail = merged_tail
+            self.head, self.tail = head, tail
+            width *= 2
+
     def __str__(self):
         result = []
         current = self.head
@@ -99,3 +214,10 @@ class SinglyLinkedList(Generic[T]):
 
     def __repr__(self):
         return self.__str__()
+
+    def __iter__(self) -> Iterator[T]:
+        current = self.head
+
+        while current:
+            yield current.value
+            current = current.next
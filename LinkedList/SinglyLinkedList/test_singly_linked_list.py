@@ -1,3 +1,4 @@
+import random
 import unittest
 
 from LinkedList.SinglyLinkedList.SinglyLinkedList import SinglyLinkedList
@@ -34,6 +35,89 @@ class TestSinglyLinkedList(unittest.TestCase):
             singly_linked_list.add_at_index(index, value)
         self.assert_linked_list(singly_linked_list, values_to_add)
 
+    def test_tail_and_size_tracking(self):
+        singly_linked_list = SinglyLinkedList()
+        singly_linked_list.add_at_head(2)
+        singly_linked_list.add_at_tail(3)
+        singly_linked_list.add_at_index(0, 1)
+        singly_linked_list.add_at_index(3, 4)
+        singly_linked_list.add_at_index(9, 9)
+        self.assertEqual(len(singly_linked_list), 4)
+        self.assertEqual(singly_linked_list.tail.value, 4)
+
+        singly_linked_list.delete_at_index(3)
+        self.assertEqual(singly_linked_list.tail.value, 3)
+        singly_linked_list.add_at_tail(5)
+        singly_linked_list.delete_at_index(7)
+        self.assertEqual(list(singly_linked_list), [1, 2, 3, 5])
+
+        for _ in range(4):
+            singly_linked_list.delete_at_index(0)
+        self.assertEqual(len(singly_linked_list), 0)
+        self.assertIsNone(singly_linked_list.tail)
+        singly_linked_list.add_at_tail(6)
+        self.assert_linked_list(singly_linked_list, [6])
+
+    def test_extend(self):
+        singly_linked_list = SinglyLinkedList(i for i in range(3))
+        singly_linked_list.extend([3, 4])
+        singly_linked_list.extend(singly_linked_list)
+        self.assert_linked_list(singly_linked_list, [0, 1, 2, 3, 4] * 2)
+        self.assertEqual(len(singly_linked_list), 10)
+        self.assertEqual(singly_linked_list.tail.value, 4)
+
+    def test_extend_with_failing_generator(self):
+        def failing():
+            yield 1
+            yield 2
+            raise RuntimeError("source failed")
+
+        singly_linked_list = SinglyLinkedList([0])
+        with self.assertRaises(RuntimeError):
+            singly_linked_list.extend(failing())
+        self.assertEqual(len(singly_linked_list), 3)
+        self.assertEqual(singly_linked_list.tail.value, 2)
+
+        singly_linked_list.add_at_tail(3)
+        self.assert_linked_list(singly_linked_list, [0, 1, 2, 3])
+        self.assertEqual(len(singly_linked_list), 4)
+
+    def test_sort(self):
+        rng = random.Random(0)
+        for size in (0, 1, 2, 7, 100):
+            values = [rng.randrange(20) for _ in range(size)]
+            singly_linked_list = SinglyLinkedList(values)
+            nodes = set()
+            current = singly_linked_list.head
+            while current:
+                nodes.add(id(current))
+                current = current.next
+
+            singly_linked_list.sort()
+            self.assert_linked_list(singly_linked_list, sorted(values))
+            self.assertEqual(len(singly_linked_list), size)
+            if size:
+                self.assertEqual(singly_linked_list.tail.value, max(values))
+                self.assertIsNone(singly_linked_list.tail.next)
+
+            current = singly_linked_list.head
+            while current:
+                self.assertIn(id(current), nodes)
+                current = current.next
+
+    def test_sort_is_stable(self):
+        class Entry:
+            def __init__(self, key, label):
+                self.key = key
+                self.label = label
+
+            def __lt__(self, other):
+                return self.key < other.key
+
+        singly_linked_list = SinglyLinkedList(Entry(key, label) for key, label in [(1, "a"), (0, "b"), (1, "c"), (0, "d")])
+        singly_linked_list.sort()
+        self.assertEqual([entry.label for entry in singly_linked_list], ["b", "d", "a", "c"])
+
 
 if __name__ == '__main__':
     unittest.main()
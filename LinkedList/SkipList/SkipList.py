@@ -0,0 +1,274 @@
+import random
+from typing import TypeVar, Generic, Optional, List, Iterable, Iterator, Tuple
+
+K = TypeVar('K')
+V = TypeVar('V')
+
+"""
+Why a skip list?
+
+A sorted DoublyLinkedList has to be walked from one end to find where a key belongs, so every search, insert and remove
+is O(n). A skip list keeps that linked list as its bottom level and adds express lanes above it: each node is linked on a
+random number of levels, where every level above the bottom holds about half the nodes of the level below. A search
+walks along the top level until the next key is too large, then drops a level and repeats, so it takes O(log n) expected
+steps, without any of the rotations or rebalancing of the trees in Graph/Tree. An insert or remove only relinks the
+neighbours of one node on each of its levels, which is also what makes skip lists a common choice for concurrent ordered
+maps.
+
+With allow_duplicates, equal keys are kept as separate nodes, such as events sharing a timestamp. A new node is linked
+after the nodes with an equal key, so equal keys stay in insertion order, and since every search stops before the first
+node with an equal key, search, remove, rank and range see all of them, oldest first.
+
+Each link also records its span, the number of bottom-level steps it skips. Adding up the spans of the links followed
+during a search gives the rank of a key in O(log n), and following spans finds the node at an index the same way.
+"""
+
+
+class SkipListNode(Generic[K, V]):
+    __slots__ = ("key", "value", "forward", "span")
+
+    def __init__(self, key: K, value: V, level: int):
+        self.key = key
+        self.value = value
+        self.forward: List[Optional['SkipListNode[K, V]']] = [None] * level
+        self.span: List[int] = [0] * level  # Bottom-level steps skipped by each forward link
+
+    def __str__(self):
+        return f"{self.key}: {self.value}"
+
+    def __repr__(self):
+        return f"{self.key}: {self.value}"
+
+
+class SkipList(Generic[K, V]):
+    def __init__(self, items: Optional[Iterable[Tuple[K, V]]] = None, max_level: int = 32, p: float = 0.5,
+                 seed: Optional[int] = None, allow_duplicates: bool = False):
+        """
+        Initialize the skip list
+        :param items: An iterable of (key, value) pairs to insert
+        :param max_level: The maximum number of levels of a node. Defaults to 32, enough for about 2 ** 32 keys
+        :param p: The probability that a node is linked on the next level up. Defaults to 0.5
+        :param seed: The seed of the random levels, for reproducible layouts. Defaults to None
+        :param allow_duplicates: Keep every inserted key instead of replacing the value of an equal key. Defaults to
+            False
+        """
+        if max_level < 1:
+            raise ValueError("max_level must be at least 1")
+        if not 0 < p < 1:
+            raise ValueError("p must be between 0 and 1")
+
+        self.max_level = max_level
+        self.p = p
+        self.allow_duplicates = allow_duplicates
+        self._random = random.Random(seed)
+        self.head: SkipListNode[K, V] = SkipListNode(None, None, max_level)
+        self.level = 1  # The number of levels in use
+        self.size = 0
+
+        if items is not None:
+            for key, value in items:
+                self.insert(key, value)
+
+    def __len__(self) -> int:
+        return self.size
+
+    def __contains__(self, key: K) -> bool:
+        return self.search(key) is not None
+
+    def _random_level(self) -> int:
+        """
+        Draw the number of levels of a new node
+        :return: The number of levels, between 1 and max_level
+        """
+        level = 1
+        while level < self.max_level and self._random.random() < self.p:
+            level += 1
+        return level
+
+    def _predecessors(self, key: K, after_equal: bool = False) -> Tuple[List[SkipListNode[K, V]], List[int]]:
+        """
+        Find, on every level in use, the last node whose key is less than the key, and its rank
+        :param key: The key to search for
+        :param after_equal: Find the last node whose key is less than or equal to the key instead
+        :return: The predecessor on each level, and the number of keys up to and including each predecessor
+        """
+        update = [self.head] * self.max_level
+        rank = [0] * self.max_level
+        current = self.head
+
+        for i in reversed(range(self.level)):
+            rank[i] = rank[i + 1] if i + 1 < self.level else 0
+            while current.forward[i] is not None and (current.forward[i].key < key or
+                                                      after_equal and current.forward[i].key == key):
+                rank[i] += current.span[i]
+                current = current.forward[i]
+            update[i] = current
+
+        return update, rank
+
+    def insert(self, key: K, value: V = None) -> SkipListNode[K, V]:
+        """
+        Insert a key with a value in O(log n) expected time. If the key is already present, its value is replaced, or
+        with allow_duplicates a new node is added after the nodes with an equal key
+        :param key: The key to insert
+        :param value: The value of the key. Defaults to None
+        :return: The node of the key
+        """
+        update, rank = self._predecessors(key, self.allow_duplicates)
+
+        existing = update[0].forward[0]
+        if not self.allow_duplicates and existing is not None and existing.key == key:
+            existing.value = value
+            return existing
+
+        level = self._random_level()
+        if level > self.level:
+            for i in range(self.level, level):
+                update[i] = self.head
+                rank[i] = 0
+                self.head.span[i] = self.size
+            self.level = level
+
+        node = SkipListNode(key, value, level)
+        for i in range(level):
+            node.forward[i] = update[i].forward[i]
+            update[i].forward[i] = node
+            node.span[i] = update[i].span[i] - (rank[0] - rank[i])
+            update[i].span[i] = rank[0] - rank[i] + 1
+
+        for i in range(level, self.level):  # Links passing over the new node skip one more step
+            update[i].span[i] += 1
+
+        self.size += 1
+        return node
+
+    def remove(self, key: K) -> V:
+        """
+        Remove a key in O(log n) expected time. With allow_duplicates, the oldest node with the key is removed
+        :param key: The key to remove
+        :return: The value of the removed key
+        """
+        update, _ = self._predecessors(key)
+
+        node = update[0].forward[0]
+        if node is None or node.key != key:
+            raise KeyError(key)
+
+        for i in range(self.level):
+            if update[i].forward[i] is node:
+                update[i].span[i] += node.span[i] - 1
+                update[i].forward[i] = node.forward[i]
+            else:
+                update[i].span[i] -= 1
+
+        while self.level > 1 and self.head.forward[self.level - 1] is None:
+            self.level -= 1
+
+        self.size -= 1
+        return node.value
+
+    def search(self, key: K) -> Optional[SkipListNode[K, V]]:
+        """
+        Search for a key in O(log n) expected time
+        :param key: The key to search for
+        :return: The node of the key, or None if the key is not present
+        """
+        node = self.ceiling(key)
+        if node is not None and node.key == key:
+            return node
+        return None
+
+    def floor(self, key: K) -> Optional[SkipListNode[K, V]]:
+        """
+        Find the node with the greatest key less than or equal to a key
+        :param key: The key to search for
+        :return: The node, or None if every key is greater
+        """
+        current = self.head
+        for i in reversed(range(self.level)):
+            while current.forward[i] is not None and current.forward[i].key <= key:
+                current = current.forward[i]
+        return current if current is not self.head else None
+
+    def ceiling(self, key: K) -> Optional[SkipListNode[K, V]]:
+        """
+        Find the node with the least key greater than or equal to a key
+        :param key: The key to search for
+        :return: The node, or None if every key is less
+        """
+        current = self.head
+        for i in reversed(range(self.level)):
+            while current.forward[i] is not None and current.forward[i].key < key:
+                current = current.forward[i]
+        return current.forward[0]
+
+    def rank(self, key: K) -> int:
+        """
+        Count the keys less than a key in O(log n) expected time, which is the index the key has or would have
+        :param key: The key to rank
+        :return: The number of keys less than the key
+        """
+        rank = 0
+        current = self.head
+        for i in reversed(range(self.level)):
+            while current.forward[i] is not None and current.forward[i].key < key:
+                rank += current.span[i]
+                current = current.forward[i]
+        return rank
+
+    def at(self, index: int) -> SkipListNode[K, V]:
+        """
+        Get the node at an index in key order in O(log n) expected time
+        :param index: The index of the node
+        :return: The node
+        """
+        if index < 0 or index >= self.size:
+            raise IndexError("Invalid index")
+
+        traversed = 0
+        current = self.head
+        for i in reversed(range(self.level)):
+            while current.forward[i] is not None and traversed + current.span[i] <= index + 1:
+                traversed += current.span[i]
+                current = current.forward[i]
+        return current
+
+    def range(self, start: Optional[K] = None, stop: Optional[K] = None) -> Iterator[Tuple[K, V]]:
+        """
+        Iterate over the keys from start (inclusive) to stop (exclusive) in order
+        :param start: The least key to include. Defaults to None, which starts at the first key
+        :param stop: The key to stop before. Defaults to None, which runs to the last key
+        :return: An iterator over the (key, value) pairs in the range
+        """
+        current = self.head.forward[0] if start is None else self.ceiling(start)
+
+        while current is not None and (stop is None or current.key < stop):
+            yield current.key, current.value
+            current = current.forward[0]
+
+    def items(self) -> Iterator[Tuple[K, V]]:
+        """
+        Iterate over the (key, value) pairs in key order
+        :return: An iterator over the pairs
+        """
+        return self.range()
+
+    def clear(self) -> None:
+        """
+        Clear the skip list
+        """
+        self.head = SkipListNode(None, None, self.max_level)
+        self.level = 1
+        self.size = 0
+
+    def __str__(self):
+        if self.size == 0:
+            return "Empty"
+        return "[" + ", ".join(f"{key}: {value}" for key, value in self.range()) + "]"
+
+    def __iter__(self) -> Iterator[K]:
+        current = self.head.forward[0]
+
+        while current:
+            yield current.key
+            current = current.forward[0]
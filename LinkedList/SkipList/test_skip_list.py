@@ -0,0 +1,127 @@
+import bisect
+import random
+import unittest
+
+from LinkedList.SkipList.SkipList import SkipList
+
+class TestSkipList(unittest.TestCase):
+    def setUp(self):
+        self.skip_list = SkipList(seed=0)
+
+    def test_insert_keeps_keys_sorted(self):
+        """Test that keys come back in order whatever the insertion order."""
+        for key in [5, 1, 9, 3, 7]:
+            self.skip_list.insert(key, str(key))
+        self.assertEqual(list(self.skip_list), [1, 3, 5, 7, 9])
+        self.assertEqual(len(self.skip_list), 5)
+        self.assertEqual(str(self.skip_list), "[1: 1, 3: 3, 5: 5, 7: 7, 9: 9]")
+
+    def test_insert_existing_key_replaces_value(self):
+        """Test that inserting a present key replaces its value without growing the list."""
+        self.skip_list.insert(1, "a")
+        node = self.skip_list.insert(1, "b")
+        self.assertEqual(node.value, "b")
+        self.assertEqual(len(self.skip_list), 1)
+
+    def test_duplicate_keys_keep_every_event(self):
+        """Test that with allow_duplicates, events sharing a timestamp are all kept in insertion order."""
+        events = SkipList(seed=0, allow_duplicates=True)
+        events.insert(2.0, "second")
+        events.insert(1.0, "open")
+        events.insert(2.0, "second again")
+        events.insert(3.0, "close")
+        events.insert(2.0, "second, third time")
+
+        self.assertEqual(len(events), 5)
+        self.assertEqual(list(events.range(2.0, 3.0)),
+                         [(2.0, "second"), (2.0, "second again"), (2.0, "second, third time")])
+        self.assertEqual(events.rank(2.0), 1)
+        self.assertEqual(events.rank(3.0), 4)
+        self.assertEqual([events.at(i).value for i in range(5)],
+                         ["open", "second", "second again", "second, third time", "close"])
+        self.assertEqual(events.remove(2.0), "second")
+        self.assertEqual(events.search(2.0).value, "second again")
+        self.assertEqual(len(events), 4)
+
+    def test_duplicate_ranks_match_sorted_list(self):
+        """Test that spans stay correct when many equal keys are inserted and removed."""
+        rng = random.Random(3)
+        skip_list = SkipList(seed=3, allow_duplicates=True)
+        expected = []
+        for _ in range(500):
+            key = rng.randrange(20)
+            skip_list.insert(key)
+            bisect.insort(expected, key)
+            if rng.random() < 0.3:
+                key = rng.choice(expected)
+                skip_list.remove(key)
+                expected.remove(key)
+
+        self.assertEqual(list(skip_list), expected)
+        for key in range(21):
+            self.assertEqual(skip_list.rank(key), bisect.bisect_left(expected, key))
+        self.assertEqual([skip_list.at(i).key for i in range(len(expected))], expected)
+
+    def test_search_and_remove(self):
+        """Test searching for present and missing keys, and removing keys."""
+        skip_list = SkipList([(key, key * 10) for key in range(10)], seed=1)
+        self.assertEqual(skip_list.search(4).value, 40)
+        self.assertIsNone(skip_list.search(10))
+        self.assertEqual(skip_list.remove(4), 40)
+        self.assertNotIn(4, skip_list)
+        self.assertIn(5, skip_list)
+        with self.assertRaises(KeyError):
+            skip_list.remove(4)
+
+    def test_floor_and_ceiling(self):
+        """Test floor and ceiling between, on and beyond the keys."""
+        skip_list = SkipList([(key, None) for key in (10, 20, 30)], seed=2)
+        self.assertEqual(skip_list.floor(25).key, 20)
+        self.assertEqual(skip_list.floor(20).key, 20)
+        self.assertIsNone(skip_list.floor(5))
+        self.assertEqual(skip_list.ceiling(25).key, 30)
+        self.assertEqual(skip_list.ceiling(30).key, 30)
+        self.assertIsNone(skip_list.ceiling(31))
+
+    def test_range(self):
+        """Test iterating over half-open and open-ended key ranges."""
+        skip_list = SkipList([(key, key) for key in range(0, 100, 10)], seed=3)
+        self.assertEqual([key for key, _ in skip_list.range(25, 60)], [30, 40, 50])
+        self.assertEqual([key for key, _ in skip_list.range(80)], [80, 90])
+        self.assertEqual([key for key, _ in skip_list.range(stop=20)], [0, 10])
+        self.assertEqual(list(skip_list.range(95)), [])
+
+    def test_rank_and_at_match_sorted_list(self):
+        """Test ranks and indexed access against a sorted Python list under random inserts and removals."""
+        rng = random.Random(4)
+        expected = []
+        for _ in range(2000):
+            key = rng.randrange(500)
+            position = bisect.bisect_left(expected, key)
+            present = position < len(expected) and expected[position] == key
+            if present and rng.random() < 0.5:
+                self.skip_list.remove(key)
+                expected.pop(position)
+            elif not present:
+                self.skip_list.insert(key)
+                expected.insert(position, key)
+
+            probe = rng.randrange(500)
+            self.assertEqual(self.skip_list.rank(probe), bisect.bisect_left(expected, probe))
+            if expected:
+                index = rng.randrange(len(expected))
+                self.assertEqual(self.skip_list.at(index).key, expected[index])
+        self.assertEqual(list(self.skip_list), expected)
+        with self.assertRaises(IndexError):
+            self.skip_list.at(len(expected))
+
+    def test_clear(self):
+        """Test clearing the skip list."""
+        self.skip_list.insert(1)
+        self.skip_list.clear()
+        self.assertEqual(len(self.skip_list), 0)
+        self.assertEqual(str(self.skip_list), "Empty")
+        self.assertIsNone(self.skip_list.ceiling(0))
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,262 @@
+from typing import TypeVar, Generic, Optional, List, Tuple, Iterator
+
+T = TypeVar('T')
+
+"""
+Why unroll a linked list?
+
+A DoublyLinkedList allocates one ListNode per item, so a list of small items spends most of its memory on node objects
+and their prev/next pointers, and a walk jumps between objects scattered over the heap. An unrolled linked list links
+chunks instead: each chunk holds up to chunk_size items in a Python list, so the per-item overhead is one list slot, and
+walking to an index skips a whole chunk at a time by its length.
+
+- A full chunk splits in half before an insertion, so inserting in the middle only moves items within one chunk.
+- A chunk that drops below half full after a removal merges with its neighbour when their items fit in one chunk, so
+  chunks stay at least half full on average and indexed access keeps skipping large steps.
+- Appending to a full last chunk (or prepending to a full first chunk) starts a new chunk instead of splitting, so
+  lists built by appending consist of full chunks.
+"""
+
+
+class Chunk(Generic[T]):
+    __slots__ = ("items", "next", "prev")
+
+    def __init__(self, items: List[T]):
+        self.items = items
+        self.next: Optional['Chunk[T]'] = None
+        self.prev: Optional['Chunk[T]'] = None
+
+    def __str__(self):
+        return str(self.items)
+
+    def __repr__(self):
+        return str(self.items)
+
+
+class UnrolledLinkedList(Generic[T]):
+    def __init__(self, items: Optional[List[T]] = None, chunk_size: int = 64):
+        """
+        Initialize the list
+        :param items: The items to append to the list
+        :param chunk_size: The maximum number of items per chunk. Defaults to 64
+        """
+        if chunk_size < 2:
+            raise ValueError("chunk_size must be at least 2")
+
+        self.head: Optional[Chunk[T]] = None
+        self.tail: Optional[Chunk[T]] = None
+        self.size = 0
+        self.chunk_size = chunk_size
+
+        if items is not None:
+            for item in items:
+                self.append(item)
+
+    def __len__(self) -> int:
+        return self.size
+
+    def _link_after(self, chunk: Optional[Chunk[T]], new_chunk: Chunk[T]) -> None:
+        """
+        Link a new chunk after a chunk, or at the front of the list if chunk is None
+        :param chunk: The chunk to link after, or None
+        :param new_chunk: The detached chunk
+        """
+        new_chunk.prev = chunk
+        new_chunk.next = chunk.next if chunk else self.head
+        if new_chunk.next:
+            new_chunk.next.prev = new_chunk
+        else:
+            self.tail = new_chunk
+        if chunk:
+            chunk.next = new_chunk
+        else:
+            self.head = new_chunk
+
+    def _unlink(self, chunk: Chunk[T]) -> None:
+        """
+        Unlink a chunk from the list
+        :param chunk: The chunk to unlink
+        """
+        if chunk.prev:
+            chunk.prev.next = chunk.next
+        else:
+            self.head = chunk.next
+        if chunk.next:
+            chunk.next.prev = chunk.prev
+        else:
+            self.tail = chunk.prev
+
+    def _locate(self, index: int) -> Tuple[Chunk[T], int]:
+        """
+        Find the chunk holding a valid index, skipping whole chunks from the nearer end of the list
+        :param index: The index of the item, which must be in range
+        :return: The chunk and the offset of the item within it
+        """
+        if index < self.size // 2:
+            chunk = self.head
+            while index >= len(chunk.items):
+                index -= len(chunk.items)
+                chunk = chunk.next
+            return chunk, index
+
+        index = self.size - 1 - index  # Distance from the end of the list
+        chunk = self.tail
+        while index >= len(chunk.items):
+            index -= len(chunk.items)
+            chunk = chunk.prev
+        return chunk, len(chunk.items) - 1 - index
+
+    def _rebalance(self, chunk: Chunk[T]) -> None:
+        """
+        Drop a chunk that became empty, or merge a chunk that fell below half full with a neighbour if they fit in one
+        :param chunk: The chunk an item was removed from
+        """
+        if not chunk.items:
+            self._unlink(chunk)
+            return
+
+        if len(chunk.items) >= self.chunk_size // 2:
+            return
+
+        if chunk.next and len(chunk.items) + len(chunk.next.items) <= self.chunk_size:
+            chunk.items.extend(chunk.next.items)
+            self._unlink(chunk.next)
+        elif chunk.prev and len(chunk.prev.items) + len(chunk.items) <= self.chunk_size:
+            chunk.prev.items.extend(chunk.items)
+            self._unlink(chunk)
+
+    def append(self, data: T) -> None:
+        """
+        Append an item to the end of the list
+        :param data: The item to append
+        """
+        if self.tail is None or len(self.tail.items) >= self.chunk_size:
+            self._link_after(self.tail, Chunk([data]))
+        else:
+            self.tail.items.append(data)
+        self.size += 1
+
+    def prepend(self, data: T) -> None:
+        """
+        Prepend an item to the beginning of the list
+        :param data: The item to prepend
+        """
+        if self.head is None or len(self.head.items) >= self.chunk_size:
+            self._link_after(None, Chunk([data]))
+        else:
+            self.head.items.insert(0, data)
+        self.size += 1
+
+    def insert(self, index: int, data: T) -> None:
+        """
+        Insert an item at the given index, splitting its chunk first if it is full
+        :param index: The index to insert the item at
+        :param data: The item to insert
+        """
+        if index < 0 or index > self.size:
+            raise ValueError("Invalid index")
+
+        if index == self.size:
+            self.append(data)
+            return
+
+        chunk, offset = self._locate(index)
+        if len(chunk.items) >= self.chunk_size:
+            half = len(chunk.items) // 2
+            new_chunk = Chunk(chunk.items[half:])
+            del chunk.items[half:]
+            self._link_after(chunk, new_chunk)
+            if offset > half:
+                chunk, offset = new_chunk, offset - half
+
+        chunk.items.insert(offset, data)
+        self.size += 1
+
+    def remove(self, index: int) -> T:
+        """
+        Remove the item at the given index, merging its chunk with a neighbour if it becomes sparse
+        :param index: The index of the item to remove
+        :return: The removed item
+        """
+        if index < 0 or index >= self.size:
+            raise IndexError("Invalid index")
+
+        chunk, offset = self._locate(index)
+        data = chunk.items.pop(offset)
+        self.size -= 1
+        self._rebalance(chunk)
+        return data
+
+    def pop(self) -> T:
+        """
+        Remove the last item
+        :return: The removed item
+        """
+        if self.size == 0:
+            raise IndexError("Pop from empty list")
+        return self.remove(self.size - 1)
+
+    def popleft(self) -> T:
+        """
+        Remove the first item
+        :return: The removed item
+        """
+        if self.size == 0:
+            raise IndexError("Pop from empty list")
+        return self.remove(0)
+
+    def clear(self) -> None:
+        """
+        Clear the list
+        """
+        self.head = None
+        self.tail = None
+        self.size = 0
+
+    def chunks(self) -> int:
+        """
+        Count the chunks of the list
+        :return: The number of chunks
+        """
+        count = 0
+        chunk = self.head
+        while chunk:
+            count += 1
+            chunk = chunk.next
+        return count
+
+    def __getitem__(self, index: int) -> T:
+        """
+        Get the item at the given index
+        :param index: The index of the item
+        :return: The item
+        """
+        if index < 0 or index >= self.size:
+            raise IndexError("Invalid index")
+
+        chunk, offset = self._locate(index)
+        return chunk.items[offset]
+
+    def __setitem__(self, index: int, data: T) -> None:
+        """
+        Set the item at the given index
+        :param index: The index of the item
+        :param data: The new item
+        """
+        if index < 0 or index >= self.size:
+            raise IndexError("Invalid index")
+
+        chunk, offset = self._locate(index)
+        chunk.items[offset] = data
+
+    def __str__(self):
+        if self.size == 0:
+            return "Empty"
+        return "[" + ", ".join(str(item) for item in self) + "]"
+
+    def __iter__(self) -> Iterator[T]:
+        chunk = self.head
+
+        while chunk:
+            yield from chunk.items
+            chunk = chunk.next
@@ -0,0 +1,93 @@
+import random
+import unittest
+
+from LinkedList.UnrolledLinkedList.UnrolledLinkedList import UnrolledLinkedList
+
+class TestUnrolledLinkedList(unittest.TestCase):
+    def setUp(self):
+        self.ull = UnrolledLinkedList(chunk_size=4)
+
+    def test_append_fills_chunks(self):
+        """Test that appending fills each chunk before starting a new one."""
+        for i in range(10):
+            self.ull.append(i)
+        self.assertEqual(len(self.ull), 10)
+        self.assertEqual(list(self.ull), list(range(10)))
+        self.assertEqual(self.ull.chunks(), 3)
+        self.assertEqual(self.ull.head.items, [0, 1, 2, 3])
+
+    def test_prepend(self):
+        """Test prepending to full and partial chunks."""
+        for i in range(6):
+            self.ull.prepend(i)
+        self.assertEqual(list(self.ull), [5, 4, 3, 2, 1, 0])
+        self.assertEqual(self.ull[0], 5)
+        self.assertEqual(self.ull[5], 0)
+
+    def test_insert_splits_full_chunk(self):
+        """Test that inserting into a full chunk splits it in half."""
+        for i in range(4):
+            self.ull.append(i)
+        self.ull.insert(1, 10)
+        self.assertEqual(list(self.ull), [0, 10, 1, 2, 3])
+        self.assertEqual(self.ull.chunks(), 2)
+        self.assertEqual(self.ull.head.items, [0, 10, 1])
+        with self.assertRaises(ValueError):
+            self.ull.insert(7, 0)
+
+    def test_remove_merges_sparse_chunks(self):
+        """Test that removing items merges chunks that fall below half full."""
+        for i in range(8):
+            self.ull.append(i)
+        self.assertEqual(self.ull.remove(1), 1)
+        self.assertEqual(self.ull.remove(1), 2)
+        self.assertEqual(self.ull.chunks(), 2)
+        self.assertEqual(self.ull.remove(0), 0)
+        self.assertEqual(self.ull.chunks(), 2)
+        self.assertEqual(self.ull.remove(0), 3)
+        self.assertEqual(self.ull.chunks(), 1)
+        self.assertEqual(list(self.ull), [4, 5, 6, 7])
+        with self.assertRaises(IndexError):
+            self.ull.remove(4)
+
+    def test_indexing(self):
+        """Test reading and writing by index from both ends."""
+        self.ull = UnrolledLinkedList(list(range(100)), chunk_size=8)
+        self.ull[3] = -3
+        self.ull[97] = -97
+        self.assertEqual([self.ull[i] for i in (0, 3, 50, 97, 99)], [0, -3, 50, -97, 99])
+        with self.assertRaises(IndexError):
+            self.ull[100]
+
+    def test_matches_list(self):
+        """Test random inserts, removals and pops against a Python list."""
+        rng = random.Random(0)
+        expected = []
+        for step in range(3000):
+            operation = rng.randrange(5)
+            if operation < 2 or not expected:
+                index = rng.randrange(len(expected) + 1)
+                self.ull.insert(index, step)
+                expected.insert(index, step)
+            elif operation == 2:
+                index = rng.randrange(len(expected))
+                self.assertEqual(self.ull.remove(index), expected.pop(index))
+            elif operation == 3:
+                self.assertEqual(self.ull.pop(), expected.pop())
+            else:
+                self.assertEqual(self.ull.popleft(), expected.pop(0))
+        self.assertEqual(list(self.ull), expected)
+        self.assertEqual(len(self.ull), len(expected))
+
+    def test_clear_and_str(self):
+        """Test clearing the list and its string form."""
+        self.assertEqual(str(self.ull), "Empty")
+        self.ull.append(1)
+        self.ull.append(2)
+        self.assertEqual(str(self.ull), "[1, 2]")
+        self.ull.clear()
+        self.assertEqual(len(self.ull), 0)
+        self.assertIsNone(self.ull.head)
+
+if __name__ == '__main__':
+    unittest.main()
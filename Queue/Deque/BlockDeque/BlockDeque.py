@@ -0,0 +1,356 @@
+from typing import TypeVar, Generic, Optional, Iterable, Iterator, List, Tuple
+
+from Queue.Deque.Deque import Deque, ENGINES
+
+T = TypeVar('T')
+
+"""
+Why a block-linked ring buffer?
+
+The linked engine stores every item in its own ListNode, so each push allocates an object with two links and each
+indexed access walks node by node. Like CPython's collections.deque, a BlockDeque stores items in fixed-size blocks of
+BLOCK_LEN slots, linked to each other in a doubly linked list. The items occupy a contiguous run of slots from
+left_index in the leftmost block to right_index in the rightmost block.
+
+- Pushing at either end writes the next free slot and only allocates a block once every BLOCK_LEN pushes; popping
+  clears the slot and releases a block once it empties. Released blocks are kept on a small free list, so a queue whose
+  length hovers around a block boundary does not allocate at all.
+- Finding an index divides it by BLOCK_LEN to get a number of blocks to skip from the nearer end, so indices near either
+  end are reached in O(1) and any index in O(n / BLOCK_LEN).
+- An empty deque recenters its indices in the middle of its block, so alternating pushes at both ends do not
+  immediately cross into a new block.
+"""
+
+BLOCK_LEN = 64
+_CENTER = (BLOCK_LEN - 1) // 2
+_MAX_FREE_BLOCKS = 16
+
+
+class Block(Generic[T]):
+    __slots__ = ("slots", "prev", "next")
+
+    def __init__(self):
+        self.slots: List[Optional[T]] = [None] * BLOCK_LEN
+        self.prev: Optional['Block[T]'] = None
+        self.next: Optional['Block[T]'] = None
+
+
+class BlockDeque(Deque[T]):
+    def __init__(self, items: Optional[Iterable[T]] = None, pool_size: int = 0, engine: str = "blocks",
+                 maxlen: Optional[int] = None):
+        """
+        Initialize the deque
+        :param items: The items to add to the rear of the deque
+        :param pool_size: Must be 0. Blocks are always recycled through a small free list
+        :param engine: The storage engine, which must be "blocks"
+        :param maxlen: The maximum number of items. Defaults to None, which leaves the deque unbounded
+        """
+        if engine not in ENGINES:
+            raise ValueError(f"Unknown engine: {engine!r}")
+        if pool_size != 0:
+            raise ValueError("pool_size only applies to the linked engine")
+        if maxlen is not None and maxlen < 0:
+            raise ValueError("maxlen must be non-negative")
+
+        self.engine = engine
+        self.maxlen = maxlen
+        self._free_blocks: List[Block[T]] = []
+        self.blocks_allocated = 0  # Blocks created by this deque
+        self._reset()
+
+        if items is not None:
+            for item in items:
+                self.add_rear(item)
+
+    def _reset(self) -> None:
+        """
+        Empty the deque down to a single block with the indices in its middle
+        """
+        self.left_block = self.right_block = self._new_block()
+        self.left_index = _CENTER + 1
+        self.right_index = _CENTER
+        self._size = 0
+
+    def _new_block(self) -> Block[T]:
+        """
+        Get an unlinked block, reusing a released one if there is one
+        :return: The block
+        """
+        if self._free_blocks:
+            return self._free_blocks.pop()
+
+        self.blocks_allocated += 1
+        return Block()
+
+    def _release_block(self, block: Block[T]) -> None:
+        """
+        Keep an emptied block for reuse, unless the free list is full
+        :param block: The unlinked block, whose slots are all None
+        """
+        if len(self._free_blocks) < _MAX_FREE_BLOCKS:
+            block.prev = block.next = None
+            self._free_blocks.append(block)
+
+    def _locate(self, index: int) -> Tuple[Block[T], int]:
+        """
+        Find the block and slot of a valid index, skipping whole blocks from the nearer end
+        :param index: The index of the item, which must be in range
+        :return: The block and the slot of the item within it
+        """
+        position = index + self.left_index
+        slot = position % BLOCK_LEN
+
+        if index < self._size // 2:
+            block = self.left_block
+            for _ in range(position // BLOCK_LEN):
+                block = block.next
+        else:
+            block = self.right_block
+            for _ in range((self.left_index + self._size - 1) // BLOCK_LEN - position // BLOCK_LEN):
+                block = block.prev
+        return block, slot
+
+    def add_front(self, item: T) -> None:
+        """
+        Add an item to the front of the deque, discarding the rear item if the deque is full
+        :param item: The item to add
+        :return: The deque with the item added
+        """
+        if self.maxlen is not None and self._size >= self.maxlen:
+            if self.maxlen == 0:
+                return
+            self.remove_rear()
+
+        if self.left_index == 0:
+            block = self._new_block()
+            block.next = self.left_block
+            self.left_block.prev = block
+            self.left_block = block
+            self.left_index = BLOCK_LEN
+
+        self.left_index -= 1
+        self.left_block.slots[self.left_index] = item
+        self._size += 1
+
+    def add_rear(self, item: T) -> None:
+        """
+        Add an item to the rear of the deque, discarding the front item if the deque is full
+        :param item: The item to add
+        :return: The deque with the item added
+        """
+        if self.maxlen is not None and self._size >= self.maxlen:
+            if self.maxlen == 0:
+                return
+            self.remove_front()
+
+        if self.right_index == BLOCK_LEN - 1:
+            block = self._new_block()
+            block.prev = self.right_block
+            self.right_block.next = block
+            self.right_block = block
+            self.right_index = -1
+
+        self.right_index += 1
+        self.right_block.slots[self.right_index] = item
+        self._size += 1
+
+    def remove_front(self) -> T:
+        """
+        Remove an item from the front of the deque
+        :return: The item removed
+        """
+        if self._size == 0:
+            raise IndexError("Remove from empty deque")
+
+        block = self.left_block
+        item = block.slots[self.left_index]
+        block.slots[self.left_index] = None
+        self.left_index += 1
+        self._size -= 1
+
+        if self._size == 0:
+            self.left_index = _CENTER + 1
+            self.right_index = _CENTER
+        elif self.left_index == BLOCK_LEN:
+            self.left_block = block.next
+            self.left_block.prev = None
+            self._release_block(block)
+            self.left_index = 0
+        return item
+
+    def remove_rear(self) -> T:
+        """
+        Remove an item from the rear of the deque
+        :return: The item removed
+        """
+        if self._size == 0:
+            raise IndexError("Remove from empty deque")
+
+        block = self.right_block
+        item = block.slots[self.right_index]
+        block.slots[self.right_index] = None
+        self.right_index -= 1
+        self._size -= 1
+
+        if self._size == 0:
+            self.left_index = _CENTER + 1
+            self.right_index = _CENTER
+        elif self.right_index == -1:
+            self.right_block = block.prev
+            self.right_block.next = None
+            self._release_block(block)
+            self.right_index = BLOCK_LEN - 1
+        return item
+
+    def rotate(self, n: int) -> None:
+        """
+        Rotate the deque n steps to the right, or -n steps to the left if n is negative, moving the k = n % size items
+        (or the size - k items the other way, whichever is fewer) a block-sized slice at a time
+        :param n: The number of steps to rotate
+        :return: The deque rotated n steps to the right
+        """
+        if self._size == 0:
+            return
+
+        n %= self._size
+        if n <= self._size // 2:
+            self._rotate_right(n)
+        else:
+            self._rotate_left(self._size - n)
+
+    def _rotate_right(self, n: int) -> None:
+        """
+        Move n items, fewer than the size, from the rear to the front of the deque
+        :param n: The number of items to move
+        """
+        while n > 0:
+            if self.left_index == 0:
+                block = self._new_block()
+                block.next = self.left_block
+                self.left_block.prev = block
+                self.left_block = block
+                self.left_index = BLOCK_LEN
+
+            count = min(n, self.left_index, self.right_index + 1)
+            start = self.right_index + 1 - count
+            source = self.right_block.slots
+            self.left_block.slots[self.left_index - count:self.left_index] = source[start:self.right_index + 1]
+            for i in range(start, self.right_index + 1):
+                source[i] = None
+            self.left_index -= count
+            self.right_index -= count
+            n -= count
+
+            if self.right_index == -1:
+                block = self.right_block
+                self.right_block = block.prev
+                self.right_block.next = None
+                self._release_block(block)
+                self.right_index = BLOCK_LEN - 1
+
+    def _rotate_left(self, n: int) -> None:
+        """
+        Move n items, fewer than the size, from the front to the rear of the deque
+        :param n: The number of items to move
+        """
+        while n > 0:
+            if self.right_index == BLOCK_LEN - 1:
+                block = self._new_block()
+                block.prev = self.right_block
+                self.right_block.next = block
+                self.right_block = block
+                self.right_index = -1
+
+            count = min(n, BLOCK_LEN - 1 - self.right_index, BLOCK_LEN - self.left_index)
+            stop = self.left_index + count
+            source = self.left_block.slots
+            self.right_block.slots[self.right_index + 1:self.right_index + 1 + count] = source[self.left_index:stop]
+            for i in range(self.left_index, stop):
+                source[i] = None
+            self.left_index += count
+            self.right_index += count
+            n -= count
+
+            if self.left_index == BLOCK_LEN:
+                block = self.left_block
+                self.left_block = block.next
+                self.left_block.prev = None
+                self._release_block(block)
+                self.left_index = 0
+
+    def is_empty(self) -> bool:
+        """
+        Check if the deque is empty
+        :return: True if the deque is empty, False otherwise
+        """
+        return self._size == 0
+
+    def size(self) -> int:
+        """
+        Get the size of the deque
+        :return: The size of the deque
+        """
+        return self._size
+
+    def peek_front(self) -> T:
+        """
+        Get the item at the front of the deque
+        :return: The item at the front of the deque
+        """
+        if self._size == 0:
+            raise IndexError("Peek from empty deque")
+
+        return self.left_block.slots[self.left_index]
+
+    def peek_rear(self) -> T:
+        """
+        Get the item at the rear of the deque
+        :return: The item at the rear of the deque
+        """
+        if self._size == 0:
+            raise IndexError("Peek from empty deque")
+
+        return self.right_block.slots[self.right_index]
+
+    def clear(self) -> None:
+        """
+        Clear the deque
+        """
+        self._reset()
+
+    def __str__(self) -> str:
+        if self._size == 0:
+            return "Empty"
+        return "[" + ", ".join(str(item) for item in self) + "]"
+
+    def __repr__(self) -> str:
+        return self.__str__()
+
+    def __len__(self) -> int:
+        return self._size
+
+    def __getitem__(self, index: int) -> T:
+        if index < 0 or index >= self._size:
+            raise IndexError("Invalid index")
+
+        block, slot = self._locate(index)
+        return block.slots[slot]
+
+    def __setitem__(self, index: int, item: T) -> None:
+        if index < 0 or index >= self._size:
+            raise IndexError("Invalid index")
+
+        block, slot = self._locate(index)
+        block.slots[slot] = item
+
+    def __iter__(self) -> Iterator[T]:
+        block = self.left_block
+        start = self.left_index
+        remaining = self._size
+
+        while remaining > 0:
+            stop = min(BLOCK_LEN, start + remaining)
+            yield from block.slots[start:stop]
+            remaining -= stop - start
+            block = block.next
+            start = 0
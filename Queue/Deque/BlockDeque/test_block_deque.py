@@ -0,0 +1,113 @@
+import random
+import unittest
+
+from Queue.Deque.Deque import Deque
+from Queue.Deque.BlockDeque.BlockDeque import BlockDeque, BLOCK_LEN
+
+class TestBlockDeque(unittest.TestCase):
+    def setUp(self):
+        self.deque = Deque(engine="blocks")
+
+    def test_engine_dispatch(self):
+        self.assertIsInstance(self.deque, BlockDeque)
+        self.assertNotIsInstance(Deque(), BlockDeque)
+        self.assertIsInstance(Deque([1], 0, "blocks"), BlockDeque)
+        with self.assertRaises(ValueError):
+            Deque(engine="array")
+        with self.assertRaises(ValueError):
+            Deque(pool_size=8, engine="blocks")
+
+    def test_add_and_remove_both_ends(self):
+        self.deque.add_rear(1)
+        self.deque.add_rear(2)
+        self.deque.add_front(0)
+        self.assertEqual(list(self.deque), [0, 1, 2])
+        self.assertEqual(self.deque.peek_front(), 0)
+        self.assertEqual(self.deque.peek_rear(), 2)
+        self.assertEqual(self.deque.remove_front(), 0)
+        self.assertEqual(self.deque.remove_rear(), 2)
+        self.assertEqual(self.deque.remove_rear(), 1)
+        self.assertTrue(self.deque.is_empty())
+        with self.assertRaises(IndexError):
+            self.deque.remove_front()
+        with self.assertRaises(IndexError):
+            self.deque.peek_rear()
+
+    def test_crossing_blocks(self):
+        n = BLOCK_LEN * 5 + 3
+        for i in range(n):
+            self.deque.add_front(-i)
+            self.deque.add_rear(i)
+        self.assertEqual(len(self.deque), 2 * n)
+        self.assertEqual(list(self.deque), [-i for i in reversed(range(n))] + list(range(n)))
+        for i in range(n):
+            self.assertEqual(self.deque.remove_rear(), n - 1 - i)
+        self.assertEqual(list(self.deque), [-i for i in reversed(range(n))])
+        self.assertEqual(self.deque.remove_front(), -(n - 1))
+        self.assertEqual(self.deque.peek_rear(), 0)
+
+    def test_indexing_matches_list(self):
+        rng = random.Random(0)
+        expected = []
+        for step in range(5000):
+            operation = rng.randrange(6)
+            if operation == 0 or len(expected) < 3:
+                self.deque.add_rear(step)
+                expected.append(step)
+            elif operation == 1:
+                self.deque.add_front(step)
+                expected.insert(0, step)
+            elif operation == 2:
+                self.assertEqual(self.deque.remove_front(), expected.pop(0))
+            elif operation == 3:
+                self.assertEqual(self.deque.remove_rear(), expected.pop())
+            else:
+                index = rng.randrange(len(expected))
+                self.deque[index] = -step
+                expected[index] = -step
+            index = rng.randrange(len(expected))
+            self.assertEqual(self.deque[index], expected[index])
+        self.assertEqual(list(self.deque), expected)
+        with self.assertRaises(IndexError):
+            self.deque[len(expected)]
+
+    def test_blocks_are_recycled(self):
+        for i in range(BLOCK_LEN * 100):
+            self.deque.add_rear(i)
+            if i >= 10:
+                self.deque.remove_front()
+        self.assertLessEqual(self.deque.blocks_allocated, 3)
+        self.assertEqual(list(self.deque), list(range(BLOCK_LEN * 100 - 10, BLOCK_LEN * 100)))
+
+    def test_rotate_across_blocks(self):
+        n = BLOCK_LEN * 4 + 5
+        expected = list(range(n))
+        self.deque = Deque(expected, engine="blocks")
+        for steps in (1, BLOCK_LEN + 3, -7, n // 2, -(n // 2) - 1, 3 * n + 2, -BLOCK_LEN * 2):
+            self.deque.rotate(steps)
+            k = steps % n
+            expected = expected[n - k:] + expected[:n - k]
+            self.assertEqual(list(self.deque), expected)
+            self.assertEqual(self.deque[n - 1], expected[-1])
+        self.assertLessEqual(self.deque.blocks_allocated, 6 + 16)
+
+    def test_maxlen(self):
+        self.deque = Deque(range(BLOCK_LEN * 3), engine="blocks", maxlen=BLOCK_LEN + 1)
+        self.assertEqual(list(self.deque), list(range(BLOCK_LEN * 2 - 1, BLOCK_LEN * 3)))
+        self.deque.add_front(-1)
+        self.assertEqual(self.deque.peek_rear(), BLOCK_LEN * 3 - 2)
+        self.assertEqual(len(self.deque), BLOCK_LEN + 1)
+        zero = Deque(engine="blocks", maxlen=0)
+        zero.add_front(1)
+        self.assertTrue(zero.is_empty())
+
+    def test_rotate_clear_and_str(self):
+        self.deque = Deque([1, 2, 3], engine="blocks")
+        self.deque.rotate(1)
+        self.assertEqual(str(self.deque), "[3, 1, 2]")
+        self.deque.clear()
+        self.assertEqual(str(self.deque), "Empty")
+        self.assertEqual(self.deque.size(), 0)
+
+if __name__ == '__main__':
+    unittest.main()
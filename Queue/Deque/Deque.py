@@ -1,4 +1,4 @@
-from typing import TypeVar, Generic, Optional
+from typing import TypeVar, Generic, Optional, Iterable, Iterator
 from LinkedList.DoublyLinkedList.DoublyLinkedList import DoublyLinkedList
 
 T = TypeVar('T')
@@ -13,30 +13,81 @@ the front and rear of the deque in O(1) time complexity.
 
 Otherwise, if we use a list or a stack to implement a deque, adding and removing items from the front of the deque would
 require O(n) time complexity because we would have to shift all the items in the list to the right or left.
+
+The storage engine is selectable at construction. Passing engine="blocks" returns a BlockDeque, which stores items in
+linked blocks of slots like CPython's collections.deque instead of one ListNode per item, so pushes rarely allocate and
+indexing skips whole blocks.
+
+Passing maxlen bounds the deque: once it holds maxlen items, adding an item at one end discards the item at the other
+end, so the deque always holds the most recent maxlen items added from that side.
 """
 
+ENGINES = ("linked", "blocks")
+
 class Deque(Generic[T]):
-    def __init__(self, items: Optional[list[T]] = None):
-        if items is None:
-            self.deque = DoublyLinkedList[T]()
-            return
+    def __new__(cls, *args, **kwargs):
+        """
+        Select the class implementing the requested storage engine
+        :param args: The positional arguments passed to the constructor
+        :param kwargs: The keyword arguments passed to the constructor
+        :return: A new, uninitialized instance of the engine class
+        """
+        engine = kwargs.get("engine", args[2] if len(args) > 2 else "linked")
+
+        if cls is Deque and engine == "blocks":
+            from Queue.Deque.BlockDeque.BlockDeque import BlockDeque
+            cls = BlockDeque
+
+        return super().__new__(cls)
+
+    def __init__(self, items: Optional[Iterable[T]] = None, pool_size: int = 0, engine: str = "linked",
+                 maxlen: Optional[int] = None):
+        """
+        Initialize the deque
+        :param items: The items to add to the rear of the deque
+        :param pool_size: The maximum number of removed list nodes kept for reuse, which saves an allocation per item
+            for queues with high churn. Defaults to 0, which disables pooling
+        :param engine: The storage engine: "linked" (default), which stores items in a DoublyLinkedList, or "blocks"
+        :param maxlen: The maximum number of items. Defaults to None, which leaves the deque unbounded
+        """
+        if engine not in ENGINES:
+            raise ValueError(f"Unknown engine: {engine!r}")
+        if maxlen is not None and maxlen < 0:
+            raise ValueError("maxlen must be non-negative")
 
-        self.deque = DoublyLinkedList[T](items)
+        self.engine = engine
+        self.maxlen = maxlen
+        if maxlen is None:
+            self.deque = DoublyLinkedList[T](items, pool_size)
+        else:
+            self.deque = DoublyLinkedList[T](pool_size=pool_size)
+            for item in items or ():
+                self.add_rear(item)
 
     def add_front(self, item: T) -> None:
         """
-        Add an item to the front of the deque
+        Add an item to the front of the deque, discarding the rear item if the deque is full
         :param item: The item to add
         :return: The deque with the item added
         """
+        if self.maxlen is not None and len(self.deque) >= self.maxlen:
+            if self.maxlen == 0:
+                return
+            self.deque.pop()
+
         self.deque.prepend(item)
 
     def add_rear(self, item: T) -> None:
         """
-        Add an item to the rear of the deque
+        Add an item to the rear of the deque, discarding the front item if the deque is full
         :param item: The item to add
         :return: The deque with the item added
         """
+        if self.maxlen is not None and len(self.deque) >= self.maxlen:
+            if self.maxlen == 0:
+                return
+            self.deque.popleft()
+
         self.deque.append(item)
 
     def remove_front(self) -> T:
@@ -47,9 +98,7 @@ class Deque(Generic[T]):
         if self.is_empty():
             raise IndexError("Remove from empty deque")
 
-        item = self.deque.head.data
-        self.deque.remove(0)
-        return item
+        return self.deque.popleft()
 
     def remove_rear(self) -> T:
         """
@@ -59,9 +108,7 @@ class Deque(Generic[T]):
         if self.is_empty():
             raise IndexError("Remove from empty deque")
 
-        item = self.deque.tail.data
-        self.deque.remove(self.size() - 1)
-        return item
+        return self.deque.pop()
 
     def is_empty(self) -> bool:
         """
@@ -79,20 +126,11 @@ class Deque(Generic[T]):
 
     def rotate(self, n: int) -> None:
         """
-        Rotate the deque n steps to the right
+        Rotate the deque n steps to the right, or -n steps to the left if n is negative, without allocating
         :param n: The number of steps to rotate
         :return: The deque rotated n steps to the right
         """
-        if self.is_empty():
-            return
-
-        n = n % self.size()  # Handle rotations greater than size
-        if n == 0:
-            return
-
-        for _ in range(n):
-            item = self.remove_rear()
-            self.add_front(item)
+        self.deque.rotate(n)
 
     def peek_front(self) -> T:
         """
@@ -130,17 +168,10 @@ class Deque(Generic[T]):
         return len(self.deque)
 
     def __getitem__(self, index: int) -> T:
-        dummy = self.deque.head
-
-        for _ in range(index):
-            dummy = dummy.next
-
-        return dummy.data
+        return self.deque[index]
 
     def __setitem__(self, index: int, item: T) -> None:
-        dummy = self.deque.head
-
-        for _ in range(index):
-            dummy = dummy.next
+        self.deque[index] = item
 
-        dummy.data = item
+    def __iter__(self) -> Iterator[T]:
+        return iter(self.deque)
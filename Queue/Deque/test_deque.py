@@ -53,6 +53,14 @@ class TestDeque(unittest.TestCase):
         self.deque.rotate(1)
         self.assertEqual(list(self.deque.deque), [2, 1])
 
+    def test_rotate_negative(self):
+        deque = Deque([1, 2, 3, 4])
+        deque.rotate(-1)
+        self.assertEqual(list(deque.deque), [2, 3, 4, 1])
+        deque.rotate(-6)
+        self.assertEqual(list(deque.deque), [4, 1, 2, 3])
+        self.assertEqual(deque.deque.nodes_allocated, 4)
+
     def test_rotate_empty(self):
         self.deque.rotate(1)
         self.assertEqual(list(self.deque.deque), [])
@@ -79,5 +87,26 @@ class TestDeque(unittest.TestCase):
         self.assertEqual(str(self.deque), '[1, 2]')
         self.assertEqual(repr(self.deque), '[1, 2]')
 
+    def test_maxlen(self):
+        deque = Deque(range(5), maxlen=3)
+        self.assertEqual(list(deque.deque), [2, 3, 4])
+        deque.add_rear(5)
+        self.assertEqual(list(deque.deque), [3, 4, 5])
+        deque.add_front(2)
+        self.assertEqual(list(deque.deque), [2, 3, 4])
+        self.assertEqual(len(Deque([1], maxlen=0)), 0)
+        with self.assertRaises(ValueError):
+            Deque(maxlen=-1)
+
+    def test_node_pool(self):
+        deque = Deque(pool_size=8)
+        for i in range(100):
+            deque.add_rear(i)
+            deque.add_front(-i)
+            self.assertEqual(deque.remove_front(), -i)
+            self.assertEqual(deque.remove_rear(), i)
+        self.assertEqual(deque.deque.nodes_allocated, 2)
+        self.assertEqual(deque.deque.nodes_reused, 198)
+
 if __name__ == '__main__':
     unittest.main()
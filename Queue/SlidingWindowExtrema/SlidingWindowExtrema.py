@@ -0,0 +1,171 @@
+from typing import Iterable, List, Tuple, Union
+
+from Queue.Deque.Deque import Deque
+
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional: without it, push_many pushes the samples one at a time
+    np = None
+
+"""
+Why monotonic deques?
+
+Rescanning the window for its minimum and maximum costs O(window) per sample. A monotonic deque keeps only the samples
+that can still become the maximum: when a new sample arrives, every sample at the rear that is not greater than it is
+discarded, since it leaves the window earlier and can never be the maximum again. The deque is therefore decreasing from
+front to rear, its front is the maximum of the window, and the front is dropped once it falls out of the window. Each
+sample is added and removed at most once, so a push costs O(1) amortized. A second deque, increasing from front to
+rear, tracks the minimum.
+
+push_many with a NumPy array computes the extrema of a whole batch in vectorized passes instead. The samples of the
+current window that a batch still needs are recovered from the deques: for the maximum, a sample missing from the max
+deque is smaller than a later one, so it can be replaced by the lowest value of the dtype without changing any result,
+and likewise with the highest value for the minimum.
+
+The batch is then split into blocks of window samples (the van Herk/Gil-Werman algorithm). Every window spans the end of
+one block and the start of the next, so its maximum is the larger of a running maximum taken backwards from the end of
+the first block and one taken forwards from the start of the second. Both running maxima are single accumulate passes,
+so a batch costs O(n) whatever the window length.
+"""
+
+
+class SlidingWindowExtrema:
+    def __init__(self, window: int):
+        """
+        Initialize the sliding window
+        :param window: The number of most recent samples the minimum and maximum are taken over
+        """
+        if window < 1:
+            raise ValueError("window must be at least 1")
+
+        self.window = window
+        self.count = 0  # Samples pushed so far, which is also the position of the next sample
+        self._max: Deque[Tuple[int, float]] = Deque(engine="blocks")  # (position, sample), decreasing samples
+        self._min: Deque[Tuple[int, float]] = Deque(engine="blocks")  # (position, sample), increasing samples
+
+    def __len__(self) -> int:
+        return min(self.count, self.window)
+
+    def push(self, sample: float) -> Tuple[float, float]:
+        """
+        Add a sample, dropping the oldest one if the window is full, in O(1) amortized time
+        :param sample: The sample to add
+        :return: The minimum and maximum of the window after adding the sample
+        """
+        position = self.count
+        self.count += 1
+        expired = position - self.window
+
+        maxima = self._max
+        while not maxima.is_empty() and maxima.peek_rear()[1] <= sample:
+            maxima.remove_rear()
+        maxima.add_rear((position, sample))
+        if maxima.peek_front()[0] <= expired:
+            maxima.remove_front()
+
+        minima = self._min
+        while not minima.is_empty() and minima.peek_rear()[1] >= sample:
+            minima.remove_rear()
+        minima.add_rear((position, sample))
+        if minima.peek_front()[0] <= expired:
+            minima.remove_front()
+
+        return minima.peek_front()[1], maxima.peek_front()[1]
+
+    def push_many(self, samples: Iterable[float]) -> Union[Tuple[List[float], List[float]],
+                                                           Tuple['np.ndarray', 'np.ndarray']]:
+        """
+        Add a batch of samples, vectorized when samples is an integer or floating NumPy array at least as long as the
+        window
+        :param samples: The samples to add, in order
+        :return: The minimum and maximum of the window after each sample, as lists or as NumPy arrays
+        """
+        # Other dtypes, such as bool, object or datetime64, have no lowest and highest value to pad with
+        numeric = np is not None and isinstance(samples, np.ndarray) and samples.dtype.kind in "iuf"
+        if not numeric or samples.shape[0] < self.window:
+            minima, maxima = [], []
+            for sample in samples:
+                low, high = self.push(sample)
+                minima.append(low)
+                maxima.append(high)
+            if np is not None and isinstance(samples, np.ndarray):
+                return np.array(minima, dtype=samples.dtype), np.array(maxima, dtype=samples.dtype)
+            return minima, maxima
+
+        samples = np.ascontiguousarray(samples)
+        if np.issubdtype(samples.dtype, np.floating):
+            lowest, highest = -np.inf, np.inf
+        else:
+            lowest, highest = np.iinfo(samples.dtype).min, np.iinfo(samples.dtype).max
+
+        # The window before the first new sample covers positions count - window + 1 to count - 1
+        history = self.window - 1
+        first = self.count - history
+        maxima = self._blockwise(self._padded(self._max, samples, first, lowest), np.maximum, lowest)
+        minima = self._blockwise(self._padded(self._min, samples, first, highest), np.minimum, highest)
+
+        # Rebuild the deques from the last full window, which holds every sample later pushes can need
+        self._max.clear()
+        self._min.clear()
+        self.count += samples.shape[0] - self.window
+        for sample in samples[-self.window:].tolist():
+            self.push(sample)
+
+        return minima, maxima
+
+    def _padded(self, extrema: Deque, samples: 'np.ndarray', first: int, fill: float) -> 'np.ndarray':
+        """
+        Prefix a batch with the window before it, filling the samples a monotonic deque dropped with a neutral value
+        :param extrema: The monotonic deque of (position, sample) pairs
+        :param samples: The new samples
+        :param first: The position of the first sample of the window before the batch
+        :param fill: The value that never wins against a sample, such as the lowest value for the maximum
+        :return: The window before the batch followed by the batch
+        """
+        history = self.window - 1
+        padded = np.empty(history + samples.shape[0], dtype=samples.dtype)
+        padded[:history] = fill
+        for position, sample in extrema:
+            if position >= first:
+                padded[position - first] = sample
+        padded[history:] = samples
+        return padded
+
+    def _blockwise(self, padded: 'np.ndarray', combine: 'np.ufunc', fill: float) -> 'np.ndarray':
+        """
+        Reduce every window of an array with running extrema over blocks of window samples, in O(n)
+        :param padded: The window before the batch followed by the batch
+        :param combine: np.maximum or np.minimum
+        :param fill: The value that never wins against a sample, used to fill the last block
+        :return: The extremum of each window ending at a sample of the batch
+        """
+        window = self.window
+        count = padded.shape[0] - window + 1
+        blocks = -(-padded.shape[0] // window)
+        values = np.full(blocks * window, fill, dtype=padded.dtype)
+        values[:padded.shape[0]] = padded
+        values = values.reshape(blocks, window)
+
+        forward = combine.accumulate(values, axis=1).ravel()
+        backward = combine.accumulate(values[:, ::-1], axis=1)[:, ::-1].ravel()
+
+        # The window starting at i ends at i + window - 1, in the same block only when i starts a block
+        return combine(backward[:count], forward[window - 1:window - 1 + count])
+
+    def min(self) -> float:
+        """
+        Get the minimum of the window
+        :return: The minimum
+        """
+        if self._min.is_empty():
+            raise IndexError("Minimum of empty window")
+        return self._min.peek_front()[1]
+
+    def max(self) -> float:
+        """
+        Get the maximum of the window
+        :return: The maximum
+        """
+        if self._max.is_empty():
+            raise IndexError("Maximum of empty window")
+        return self._max.peek_front()[1]
@@ -0,0 +1,82 @@
+import random
+import unittest
+from decimal import Decimal
+
+from Queue.SlidingWindowExtrema.SlidingWindowExtrema import SlidingWindowExtrema, np
+
+class TestSlidingWindowExtrema(unittest.TestCase):
+    def test_push_matches_rescan(self):
+        rng = random.Random(0)
+        samples = [rng.randrange(100) for _ in range(2000)]
+        for window in (1, 3, 50):
+            extrema = SlidingWindowExtrema(window)
+            for i, sample in enumerate(samples):
+                recent = samples[max(0, i + 1 - window):i + 1]
+                self.assertEqual(extrema.push(sample), (min(recent), max(recent)))
+            self.assertEqual(len(extrema), window)
+            self.assertEqual(extrema.max(), max(samples[-window:]))
+
+    def test_push_many_without_numpy_array(self):
+        extrema = SlidingWindowExtrema(2)
+        minima, maxima = extrema.push_many([3, 1, 4, 1, 5])
+        self.assertEqual(minima, [3, 1, 1, 1, 1])
+        self.assertEqual(maxima, [3, 3, 4, 4, 5])
+        self.assertEqual(extrema.min(), 1)
+
+    def test_empty_window(self):
+        extrema = SlidingWindowExtrema(4)
+        self.assertEqual(len(extrema), 0)
+        with self.assertRaises(IndexError):
+            extrema.min()
+        with self.assertRaises(IndexError):
+            extrema.max()
+        with self.assertRaises(ValueError):
+            SlidingWindowExtrema(0)
+
+    @unittest.skipUnless(np is not None, "NumPy is not installed")
+    def test_numpy_batches_match_scalar_pushes(self):
+        rng = np.random.default_rng(0)
+        for dtype in (np.float64, np.int64):
+            samples = (rng.standard_normal(3000) * 100).astype(dtype)
+            scalar = SlidingWindowExtrema(40)
+            expected = [scalar.push(sample) for sample in samples.tolist()]
+
+            batched = SlidingWindowExtrema(40)
+            minima, maxima = [], []
+            for start, stop in ((0, 25), (25, 525), (525, 560), (560, 3000)):
+                low, high = batched.push_many(samples[start:stop])
+                minima.extend(low.tolist())
+                maxima.extend(high.tolist())
+            self.assertEqual(minima, [low for low, _ in expected])
+            self.assertEqual(maxima, [high for _, high in expected])
+            self.assertEqual(batched.push(0), scalar.push(0))
+
+
+    @unittest.skipUnless(np is not None, "NumPy is not installed")
+    def test_numpy_windows_across_blocks(self):
+        rng = np.random.default_rng(1)
+        samples = rng.integers(0, 256, 2503).astype(np.uint8)
+        for window in (1, 7, 1000):
+            scalar = SlidingWindowExtrema(window)
+            expected = [scalar.push(sample) for sample in samples.tolist()]
+
+            batched = SlidingWindowExtrema(window)
+            minima, maxima = batched.push_many(samples)
+            self.assertEqual(minima.dtype, np.uint8)
+            self.assertEqual(minima.tolist(), [low for low, _ in expected])
+            self.assertEqual(maxima.tolist(), [high for _, high in expected])
+
+    @unittest.skipUnless(np is not None, "NumPy is not installed")
+    def test_numpy_non_numeric_dtypes_push_one_at_a_time(self):
+        flags = np.array([False, True, False, False, False, True])
+        minima, maxima = SlidingWindowExtrema(3).push_many(flags)
+        self.assertEqual(minima.tolist(), [False, False, False, False, False, False])
+        self.assertEqual(maxima.tolist(), [False, True, True, True, False, True])
+
+        prices = np.array([Decimal("1.5"), Decimal("0.5"), Decimal("2"), Decimal("1")], dtype=object)
+        minima, maxima = SlidingWindowExtrema(2).push_many(prices)
+        self.assertEqual(minima.tolist(), [Decimal("1.5"), Decimal("0.5"), Decimal("0.5"), Decimal("1")])
+        self.assertEqual(maxima.tolist(), [Decimal("1.5"), Decimal("1.5"), Decimal("2"), Decimal("2")])
+
+if __name__ == '__main__':
+    unittest.main()
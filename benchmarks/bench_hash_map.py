@@ -0,0 +1,409 @@
+"""
+Benchmarks for HashMap.
+
+Run from the repository root:
+
+    python -m benchmarks.bench_hash_map
+"""
+
+import copy
+import gc
+import multiprocessing
+import os
+import pickle
+import random
+import resource
+import tempfile
+import time
+import tracemalloc
+
+from HashMap.Codec import STR, INT
+from HashMap.HashMap import HashMap
+from HashMap.MappedHashMap.MappedHashMap import MappedHashMap
+from HashMap.PersistentHashMap.PersistentHashMap import PersistentHashMap
+from HashMap.PrimitiveHashMap.IntHashMap import IntHashMap, np
+from HashMap.SharedHashMap.SharedHashMap import SharedHashMap
+
+
+class LargeKey:
+    """
+    A key wrapping a long tuple, with an expensive __hash__ and __eq__ that count how often they run.
+    """
+    hash_calls = 0
+    eq_calls = 0
+
+    def __init__(self, index: int, width: int = 32):
+        self.parts = tuple(f"segment-{index}-{j}" for j in range(width))
+
+    def __hash__(self):
+        LargeKey.hash_calls += 1
+        return hash(self.parts)
+
+    def __eq__(self, other):
+        LargeKey.eq_calls += 1
+        return isinstance(other, LargeKey) and self.parts == other.parts
+
+
+class UncachedHashMap(HashMap):
+    """
+    A HashMap that re-hashes every key on resize and compares keys without a hash prefilter, as the implementation did
+    before hash codes were cached.
+    """
+
+    def get(self, key):
+        bucket = self.buckets[hash(key) % self.capacity]
+        for _, k, v in bucket:
+            if k == key:
+                return v
+        return None
+
+    def _rebuild(self, new_capacity=None) -> None:
+        new_capacity = self.capacity * 2
+        new_buckets = [[] for _ in range(new_capacity)]
+
+        for bucket in self.buckets:
+            for _, key, value in bucket:
+                key_hash = hash(key)
+                new_buckets[key_hash % new_capacity].append((key_hash, key, value))
+
+        self.buckets = new_buckets
+        self.capacity = new_capacity
+
+
+def bench_cached_hashes(n: int = 50_000) -> None:
+    """
+    Compare resize time and __hash__/__eq__ calls with and without cached hash codes.
+    """
+    print(f"Cached hash codes ({n:,} LargeKey entries)")
+    keys = [LargeKey(i) for i in range(n)]
+    probes = [LargeKey(i) for i in range(n)]
+
+    for label, cls in (("uncached", UncachedHashMap), ("cached hashes", HashMap)):
+        hash_map = cls()
+        LargeKey.hash_calls = LargeKey.eq_calls = 0
+
+        resize_time = 0.0
+        for key in keys:
+            capacity = hash_map.capacity
+            start = time.perf_counter()
+            hash_map.put(key, None)
+            if hash_map.capacity != capacity:
+                resize_time += time.perf_counter() - start
+        put_hashes = LargeKey.hash_calls
+
+        LargeKey.eq_calls = 0
+        for key in probes:
+            hash_map.get(key)
+
+        print(f"  {label:<18} resize time {resize_time:7.3f}s  "
+              f"__hash__ calls during puts {put_hashes:>9,}  "
+              f"__eq__ calls per lookup {LargeKey.eq_calls / n:.2f}")
+
+
+def bench_bulk_operations(n: int = 500_000) -> None:
+    """
+    Compare from_items/get_many against loops of single put/get calls.
+    """
+    print(f"Bulk operations ({n:,} str -> int entries)")
+    items = [(f"session-{i}", i) for i in range(n)]
+    keys = [key for key, _ in items]
+
+    for engine in ("chained", "robin_hood"):
+        start = time.perf_counter()
+        hash_map = HashMap(engine=engine)
+        for key, value in items:
+            hash_map.put(key, value)
+        put_loop = time.perf_counter() - start
+
+        start = time.perf_counter()
+        for key in keys:
+            hash_map.get(key)
+        get_loop = time.perf_counter() - start
+
+        start = time.perf_counter()
+        hash_map = HashMap.from_items(items, engine=engine)
+        from_items = time.perf_counter() - start
+
+        start = time.perf_counter()
+        hash_map.get_many(keys)
+        get_many = time.perf_counter() - start
+
+        print(f"  {engine:<11} put loop {put_loop:6.3f}s  from_items {from_items:6.3f}s  "
+              f"get loop {get_loop:6.3f}s  get_many {get_many:6.3f}s")
+
+
+def bench_grow_then_drain(n: int = 500_000, keep: int = 5_000) -> None:
+    """
+    Measure the memory held by a map after growing to n entries and draining all but keep of them.
+    """
+    print(f"Grow then drain ({n:,} entries, {keep:,} kept)")
+    keys = [f"session-{i}" for i in range(n)]
+
+    for engine in ("chained", "robin_hood"):
+        for label, min_load_factor, compact in (("no shrink", 0.0, False),
+                                                ("min_load_factor=0.1", 0.1, False),
+                                                ("compact()", 0.0, True)):
+            tracemalloc.start()
+            hash_map = HashMap(engine=engine, min_load_factor=min_load_factor)
+            hash_map.put_many((key, None) for key in keys)
+            grown = tracemalloc.get_traced_memory()[0]
+
+            hash_map.remove_many(keys[keep:])
+            if compact:
+                hash_map.compact()
+            drained = tracemalloc.get_traced_memory()[0]
+            tracemalloc.stop()
+
+            start = time.perf_counter()
+            for _ in hash_map:
+                pass
+            iterate = time.perf_counter() - start
+
+            print(f"  {engine:<11} {label:<20} grown {grown / 2 ** 20:7.1f} MiB  "
+                  f"drained {drained / 2 ** 20:7.1f} MiB  capacity {hash_map.capacity:>9,}  iterate {iterate:.4f}s")
+
+
+def bench_resize_pauses(n: int = 1_000_000) -> None:
+    """
+    Measure the slowest single put while a chained map grows to n entries, with and without incremental resizing.
+
+    The garbage collector is paused while timing, since its full collections would otherwise dominate the worst case.
+    """
+    print(f"Resize pauses ({n:,} int puts)")
+    keys = list(range(n))
+
+    for label, incremental in (("stop-the-world", False), ("incremental", True)):
+        hash_map = HashMap(incremental_resize=incremental)
+        put = hash_map.put
+        clock = time.perf_counter
+        worst = total = 0.0
+        gc.disable()
+        try:
+            for key in keys:
+                start = clock()
+                put(key, key)
+                elapsed = clock() - start
+                total += elapsed
+                if elapsed > worst:
+                    worst = elapsed
+        finally:
+            gc.enable()
+
+        print(f"  {label:<15} total {total:.3f}s  worst put {worst * 1e3:8.3f} ms  resizes {hash_map.stats()['resize_count']}")
+
+
+def bench_mapped_startup(n: int = 500_000, lookups: int = 1_000) -> None:
+    """
+    Compare the startup cost of a worker that rebuilds its map, unpickles it, or opens a MappedHashMap file.
+    """
+    print(f"Worker startup ({n:,} str -> int entries, {lookups:,} lookups)")
+    items = [(f"session-{i}", i) for i in range(n)]
+    probes = [f"session-{i}" for i in range(0, n, n // lookups)]
+
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "map.bin")
+        with MappedHashMap(path, "n", capacity=2 * n, key_codec=STR, value_codec=INT) as mapped:
+            mapped.update(items)
+        pickled = pickle.dumps(HashMap.from_items(items))
+
+        start = time.perf_counter()
+        hash_map = HashMap.from_items(items)
+        for key in probes:
+            hash_map.get(key)
+        rebuild = time.perf_counter() - start
+
+        start = time.perf_counter()
+        hash_map = pickle.loads(pickled)
+        for key in probes:
+            hash_map.get(key)
+        unpickle = time.perf_counter() - start
+
+        start = time.perf_counter()
+        with MappedHashMap(path, "r", key_codec=STR, value_codec=INT) as mapped:
+            for key in probes:
+                mapped.get(key)
+        open_mapped = time.perf_counter() - start
+
+        print(f"  rebuild {rebuild:6.3f}s  unpickle {unpickle:6.3f}s  open MappedHashMap {open_mapped:6.3f}s  "
+              f"file size {os.path.getsize(path) / 2 ** 20:.1f} MiB")
+
+
+def bench_int_counters(n: int = 1_000_000, distinct: int = 100_000) -> None:
+    """
+    Compare memory and counting speed of HashMap and IntHashMap for an int -> int clickstream counter.
+    """
+    print(f"Int counters ({n:,} events over {distinct:,} distinct ids)")
+    rng = random.Random(0)
+    events = [int(rng.paretovariate(1.2) * 1000) % distinct for _ in range(n)]
+
+    tracemalloc.start()
+    start = time.perf_counter()
+    hash_map = HashMap()
+    for key in events:
+        hash_map.put(key, hash_map.get(key, 0) + 1)
+    elapsed = time.perf_counter() - start
+    memory = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    print(f"  {'HashMap put/get':<26} {elapsed:6.3f}s  {memory / len(hash_map):6.1f} bytes/entry")
+    del hash_map
+
+    runs = [("IntHashMap.increment_many", events)]
+    if np is not None:
+        runs.append(("IntHashMap + NumPy", np.array(events, dtype=np.int64)))
+
+    for label, keys in runs:
+        tracemalloc.start()
+        start = time.perf_counter()
+        int_map = IntHashMap()
+        int_map.increment_many(keys)
+        elapsed = time.perf_counter() - start
+        memory = tracemalloc.get_traced_memory()[0]
+        tracemalloc.stop()
+        print(f"  {label:<26} {elapsed:6.3f}s  {memory / len(int_map):6.1f} bytes/entry  "
+              f"memory_per_entry() {int_map.memory_per_entry():.1f}")
+
+
+def bench_ordered_layout(n: int = 500_000) -> None:
+    """
+    Compare memory and full-scan speed of the chained HashMap and the compact, insertion-ordered engine.
+    """
+    print(f"Ordered layout ({n:,} str -> int entries)")
+    items = [(f"session-{i}", i) for i in range(n)]
+
+    for engine in ("chained", "ordered"):
+        tracemalloc.start()
+        hash_map = HashMap.from_items(items, engine=engine)
+        memory = tracemalloc.get_traced_memory()[0]
+        tracemalloc.stop()
+
+        start = time.perf_counter()
+        for _ in hash_map.items():
+            pass
+        scan = time.perf_counter() - start
+        print(f"  {engine:<8} {memory / n:6.1f} bytes/entry  items() scan {scan:6.3f}s")
+
+
+def bench_persistent_snapshots(n: int = 100_000, ticks: int = 10, updates: int = 1_000) -> None:
+    """
+    Compare keeping a point-in-time snapshot of a routing table every tick by deep-copying a HashMap against keeping
+    versions of a PersistentHashMap, and compare the update throughput of both.
+    """
+    print(f"Snapshots ({n:,} entries, {ticks} ticks of {updates:,} updates)")
+    rng = random.Random(0)
+    items = [(f"route-{i}", i) for i in range(n)]
+    changes = [[(f"route-{rng.randrange(n)}", rng.randrange(n)) for _ in range(updates)] for _ in range(ticks)]
+
+    tracemalloc.start()
+    hash_map = HashMap.from_items(items)
+    base = tracemalloc.get_traced_memory()[0]
+    snapshots = []
+    update_time = snapshot_time = 0.0
+    for tick in changes:
+        start = time.perf_counter()
+        for key, value in tick:
+            hash_map.put(key, value)
+        update_time += time.perf_counter() - start
+        start = time.perf_counter()
+        snapshots.append(copy.deepcopy(hash_map))
+        snapshot_time += time.perf_counter() - start
+    retained = tracemalloc.get_traced_memory()[0] - base
+    tracemalloc.stop()
+    del hash_map, snapshots
+    print(f"  {'HashMap + deepcopy':<22} {ticks * updates / update_time:10,.0f} puts/s  "
+          f"snapshot {snapshot_time / ticks * 1000:8.3f} ms  retained {retained / 2 ** 20:6.1f} MiB")
+
+    tracemalloc.start()
+    persistent = PersistentHashMap.from_items(items)
+    base = tracemalloc.get_traced_memory()[0]
+    snapshots = []
+    update_time = snapshot_time = 0.0
+    for tick in changes:
+        start = time.perf_counter()
+        for key, value in tick:
+            persistent = persistent.put(key, value)
+        update_time += time.perf_counter() - start
+        start = time.perf_counter()
+        snapshots.append(persistent)
+        snapshot_time += time.perf_counter() - start
+    retained = tracemalloc.get_traced_memory()[0] - base
+    tracemalloc.stop()
+    print(f"  {'PersistentHashMap':<22} {ticks * updates / update_time:10,.0f} puts/s  "
+          f"snapshot {snapshot_time / ticks * 1000:8.3f} ms  retained {retained / 2 ** 20:6.1f} MiB")
+
+
+def _memory_usage() -> dict:
+    """
+    Measure the memory of the current process in KiB: Rss, Pss and private pages from /proc/self/smaps_rollup, or
+    only the peak Rss from getrusage where that file does not exist.
+    """
+    try:
+        with open("/proc/self/smaps_rollup") as f:
+            fields = dict(line.split(":", 1) for line in f if ":" in line)
+    except OSError:
+        return {"Rss": resource.getrusage(resource.RUSAGE_SELF).ru_maxrss}
+    usage = {field: int(fields[field].split()[0]) for field in ("Rss", "Pss") if field in fields}
+    usage["Private"] = sum(int(fields[field].split()[0]) for field in ("Private_Clean", "Private_Dirty")
+                           if field in fields)
+    return usage
+
+
+def _shared_worker(name, items, barrier, results) -> None:
+    """
+    Load the map either by rebuilding a private HashMap (name is None) or by attaching to a SharedHashMap, read every
+    value, then report the memory of the process once every worker has done the same.
+    """
+    if name is None:
+        hash_map = HashMap.from_items(items)
+    else:
+        hash_map = SharedHashMap(name)
+    for key, _ in items:
+        hash_map[key]
+    barrier.wait()
+    results.put(_memory_usage())
+    barrier.wait()
+    if name is not None:
+        hash_map.close()
+
+
+def bench_shared_workers(n: int = 200_000, workers: int = 16) -> None:
+    """
+    Compare the total memory of a worker pool in which every worker rebuilds its own HashMap with one in which every
+    worker attaches to a single SharedHashMap.
+    """
+    print(f"Worker pool memory ({workers} workers, {n:,} str -> int entries)")
+    items = [(f"session-{i}", i) for i in range(n)]
+    shared_map = SharedHashMap.from_items(items, key_codec=STR, value_codec=INT)
+    context = multiprocessing.get_context()
+
+    for label, name in (("per-process HashMap", None), ("SharedHashMap", shared_map.name)):
+        barrier = context.Barrier(workers)
+        results = context.Queue()
+        processes = [context.Process(target=_shared_worker, args=(name, items, barrier, results))
+                     for _ in range(workers)]
+        for process in processes:
+            process.start()
+        usages = [results.get() for _ in processes]
+        for process in processes:
+            process.join()
+
+        totals = {field: sum(usage.get(field, 0) for usage in usages) / 1024 for field in usages[0]}
+        print(f"  {label:<20} " + "  ".join(f"{field} {total:8.1f} MiB" for field, total in totals.items()))
+
+    shared_map.close()
+    shared_map.unlink()
+
+
+def main() -> None:
+    bench_cached_hashes()
+    bench_bulk_operations()
+    bench_grow_then_drain()
+    bench_resize_pauses()
+    bench_mapped_startup()
+    bench_int_counters()
+    bench_ordered_layout()
+    bench_persistent_snapshots()
+    bench_shared_workers()
+
+
+if __name__ == "__main__":
+    main()
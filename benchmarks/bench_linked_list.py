@@ -0,0 +1,358 @@
+"""
+Benchmarks for the linked lists and the structures built on them.
+
+Run from the repository root:
+
+    python -m benchmarks.bench_linked_list
+"""
+
+import gc
+import random
+import time
+import tracemalloc
+
+from Graph.Node.Node import Node
+from LinkedList.DoublyLinkedList.DoublyLinkedList import DoublyLinkedList, ListNode
+from LinkedList.PersistentLinkedList.PersistentLinkedList import PersistentLinkedList
+from LinkedList.SinglyLinkedList.SinglyLinkedList import SinglyLinkedList, ListNode as SinglyListNode
+from LinkedList.SkipList.SkipList import SkipList
+from LinkedList.UnrolledLinkedList.UnrolledLinkedList import UnrolledLinkedList
+from Queue.Deque.Deque import Deque
+from Queue.SlidingWindowExtrema.SlidingWindowExtrema import SlidingWindowExtrema, np
+
+
+class HeadWalkList(DoublyLinkedList):
+    """
+    A DoublyLinkedList that always walks from head to reach an index, as the list did before it kept a finger.
+    """
+
+    def _node_at(self, index: int) -> ListNode:
+        current = self.head
+        for _ in range(index):
+            current = current.next
+        return current
+
+
+class TailWalkList(SinglyLinkedList):
+    """
+    A SinglyLinkedList that walks from head to append, as the list did before it kept a tail pointer.
+    """
+
+    def add_at_tail(self, data) -> None:
+        if not self.head:
+            self.head = self.tail = SinglyListNode(data)
+            return
+
+        current = self.head
+        while current.next:
+            current = current.next
+        current.next = self.tail = SinglyListNode(data)
+
+
+def bench_deque_churn(n: int = 1_000_000, depth: int = 64) -> None:
+    """
+    Compare a work-queue pattern (push at the rear, pop at the front, with a few items in flight) on a linked Deque with
+    and without node pooling and on a block Deque, counting the garbage collections triggered along the way.
+    """
+    print(f"Deque churn ({n:,} push/pop pairs, {depth} items in flight)")
+    for engine, pool_size in (("linked", 0), ("linked", 1024), ("blocks", 0)):
+        deque = Deque(pool_size=pool_size, engine=engine)
+        for i in range(depth):
+            deque.add_rear(i)
+
+        collections = gc.get_stats()[0]["collections"]
+        start = time.perf_counter()
+        for i in range(n):
+            deque.add_rear(i)
+            deque.remove_front()
+        elapsed = time.perf_counter() - start
+        collections = gc.get_stats()[0]["collections"] - collections
+
+        if engine == "linked":
+            allocations = f"{deque.deque.nodes_reused:,} nodes reused"
+        else:
+            allocations = f"{deque.blocks_allocated:,} blocks allocated"
+        print(f"  {engine:<6} pool_size={pool_size:<5} {n / elapsed:12,.0f} pairs/s  {collections:6,} gen-0 collections  "
+              f"{allocations}")
+
+
+def bench_deque_engines(n: int = 200_000, lookups: int = 20_000, nodes: int = 200_000) -> None:
+    """
+    Compare the two Deque engines on indexing near both ends and on breadth-first search over a random graph.
+    """
+    print(f"Deque engines ({n:,} items, {lookups:,} lookups within 32 of either end)")
+    rng = random.Random(0)
+    indices = [rng.randrange(32) if rng.random() < 0.5 else n - 1 - rng.randrange(32) for _ in range(lookups)]
+    for engine in ("linked", "blocks"):
+        deque = Deque(range(n), engine=engine)
+        start = time.perf_counter()
+        for i in indices:
+            deque[i]
+        print(f"  {engine:<6} indexing {time.perf_counter() - start:7.3f}s")
+
+    graph = [Node(i) for i in range(nodes)]
+    for node in graph:
+        for _ in range(3):
+            node.adjacent_nodes.append(graph[rng.randrange(nodes)])
+
+    print(f"Breadth-first traversal over {nodes:,} nodes")
+    for engine in ("linked", "blocks"):
+        start = time.perf_counter()
+        queue = Deque([graph[0]], engine=engine)  # The loop of Graph.Search.search.bfs with a chosen engine
+        visited = {graph[0]}
+        while queue:
+            node = queue.remove_front()
+            for adjacent in node.adjacent_nodes:
+                if adjacent not in visited:
+                    queue.add_rear(adjacent)
+                    visited.add(adjacent)
+        print(f"  {engine:<6} {time.perf_counter() - start:7.3f}s  {len(visited):,} nodes visited")
+
+
+def bench_deque_rotate(n: int = 1_000_000, ticks: int = 10_000) -> None:
+    """
+    Compare rotating a large Deque one item at a time, as rotate did before, with rotate relinking the list or moving
+    blocks, for a round-robin tick (rotate(1)) and for a rotation by a third of the deque.
+    """
+    print(f"Deque rotate ({n:,} items)")
+    deque = Deque(range(n))
+    start = time.perf_counter()
+    for _ in range(n // 3):
+        deque.add_front(deque.remove_rear())
+    print(f"  {'item by item':<13} rotate(n // 3) {time.perf_counter() - start:9.5f}s")
+
+    for engine in ("linked", "blocks"):
+        deque = Deque(range(n), engine=engine)
+        start = time.perf_counter()
+        deque.rotate(n // 3)
+        third = time.perf_counter() - start
+
+        start = time.perf_counter()
+        for _ in range(ticks):
+            deque.rotate(1)
+        tick = (time.perf_counter() - start) / ticks
+        print(f"  {engine:<13} rotate(n // 3) {third:9.5f}s  rotate(1) {tick * 1e6:6.2f}us")
+
+
+def bench_indexed_access(n: int = 10_000, inserts: int = 2_000) -> None:
+    """
+    Compare indexed access that always walks from head with walking from the nearest end or the finger, for a scan over
+    range(len(lst)) and for inserts just before the tail.
+    """
+    print(f"Indexed access ({n:,} nodes)")
+    for cls in (HeadWalkList, DoublyLinkedList):
+        lst = cls(list(range(n)))
+
+        start = time.perf_counter()
+        for i in range(len(lst)):
+            lst[i] = lst[i] + 1
+        scan = time.perf_counter() - start
+
+        start = time.perf_counter()
+        for i in range(inserts):
+            lst.insert(len(lst) - 8, i)
+        insert = time.perf_counter() - start
+
+        print(f"  {cls.__name__:<17} index scan {scan:7.3f}s  {inserts:,} tail-side inserts {insert:7.3f}s")
+
+
+def bench_unrolled_memory(n: int = 1_000_000, lookups: int = 2_000) -> None:
+    """
+    Compare the memory per element of a DoublyLinkedList with an UnrolledLinkedList holding the same small ints, and the
+    time to iterate the list and to read items at random indices.
+    """
+    print(f"Memory per element ({n:,} small ints)")
+    indices = [(i * 7919) % n for i in range(lookups)]
+    for name, build in (("DoublyLinkedList", lambda: DoublyLinkedList(range(n))),
+                        ("UnrolledLinkedList", lambda: UnrolledLinkedList(range(n)))):
+        tracemalloc.start()
+        lst = build()
+        used = tracemalloc.get_traced_memory()[0]
+        tracemalloc.stop()
+
+        start = time.perf_counter()
+        for _ in lst:
+            pass
+        iterate = time.perf_counter() - start
+
+        start = time.perf_counter()
+        for i in indices:
+            lst[i]
+        lookup = time.perf_counter() - start
+
+        print(f"  {name:<18} {used / n:6.1f} bytes/element  iterate {iterate:6.3f}s  "
+              f"{lookups:,} random lookups {lookup:6.3f}s")
+        del lst
+
+
+def bench_shard_merge(shards: int = 1_000, per_shard: int = 100) -> None:
+    """
+    Compare merging per-shard lists into one list by appending each item with concatenating the lists in O(1).
+    """
+    print(f"Shard merge ({shards:,} shards of {per_shard} items)")
+    for name in ("append", "concat"):
+        parts = [DoublyLinkedList(range(per_shard)) for _ in range(shards)]
+        merged = DoublyLinkedList()
+
+        start = time.perf_counter()
+        if name == "append":
+            for part in parts:
+                for item in part:
+                    merged.append(item)
+        else:
+            for part in parts:
+                merged.concat(part)
+        elapsed = time.perf_counter() - start
+
+        print(f"  {name:<7} {shards / elapsed:14,.0f} merges/s  {len(merged):,} items")
+
+
+def bench_event_buffer(n: int = 5_000, scans: int = 1_000, width: int = 50) -> None:
+    """
+    Compare a time-indexed event buffer kept as a sorted DoublyLinkedList, walked from head for every insert and range
+    scan, with a SkipList, for events arriving slightly out of order.
+    """
+    print(f"Event buffer ({n:,} out-of-order inserts, {scans:,} range scans of {width} events)")
+    rng = random.Random(0)
+    times = [i + rng.random() * 100 for i in range(n)]
+    starts = [rng.random() * n for _ in range(scans)]
+
+    start = time.perf_counter()
+    events = DoublyLinkedList()
+    for t in times:
+        current = events.tail
+        while current is not None and current.data > t:  # Late events land near the tail
+            current = current.prev
+        if current is None:
+            events.prepend(t)
+        else:
+            events.insert_after(current, t)
+    insert = time.perf_counter() - start
+
+    start = time.perf_counter()
+    for low in starts:
+        current = events.head
+        while current is not None and current.data < low:
+            current = current.next
+        while current is not None and current.data < low + width:
+            current = current.next
+    scan = time.perf_counter() - start
+    print(f"  {'DoublyLinkedList':<16} inserts {insert:7.3f}s  range scans {scan:7.3f}s")
+
+    start = time.perf_counter()
+    skip_list = SkipList(seed=0, allow_duplicates=True)
+    for t in times:
+        skip_list.insert(t)
+    insert = time.perf_counter() - start
+
+    start = time.perf_counter()
+    for low in starts:
+        for _ in skip_list.range(low, low + width):
+            pass
+    scan = time.perf_counter() - start
+    print(f"  {'SkipList':<16} inserts {insert:7.3f}s  range scans {scan:7.3f}s")
+
+
+def bench_log_append(n: int = 5_000, sorted_n: int = 200_000) -> None:
+    """
+    Compare building an append-only log with add_at_tail when appending walks from head and when it uses the tail
+    pointer, then time sorting a shuffled list in place.
+    """
+    print(f"Singly linked log ({n:,} add_at_tail calls)")
+    for cls in (TailWalkList, SinglyLinkedList):
+        log = cls()
+        start = time.perf_counter()
+        for i in range(n):
+            log.add_at_tail(i)
+        print(f"  {cls.__name__:<18} {time.perf_counter() - start:7.3f}s")
+
+    values = list(range(sorted_n))
+    random.Random(0).shuffle(values)
+    log = SinglyLinkedList(values)
+    start = time.perf_counter()
+    log.sort()
+    print(f"  sort of {sorted_n:,} shuffled nodes {time.perf_counter() - start:7.3f}s")
+
+
+def bench_persistent_versions(n: int = 100_000, versions: int = 10_000, copies: int = 10) -> None:
+    """
+    Compare the memory of keeping versions of an n-element list by copying a SinglyLinkedList per version with sharing
+    nodes between versions of a PersistentLinkedList. Copying every version would take several GB, so the copy cost is
+    measured over a few copies and projected to the full number of versions.
+    """
+    print(f"Versions of a {n:,}-element list ({versions:,} versions)")
+
+    base = SinglyLinkedList(range(n))
+    tracemalloc.start()
+    history = []
+    for i in range(copies):
+        snapshot = SinglyLinkedList(base)
+        snapshot.add_at_head(i)
+        history.append(snapshot)
+    used = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del history
+    print(f"  {'copy per version':<22} {used / copies / 1e6:8.2f} MB/version  "
+          f"projected {used / copies * versions / 1e9:6.2f} GB")
+
+    base = PersistentLinkedList(range(n))
+    tracemalloc.start()
+    history = []
+    version = base
+    for i in range(versions):
+        version = version.add_at_head(i)
+        history.append(version)
+    used = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    print(f"  {'PersistentLinkedList':<22} {used / versions:8.0f} bytes/version  total {used / 1e6:6.2f} MB")
+
+
+def bench_sliding_window(n: int = 200_000, window: int = 500) -> None:
+    """
+    Compare rolling minimum and maximum computed by rescanning a bounded Deque on every sample with
+    SlidingWindowExtrema, pushing samples one at a time and, when NumPy is installed, as one array.
+
+    Rescanning costs O(window) per sample, so it is only timed over as many samples as keep it to about 10^8 reads.
+    """
+    print(f"Sliding window extrema ({n:,} samples, window {window:,})")
+    rng = random.Random(0)
+    samples = [rng.random() for _ in range(n)]
+
+    rescanned = min(n, 10 ** 8 // window)
+    recent = Deque(engine="blocks", maxlen=window)
+    start = time.perf_counter()
+    for sample in samples[:rescanned]:
+        recent.add_rear(sample)
+        min(recent), max(recent)
+    print(f"  {'rescan':<10} {rescanned / (time.perf_counter() - start):12,.0f} samples/s")
+
+    extrema = SlidingWindowExtrema(window)
+    start = time.perf_counter()
+    for sample in samples:
+        extrema.push(sample)
+    print(f"  {'push':<10} {n / (time.perf_counter() - start):12,.0f} samples/s")
+
+    if np is not None:
+        array = np.array(samples)
+        extrema = SlidingWindowExtrema(window)
+        start = time.perf_counter()
+        extrema.push_many(array)
+        print(f"  {'push_many':<10} {n / (time.perf_counter() - start):12,.0f} samples/s")
+
+
+def main() -> None:
+    bench_deque_churn()
+    bench_indexed_access()
+    bench_deque_engines()
+    bench_deque_rotate()
+    bench_unrolled_memory()
+    bench_shard_merge()
+    bench_event_buffer()
+    bench_log_append()
+    bench_persistent_versions()
+    bench_sliding_window()
+    bench_sliding_window(n=400_000, window=50_000)
+
+
+if __name__ == "__main__":
+    main()
@@ -9,6 +9,9 @@ setup(
     url='https://github.com/nicholasadamou/databricks',
     packages=find_packages(),
     install_requires=[],
+    extras_require={
+        'numpy': ['numpy'],
+    },
     classifiers=[
         'Programming Language :: Python :: 3',
         'License :: OSI Approved :: MIT License',